@@ -7,7 +7,7 @@ from gretel_client._hybrid.config import configure_hybrid_session
 from gretel_client.config import ClientConfig, configure_session
 from gretel_client.evaluation.quality_report import QualityReport
 from gretel_client.gretel.interface import Gretel
-from gretel_client.helpers import poll
+from gretel_client.helpers import poll, poll_many
 from gretel_client.projects.projects import (
     create_or_get_unique_project,
     create_project,
@@ -5,6 +5,7 @@ from gretel_client.cli.common import SessionContext, pass_session
 from gretel_client.cli.connections import connections
 from gretel_client.cli.errors import ExceptionHandler
 from gretel_client.cli.hybrid import hybrid
+from gretel_client.cli.index import index
 from gretel_client.cli.models import models
 from gretel_client.cli.projects import projects
 from gretel_client.cli.records import records
@@ -209,6 +210,7 @@ cli.add_command(artifacts)
 cli.add_command(connections)
 cli.add_command(workflows)
 cli.add_command(hybrid)
+cli.add_command(index)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,62 @@
+from dataclasses import asdict
+
+import click
+
+from gretel_client.cli.common import SessionContext, pass_session
+from gretel_client.projects.index import configure_metadata_index, get_metadata_index
+
+
+@click.group(help="Commands for working with the local metadata index.")
+def index(): ...
+
+
+def _get_index(sc: SessionContext):
+    metadata_index = get_metadata_index()
+    if not metadata_index:
+        sc.log.warning(
+            "The metadata index is disabled, lookups won't use it until "
+            "GRETEL_METADATA_INDEX is set to 'enabled'."
+        )
+        metadata_index = configure_metadata_index(enabled=True)
+    return metadata_index
+
+
+@index.command(help="Sync the local metadata index with Gretel Cloud.")
+@click.option(
+    "--project",
+    "projects",
+    metavar="NAME",
+    multiple=True,
+    help="Only sync models of this project. May be passed multiple times.",
+)
+@click.option(
+    "--full",
+    is_flag=True,
+    default=False,
+    help="Re-fetch every model instead of only the ones modified since the last sync.",
+)
+@click.option(
+    "--record-handlers",
+    is_flag=True,
+    default=False,
+    help="Also sync the record handlers of modified models.",
+)
+@pass_session
+def sync(sc: SessionContext, projects: tuple, full: bool, record_handlers: bool):
+    metadata_index = _get_index(sc)
+    sc.log.info(f"Syncing the metadata index at {metadata_index.path}.")
+    result = metadata_index.sync(
+        sc.session,
+        list(projects) or None,
+        full=full,
+        include_record_handlers=record_handlers,
+    )
+    sc.print(data=asdict(result))
+
+
+@index.command(help="Remove every entry from the local metadata index.")
+@pass_session
+def clear(sc: SessionContext):
+    metadata_index = _get_index(sc)
+    metadata_index.clear()
+    sc.log.info(f"Cleared the metadata index at {metadata_index.path}.")
@@ -16,6 +16,7 @@ from gretel_client.cli.common import (
 )
 from gretel_client.cli.utils.parser_utils import ref_data_factory
 from gretel_client.models.config import GPU, get_model_type_config
+from gretel_client.pagination import DEFAULT_PAGE_SIZE
 from gretel_client.projects.common import WAIT_UNTIL_DONE, ModelArtifact
 from gretel_client.projects.jobs import Status
 from gretel_client.projects.models import Model, RunnerMode
@@ -269,7 +270,12 @@ def get(sc: SessionContext, project: str, model_id: dict, output: str):
 
 @models.command(help="Search for models of the project.")
 @project_option
-@click.option("--limit", help="Limit the number of projects.", default=100, type=int)
+@click.option(
+    "--limit",
+    help="Limit the number of models. Use 0 to return every model.",
+    default=100,
+    type=int,
+)
 @click.option("--model-name", help="Model name to match on.", default="")
 @click.option(
     "--skip",
@@ -289,6 +295,12 @@ def get(sc: SessionContext, project: str, model_id: dict, output: str):
     default=None,
 )
 @click.option("--status", help="Filter to models with specific status.", default=None)
+@click.option(
+    "--page-size",
+    help="Number of models to fetch per request.",
+    default=DEFAULT_PAGE_SIZE,
+    type=click.IntRange(min=1),
+)
 @pass_session
 def search(
     sc: SessionContext,
@@ -299,17 +311,19 @@ def search(
     sort_by: Optional[str],
     sort_field: Optional[str],
     status: Optional[str],
+    page_size: int,
 ):
     sc.print(
         data=list(
             sc.project.search_models(
                 factory=dict,
-                limit=limit,
+                limit=limit or None,
                 model_name=model_name,
                 skip=skip,
                 sort_by=sort_by,
                 sort_field=sort_field,
                 status=status,
+                page_size=page_size,
             )
         )
     )
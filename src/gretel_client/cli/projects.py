@@ -144,11 +144,23 @@ def create(
 
 
 @projects.command(help="Search for projects.")
-@click.option("--limit", help="Limit the number of projects.", default=200)
+@click.option(
+    "--limit",
+    help="Limit the number of projects. Use 0 to return every project.",
+    default=200,
+)
 @click.option("--query", help="Filter project names by a query string.", default=None)
+@click.option(
+    "--page-size",
+    help="Number of projects to fetch per request. Defaults to --limit.",
+    default=None,
+    type=click.IntRange(min=1),
+)
 @pass_session
-def search(sc: SessionContext, limit: int, query: str):
-    project_objs = search_projects(limit=limit, query=query, session=sc.session)
+def search(sc: SessionContext, limit: int, query: str, page_size: Optional[int]):
+    project_objs = search_projects(
+        limit=limit or None, query=query, page_size=page_size, session=sc.session
+    )
     projects_table = [p.as_dict for p in project_objs]
     sc.print(data=projects_table)
 
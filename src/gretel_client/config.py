@@ -23,6 +23,7 @@ from urllib3.util import Retry
 
 from gretel_client._api.api_client import ApiClient as V2ApiClient
 from gretel_client._api.configuration import Configuration as V2Configuration
+from gretel_client.polling import PollPolicy
 from gretel_client.rest.api.projects_api import ProjectsApi
 from gretel_client.rest.api.users_api import UsersApi
 from gretel_client.rest.api_client import ApiClient
@@ -71,6 +72,9 @@ GRETEL_TENANT_NAME = "GRETEL_TENANT_NAME"
 GRETEL_TENANT_UNSET = "none"
 """Value to indicate that a tenant name should be unset"""
 
+GRETEL_CACHE_DIR = "GRETEL_CACHE_DIR"
+"""Env variable name to override the default local cache directory"""
+
 GRETEL_ENVS = [GRETEL_API_KEY, GRETEL_PROJECT, GRETEL_TENANT_NAME]
 
 CLIENT_METRICS_HEADER_KEY = "X-Gretel-Client-Metrics"
@@ -127,6 +131,32 @@ def _metrics_headers(context: Optional[Context] = None) -> dict[str, str]:
     return {CLIENT_METRICS_HEADER_KEY: quote_plus(stringified)}
 
 
+# Query params the API accepts that aren't part of the OpenAPI spec the
+# clients in ``gretel_client.rest`` are generated from. They are registered
+# on the endpoints of each api instance handed out by ``get_api``, so that
+# regenerating the client doesn't drop them.
+_EXTRA_QUERY_PARAMS: dict[type, dict[str, dict[str, tuple]]] = {
+    ProjectsApi: {
+        "get_model": {"logs_offset": (int,)},
+        "get_record_handler": {"logs_offset": (int,)},
+        "search_projects": {"skip": (int,)},
+    },
+}
+
+
+def _add_extra_query_params(api: object) -> None:
+    for api_interface, endpoints in _EXTRA_QUERY_PARAMS.items():
+        if not isinstance(api, api_interface):
+            continue
+        for endpoint_name, params in endpoints.items():
+            endpoint = getattr(api, endpoint_name)
+            for name, openapi_type in params.items():
+                endpoint.params_map["all"].append(name)
+                endpoint.openapi_types[name] = openapi_type
+                endpoint.attribute_map[name] = name
+                endpoint.location_map[name] = "query"
+
+
 class PreviewFeatures(Enum):
     """Manage preview feature configurations"""
 
@@ -308,6 +338,12 @@ class ClientConfig(ABC):
     @abstractmethod
     def tenant_name(self) -> Optional[str]: ...
 
+    @property
+    def poll_policy(self) -> Optional[PollPolicy]:
+        """Policy used by every polling loop of the client. If ``None``, each
+        loop uses a default policy suited to the endpoint it polls."""
+        return None
+
     @cached_property
     def email(self) -> str:
         return self.get_api(UsersApi).users_me()["data"]["me"]["email"]
@@ -382,11 +418,13 @@ class ClientConfig(ABC):
                 attempts. A base factor of 2 will applied to this value
                 to determine the time between attempts.
         """
-        return api_interface(
+        api = api_interface(
             self._get_api_client(
                 max_retry_attempts, backoff_factor, default_headers=default_headers
             )
         )
+        _add_extra_query_params(api)
+        return api
 
     def get_v1_api(
         self,
@@ -467,6 +505,7 @@ class DefaultClientConfig(ClientConfig):
         default_runner: Optional[Union[str, RunnerMode]] = None,
         preview_features: Optional[str] = None,
         tenant_name: Optional[str] = None,
+        poll_policy: Optional[PollPolicy] = None,
     ):
         self.endpoint = (
             endpoint or os.getenv(GRETEL_ENDPOINT) or DEFAULT_GRETEL_ENDPOINT
@@ -487,6 +526,7 @@ class DefaultClientConfig(ClientConfig):
             or PreviewFeatures.DISABLED.value
         )
         self.tenant_name = tenant_name or os.getenv(GRETEL_TENANT_NAME)
+        self._poll_policy = poll_policy
         self._validate()
 
     def _validate(self) -> None:
@@ -512,6 +552,10 @@ class DefaultClientConfig(ClientConfig):
     def context(self) -> Context:
         return Context.empty()
 
+    @property
+    def poll_policy(self) -> Optional[PollPolicy]:
+        return self._poll_policy
+
     def _cert_file(self) -> str:
         ssl_cert_file = os.getenv("SSL_CERT_FILE")
         requests_ca_bundle = os.getenv("REQUESTS_CA_BUNDLE")
@@ -663,6 +707,10 @@ class DelegatingClientConfig(ClientConfig):
     def tenant_name(self) -> str:
         return self._delegate.tenant_name
 
+    @property
+    def poll_policy(self) -> Optional[PollPolicy]:
+        return self._delegate.poll_policy
+
     def _get_api_client_generic(
         self,
         client_cls: Type[ClientT],
@@ -786,6 +834,21 @@ def _get_config_path() -> Path:
     return _DEFAULT_CONFIG_PATH
 
 
+_DEFAULT_CACHE_DIR = Path().home() / f".{GRETEL}" / "cache"  # noqa
+
+
+def get_cache_dir() -> Path:
+    """Returns the directory the client uses for local caches.
+
+    This defaults to ``$HOME/.gretel/cache`` and can be overridden with the
+    ``GRETEL_CACHE_DIR`` environment variable.
+    """
+    from_env = os.getenv(GRETEL_CACHE_DIR)
+    if from_env:
+        return Path(from_env)
+    return _DEFAULT_CACHE_DIR
+
+
 def clear_gretel_config():
     """Removes any Gretel configuration files from the host file system.
 
@@ -899,6 +962,7 @@ def configure_session(
     validate: bool = True,
     tenant_name: Optional[str] = None,
     clear: bool = False,
+    poll_policy: Optional[PollPolicy] = None,
 ):
     """Updates client config for the session
 
@@ -922,6 +986,9 @@ def configure_session(
         tenant_name: Specifies the Gretel Enterprise tenant name.
         clear: If set to ``True`` any existing Gretel credentials will be
             removed from the host.
+        poll_policy: Controls how often the client polls the Gretel API while
+            waiting on jobs. See ``gretel_client.polling`` for the available
+            policies.
 
     Raises:
         ``GretelClientConfigurationError`` if `validate=True` and credentials
@@ -959,6 +1026,7 @@ def configure_session(
             default_runner=default_runner,
             default_project_name=config.default_project_name,
             tenant_name=tenant_name,
+            poll_policy=poll_policy or config.poll_policy,
         )
 
     if cache == "yes":
@@ -1,2 +1,3 @@
+from gretel_client.data_designer.batch import BatchVariant
 from gretel_client.data_designer.data_designer import DataDesigner
 from gretel_client.data_designer.factory import DataDesignerFactory
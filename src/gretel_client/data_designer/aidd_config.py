@@ -1,4 +1,6 @@
+import functools
 import json
+import os
 
 from pathlib import Path
 from typing import Any
@@ -13,10 +15,21 @@ from gretel_client.data_designer.types import (
     ModelSuite,
     SeedDataset,
 )
+from gretel_client.data_designer.utils import (
+    clear_remote_config_cache,
+    fetch_config_if_remote,
+    make_date_obj_serializable,
+)
+from gretel_client.gretel.config_setup import smart_load_yaml
 from gretel_client.workflows.configs.base import ConfigBase
 from gretel_client.workflows.configs.tasks import ColumnConstraint, PersonSamplerParams
 from gretel_client.workflows.configs.workflows import ModelConfig
 
+AIDD_CONFIG_CACHE_SIZE = 64
+"""Maximum number of validated configs memoized by `load_aidd_config`."""
+
+_YAML_DUMPER = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+
 
 class AIDDConfig(ConfigBase):
     """Configuration for an AIDD workflow."""
@@ -37,6 +50,7 @@ class AIDDConfig(ConfigBase):
         self, path: str | Path | None = None, *, indent: int | None = 2, **kwargs
     ) -> str | None:
         """Convert the AIDD config to a YAML string or file."""
+        kwargs.setdefault("Dumper", _YAML_DUMPER)
         yaml_str = yaml.dump(self.to_dict(), indent=indent, **kwargs)
         if path is None:
             return yaml_str
@@ -52,3 +66,41 @@ class AIDDConfig(ConfigBase):
             return json_str
         with open(path, "w") as f:
             f.write(json_str)
+
+
+def load_aidd_config(config: dict | str | Path) -> AIDDConfig:
+    """Load and validate an AIDD config.
+
+    Validated configs are memoized by their content, so loading the same
+    config again only costs reading it, plus a copy of the validated config.
+    Remote configs are fetched once per process, see `fetch_config_if_remote`.
+
+    Args:
+        config: Config as a dict, a YAML or JSON string, a path to a YAML or
+            JSON file, or the URL of a remote config.
+
+    Returns:
+        The validated config. Each call returns a new copy that is safe to modify.
+    """
+    config = fetch_config_if_remote(config)
+    if isinstance(config, dict):
+        source = json.dumps(make_date_obj_serializable(config), sort_keys=True)
+    elif isinstance(config, Path) or (
+        isinstance(config, str) and os.path.isfile(config)
+    ):
+        source = Path(config).read_text()
+    else:
+        source = config
+    return _validate_aidd_config(source).model_copy(deep=True)
+
+
+@functools.lru_cache(maxsize=AIDD_CONFIG_CACHE_SIZE)
+def _validate_aidd_config(source: str) -> AIDDConfig:
+    json_config = make_date_obj_serializable(smart_load_yaml(source))
+    return AIDDConfig.model_validate(json_config)
+
+
+def clear_config_cache() -> None:
+    """Clear the memoized configs of `load_aidd_config` and the cached remote configs."""
+    _validate_aidd_config.cache_clear()
+    clear_remote_config_cache()
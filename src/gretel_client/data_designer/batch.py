@@ -0,0 +1,204 @@
+from __future__ import annotations
+
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Iterator, Sequence
+
+import pandas as pd
+
+from typing_extensions import Self
+
+from gretel_client.data_designer.log import get_logger
+from gretel_client.data_designer.types import ModelSuite
+from gretel_client.files.interface import File
+from gretel_client.polling import (
+    AdaptivePollPolicy,
+    Clock,
+    PollPolicy,
+    resolve_poll_policy,
+)
+from gretel_client.workflows.configs.workflows import ModelConfig
+from gretel_client.workflows.logs import WaitTimeExceeded
+from gretel_client.workflows.status import TERMINAL_STATES, Status
+from gretel_client.workflows.workflow import WorkflowRun
+
+logger = get_logger(__name__)
+
+DEFAULT_BATCH_WORKERS = 4
+"""Maximum number of workflow runs submitted or polled at the same time."""
+
+DEFAULT_BATCH_POLL_POLICY = AdaptivePollPolicy(initial=5, maximum=30)
+"""Poll policy of batches whose session doesn't configure one."""
+
+MAX_BATCH_POLL_ERRORS = 5
+"""Number of status checks of a run in a row that may fail before the run
+is no longer tracked."""
+
+
+@dataclass
+class BatchVariant:
+    """A variation of a Data Designer configuration to create a dataset from.
+
+    Fields that are left as `None` are taken from the Data Designer that
+    creates the batch.
+
+    Args:
+        num_records: Number of records to generate.
+        model_suite: Model suite to generate the dataset with.
+        model_configs: Configurations of the LLMs in the model suite.
+        seed_dataset: Seed dataset as a DataFrame, Path, file ID or File
+            object. The same dataset is only uploaded once per batch.
+        run_name: Name of the workflow run.
+    """
+
+    num_records: int
+    model_suite: ModelSuite | None = None
+    model_configs: list[ModelConfig] | None = None
+    seed_dataset: pd.DataFrame | Path | str | File | None = None
+    run_name: str | None = None
+
+
+@dataclass
+class BatchRun:
+    """The workflow run created for a single variant of a batch."""
+
+    variant: BatchVariant
+    workflow_run: WorkflowRun | None = None
+    error: Exception | None = None
+    """The error raised while submitting the workflow run, if any."""
+    status: str | None = None
+    """The last known status of the workflow run."""
+    poll_error: Exception | None = None
+    """The error raised by the last status check, if it failed."""
+    num_poll_errors: int = 0
+    """Number of status checks in a row that failed."""
+
+    @property
+    def done(self) -> bool:
+        return (
+            self.error is not None
+            or self.status in TERMINAL_STATES
+            or self.num_poll_errors >= MAX_BATCH_POLL_ERRORS
+        )
+
+    @property
+    def succeeded(self) -> bool:
+        return self.status == Status.RUN_STATUS_COMPLETED.value
+
+
+class BatchRuns(Sequence[BatchRun]):
+    """The workflow runs of a batch, in the order of their variants.
+
+    The status of all runs is tracked by a single polling loop, rather than
+    by one loop per run.
+    """
+
+    def __init__(self, runs: list[BatchRun], max_workers: int = DEFAULT_BATCH_WORKERS):
+        self._runs = runs
+        self._max_workers = max_workers
+
+    def __getitem__(self, index):
+        return self._runs[index]
+
+    def __len__(self) -> int:
+        return len(self._runs)
+
+    def __iter__(self) -> Iterator[BatchRun]:
+        return iter(self._runs)
+
+    @property
+    def workflow_runs(self) -> list[WorkflowRun]:
+        """The workflow runs that were submitted successfully."""
+        return [run.workflow_run for run in self._runs if run.workflow_run]
+
+    @property
+    def done(self) -> bool:
+        return all(run.done for run in self._runs)
+
+    def refresh(self) -> list[BatchRun]:
+        """Fetch the status of every run that has not finished yet.
+
+        A failed status check is recorded on its run, so it doesn't stop the
+        other runs from being tracked. A run whose status can't be fetched
+        `MAX_BATCH_POLL_ERRORS` times in a row is no longer tracked.
+
+        Returns:
+            The runs whose status changed.
+        """
+        pending = [run for run in self._runs if not run.done]
+        if not pending:
+            return []
+
+        def fetch_status(run: BatchRun) -> Status | Exception:
+            try:
+                return run.workflow_run.fetch_status()
+            except Exception as exc:
+                return exc
+
+        with ThreadPoolExecutor(max_workers=self._max_workers) as executor:
+            statuses = list(executor.map(fetch_status, pending))
+
+        changed = []
+        for run, status in zip(pending, statuses):
+            if isinstance(status, Exception):
+                run.poll_error = status
+                run.num_poll_errors += 1
+                logger.warning(
+                    f"⚠️ Could not fetch the status of workflow run "
+                    f"{run.workflow_run.id} ({run.num_poll_errors}/"
+                    f"{MAX_BATCH_POLL_ERRORS}): {status}"
+                )
+                continue
+            run.poll_error = None
+            run.num_poll_errors = 0
+            if run.status != status.value:
+                run.status = status.value
+                changed.append(run)
+        return changed
+
+    def wait_until_done(
+        self,
+        wait: int = -1,
+        poll_policy: PollPolicy | None = None,
+        clock: Clock | None = None,
+    ) -> Self:
+        """Block until every run of the batch has finished.
+
+        Args:
+            wait: Maximum time to wait in seconds. -1 means wait indefinitely.
+            poll_policy: Policy for the time between two polls of the batch.
+                Defaults to the policy configured for the session of the runs.
+            clock: Clock used to measure and wait. Defaults to the system clock.
+
+        Returns:
+            The batch runs.
+
+        Raises:
+            WaitTimeExceeded: If the runs haven't finished after `wait` seconds.
+        """
+        workflow_runs = self.workflow_runs
+        poll_policy = poll_policy or resolve_poll_policy(
+            workflow_runs[0].session if workflow_runs else None,
+            DEFAULT_BATCH_POLL_POLICY,
+        )
+        poller = poll_policy.poller(wait, clock)
+        while True:
+            changed = self.refresh()
+            for run in changed:
+                logger.info(
+                    f"🔄 Workflow run {run.workflow_run.id}: "
+                    f"{Status(run.status).name.removeprefix('RUN_STATUS_').lower()}"
+                )
+            if self.done or poller.expired:
+                break
+            if changed:
+                poller.record_activity()
+            poller.sleep()
+
+        if wait > 0 and not self.done:
+            raise WaitTimeExceeded()
+
+        num_completed = sum(run.succeeded for run in self._runs)
+        logger.info(f"🏁 {num_completed} of {len(self._runs)} workflow runs completed")
+        return self
@@ -1,10 +1,45 @@
 import logging
 
+from dataclasses import dataclass, field
+
 import networkx as nx
 
 from gretel_client.data_designer.types import DAGColumnT
 
 
+@dataclass
+class ExecutionPlan:
+    """Plan for generating DAG columns in levels of independent columns.
+
+    The columns of a level only depend on columns of earlier levels, so the
+    generation steps of a level can run concurrently.
+
+    Args:
+        levels: Column names grouped into levels, in execution order.
+        critical_path: Longest chain of dependent columns. Its length bounds
+            the number of steps that have to run one after another.
+    """
+
+    levels: list[list[str]] = field(default_factory=list)
+    critical_path: list[str] = field(default_factory=list)
+
+    @property
+    def num_columns(self) -> int:
+        """Number of columns in the plan."""
+        return sum(len(level) for level in self.levels)
+
+    @property
+    def depth(self) -> int:
+        """Number of levels, i.e. steps that run one after another."""
+        return len(self.levels)
+
+    @property
+    def expected_speedup(self) -> float:
+        """Expected speedup over generating one column at a time, assuming
+        all generation steps take the same time."""
+        return self.num_columns / self.depth if self.depth else 1.0
+
+
 def topologically_sort_columns(
     columns: list[DAGColumnT], *, logger: logging.Logger | None = None
 ) -> list[str]:
@@ -17,16 +52,51 @@ def topologically_sort_columns(
     Returns:
         List of column names sorted in topological order.
     """
+    return list(nx.topological_sort(_build_dag(columns, logger=logger)))
+
 
+def plan_column_levels(
+    columns: list[DAGColumnT], *, logger: logging.Logger | None = None
+) -> ExecutionPlan:
+    """Group the columns into levels of columns that don't depend on each other.
+
+    Each column is placed in the earliest level after all of its dependencies.
+
+    Args:
+        columns: List of AIDD column objects to plan.
+        logger: Optional logger to use for logging.
+
+    Returns:
+        Execution plan of the columns.
+    """
+    dag = _build_dag(columns, logger=logger)
+    # Order the columns of each level as in the topological sort, so plans
+    # are stable for a given configuration.
+    order = {name: i for i, name in enumerate(nx.topological_sort(dag))}
+    levels = [
+        sorted(level, key=order.__getitem__)
+        for level in nx.topological_generations(dag)
+    ]
+    return ExecutionPlan(levels=levels, critical_path=nx.dag_longest_path(dag))
+
+
+def _build_dag(
+    columns: list[DAGColumnT], *, logger: logging.Logger | None = None
+) -> nx.DiGraph:
     _validate_dag_columns(columns)
 
     dag = nx.DiGraph()
-    dag_column_names = [col.name for col in columns]
+    dag_column_names = {col.name for col in columns}
 
     if logger is not None and len(dag_column_names) > 1:
         logger.info("⛓️ Representing generation steps as a Directed Acyclic Graph")
 
-    side_effect_dict = {c.name: list(c.side_effect_columns) for c in columns}
+    # Map each side effect column to the first column that produces it, so
+    # that every dependency is resolved with constant time lookups.
+    side_effect_parents: dict[str, str] = {}
+    for col in columns:
+        for side_effect in col.side_effect_columns:
+            side_effect_parents.setdefault(side_effect, col.name)
 
     for col in columns:
         dag.add_node(col.name)
@@ -38,15 +108,13 @@ def topologically_sort_columns(
 
             # If the required column is a side effect of another column,
             # add an edge from the parent column to the current column.
-            elif req_col_name in sum(side_effect_dict.values(), []):
-                for parent, cols in side_effect_dict.items():
-                    if req_col_name in cols:
-                        if logger is not None:
-                            logger.info(
-                                f"  |-- 🔗 `{col.name}` depends on `{parent}` via `{req_col_name}`"
-                            )
-                        dag.add_edge(parent, col.name)
-                        break
+            elif req_col_name in side_effect_parents:
+                parent = side_effect_parents[req_col_name]
+                if logger is not None:
+                    logger.info(
+                        f"  |-- 🔗 `{col.name}` depends on `{parent}` via `{req_col_name}`"
+                    )
+                dag.add_edge(parent, col.name)
 
     if not nx.is_directed_acyclic_graph(dag):
         raise ValueError(
@@ -55,9 +123,7 @@ def topologically_sort_columns(
             "circular references."
         )
 
-    sorted_column_names = list(nx.topological_sort(dag))
-
-    return sorted_column_names
+    return dag
 
 
 def _validate_dag_columns(columns: list[DAGColumnT]) -> None:
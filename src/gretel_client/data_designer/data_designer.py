@@ -4,6 +4,7 @@ from __future__ import annotations
 import json
 import logging
 
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Type
 
@@ -15,7 +16,13 @@ from pygments.formatters import HtmlFormatter
 from pygments.lexers import PythonLexer
 from typing_extensions import Self
 
-from gretel_client.data_designer.aidd_config import AIDDConfig
+from gretel_client.data_designer.aidd_config import AIDDConfig, load_aidd_config
+from gretel_client.data_designer.batch import (
+    DEFAULT_BATCH_WORKERS,
+    BatchRun,
+    BatchRuns,
+    BatchVariant,
+)
 from gretel_client.data_designer.constants import (
     DEFAULT_REPR_HTML_STYLE,
     MODEL_DUMP_KWARGS,
@@ -23,12 +30,17 @@ from gretel_client.data_designer.constants import (
     REPR_HTML_TEMPLATE,
     REPR_LIST_LENGTH_USE_JSON,
 )
-from gretel_client.data_designer.dag import topologically_sort_columns
+from gretel_client.data_designer.dag import (
+    ExecutionPlan,
+    plan_column_levels,
+    topologically_sort_columns,
+)
 from gretel_client.data_designer.exceptions import DataDesignerValidationError
 from gretel_client.data_designer.info import AIDDInfo
 from gretel_client.data_designer.log import get_logger
 from gretel_client.data_designer.magic_data_designer import MagicDataDesignerEditor
-from gretel_client.data_designer.preview import PreviewResults
+from gretel_client.data_designer.preview import PreviewCache, PreviewResults
+from gretel_client.data_designer.sampler_engine import SamplerEngine
 from gretel_client.data_designer.types import (
     AIDDColumnT,
     CodeValidationColumn,
@@ -52,11 +64,10 @@ from gretel_client.data_designer.types import (
 from gretel_client.data_designer.utils import (
     CallbackOnMutateDict,
     camel_to_kebab,
-    fetch_config_if_remote,
     get_sampler_params,
     get_task_log_emoji,
-    make_date_obj_serializable,
     smart_load_dataframe,
+    to_kebab,
 )
 from gretel_client.data_designer.validate import (
     Violation,
@@ -66,13 +77,13 @@ from gretel_client.data_designer.validate import (
 )
 from gretel_client.data_designer.viz_tools import AIDDMetadata
 from gretel_client.files.interface import File
-from gretel_client.gretel.config_setup import smart_load_yaml
 from gretel_client.navigator_client_protocols import GretelResourceProviderProtocol
 from gretel_client.workflows.builder import (
     Message,
     WorkflowBuilder,
     WorkflowInterruption,
     WorkflowValidationError,
+    validate_workflows,
 )
 from gretel_client.workflows.configs.registry import Registry
 from gretel_client.workflows.configs.tasks import (
@@ -148,10 +159,7 @@ class DataDesigner:
         gretel_resource_provider: GretelResourceProviderProtocol,
         config: dict | str | Path,
     ) -> Self:
-        json_config = make_date_obj_serializable(
-            smart_load_yaml(fetch_config_if_remote(config))
-        )
-        valid_config: AIDDConfig = AIDDConfig.model_validate(json_config)
+        valid_config = load_aidd_config(config)
         columns = {}
         for col in valid_config.columns:
             if isinstance(col, LLMGenColumn):
@@ -198,6 +206,7 @@ class DataDesigner:
         self._repr_html_style = DEFAULT_REPR_HTML_STYLE
         self._latent_person_columns: dict[str, PersonSamplerParams] = {}
         self._constraints = constraints or []
+        self._preview_cache = PreviewCache()
         self._aidd_info = AIDDInfo(
             model_suite=model_suite, workflow_manager=self._workflow_manager
         )
@@ -426,7 +435,11 @@ class DataDesigner:
         return self
 
     def preview(
-        self, verbose_logging: bool = False, validate: bool = True
+        self,
+        verbose_logging: bool = False,
+        validate: bool = True,
+        parallel: bool = False,
+        incremental: bool = False,
     ) -> PreviewResults:
         """Generate a preview of the dataset.
 
@@ -434,12 +447,23 @@ class DataDesigner:
         This is a quick way to check that the configuration is working as expected
         before generating a larger dataset.
 
+        The dataset produced by each step of a preview is cached. With
+        `incremental=True`, the preview starts from the output of the last
+        cached step that is unchanged since a previous preview, so only the
+        steps that changed and the steps downstream of them are executed.
+        For example, after editing the prompt of the last LLM column, only
+        that column is regenerated.
+
         Args:
             verbose_logging: Whether to enable verbose logging.
             validate: If True, run semantic validation on the configuration before
                 generating a preview. This is recommended to catch issues like invalid
                 references in prompt templates, which otherwise would only be caught
                 during at runtime.
+            parallel: If True, generate columns that don't depend on each other
+                in concurrent workflow steps. See `dry_run` for the expected speedup.
+            incremental: If True, reuse the cached outputs of unchanged steps
+                from previous previews instead of executing them again.
 
         Returns:
             Preview results object.
@@ -447,11 +471,41 @@ class DataDesigner:
         if validate:
             self._run_semantic_validation(raise_exceptions=True)
         logger.info("🚀 Generating preview")
-        workflow = self._build_workflow(verbose_logging=verbose_logging, streaming=True)
+        workflow = self._build_workflow(
+            verbose_logging=verbose_logging, streaming=True, parallel=parallel
+        )
+        fingerprints = workflow.step_fingerprints()
 
+        resume_index = (
+            self._find_preview_resume_index(workflow, fingerprints)
+            if incremental
+            else None
+        )
+        if resume_index is not None:
+            resume_step = workflow.get_steps()[resume_index]
+            logger.info(
+                f"♻️ Reusing cached outputs of {resume_index + 1} of "
+                f"{len(workflow.step_names)} steps"
+            )
+            if resume_index == len(workflow.step_names) - 1:
+                cached_output = self._preview_cache.get(fingerprints[resume_step.name])
+                logger.info("🎉 Your dataset preview is ready!")
+                return PreviewResults(
+                    output=cached_output, aidd_metadata=AIDDMetadata.from_aidd(self)
+                )
+            workflow = self._resume_preview_workflow(
+                workflow, resume_index, fingerprints[resume_step.name]
+            )
+
+        datasets_by_step: dict[str, pd.DataFrame] = {}
         preview = self._capture_preview_result(
-            workflow, verbose_logging=verbose_logging
+            workflow,
+            verbose_logging=verbose_logging,
+            datasets_by_step=datasets_by_step,
         )
+        for step_name, dataset in datasets_by_step.items():
+            if step_name in fingerprints:
+                self._preview_cache.put(fingerprints[step_name], dataset)
         if preview.dataset is not None and preview.success:
             logger.info("🎉 Your dataset preview is ready!")
         else:
@@ -467,6 +521,59 @@ class DataDesigner:
         #     )
         return preview
 
+    def clear_preview_cache(self) -> Self:
+        """Clear the cached step outputs of previous previews."""
+        self._preview_cache.clear()
+        return self
+
+    def preview_samplers(
+        self,
+        num_records: int = NUM_PREVIEW_RECORDS,
+        *,
+        seed: int | None = None,
+    ) -> PreviewResults:
+        """Generate a preview of the sampler columns locally.
+
+        Unlike `preview`, no workflow is submitted. The sampler columns, their
+        conditional parameters and the constraints are executed by a local,
+        vectorized engine, which makes it cheap to iterate on distributions
+        or to preview a large number of records. Seed dataset, LLM, judge,
+        validation and expression columns are not part of the local preview.
+
+        Args:
+            num_records: Number of records to generate.
+            seed: Seed of the random number generator, for reproducible previews.
+
+        Returns:
+            Preview results object.
+        """
+        if len(self.sampler_columns) == 0:
+            raise ValueError(
+                "🛑 Local previews require at least one column that is generated "
+                "using a non-LLM sampler."
+            )
+        skipped_columns = [
+            c.name for c in self.seed_columns + self._dag_columns if not c.drop
+        ]
+        if skipped_columns:
+            logger.info(
+                f"🎲 Previewing sampler columns only, skipping {len(skipped_columns)} "
+                f"column{'s' if len(skipped_columns) != 1 else ''} that require the "
+                "Gretel service."
+            )
+
+        df = SamplerEngine(self.sampler_columns, self._constraints, seed=seed).sample(
+            num_records
+        )
+        df = df.drop(
+            columns=[
+                name
+                for name in list(self._latent_person_columns) + self._drop_columns
+                if name in df.columns
+            ]
+        )
+        return PreviewResults(output=df, aidd_metadata=AIDDMetadata.from_aidd(self))
+
     def create(
         self,
         *,
@@ -475,6 +582,7 @@ class DataDesigner:
         run_name: str | None = None,
         new_workflow: bool = False,
         wait_until_done: bool = False,
+        parallel: bool = False,
     ) -> WorkflowRun:
         """Create a new dataset based on the current Data Designer configuration.
 
@@ -491,12 +599,14 @@ class DataDesigner:
             new_workflow: If True, create a new workflow instead of using existing
             wait_until_done: Block until the workflow has completed running.
                 If False, immediately returns the WorkflowRun object.
+            parallel: If True, generate columns that don't depend on each other
+                in concurrent workflow steps. See `dry_run` for the expected speedup.
 
         Returns:
             WorkflowRun object.
         """
         logger.info("🚀 Submitting batch workflow")
-        workflow = self._build_workflow(num_records=num_records)
+        workflow = self._build_workflow(num_records=num_records, parallel=parallel)
 
         # if a workflow with the same name has been created for
         # the session, reuse that workflow.
@@ -512,6 +622,133 @@ class DataDesigner:
             wait_until_done=wait_until_done,
         )
 
+    @handle_workflow_validation_error
+    def create_batch(
+        self,
+        variants: list[BatchVariant],
+        *,
+        name: str | None = None,
+        max_workers: int = DEFAULT_BATCH_WORKERS,
+        wait_until_done: bool = False,
+        parallel: bool = False,
+    ) -> BatchRuns:
+        """Create one dataset for each variant of the current Data Designer configuration.
+
+        Each seed dataset is uploaded once, no matter how many variants use it,
+        and the steps the variants have in common are validated once. All
+        workflows are validated before the first one is submitted, so an
+        invalid variant doesn't leave a partially submitted batch behind. The
+        runs are submitted concurrently to the same workflow and, if
+        `wait_until_done` is set, tracked by a single status poller.
+
+        Example::
+
+            runs = aidd.create_batch(
+                [
+                    BatchVariant(num_records=1_000, run_name="apache"),
+                    BatchVariant(
+                        num_records=1_000,
+                        model_suite=ModelSuite.LLAMA_3_x,
+                        run_name="llama",
+                    ),
+                ],
+                wait_until_done=True,
+            )
+
+        Args:
+            variants: The variants to create datasets for.
+            name: Name of the workflow.
+            max_workers: Maximum number of workflow runs that are submitted
+                at the same time.
+            wait_until_done: Block until all workflow runs have completed.
+            parallel: If True, generate columns that don't depend on each other
+                in concurrent workflow steps.
+
+        Returns:
+            The workflow runs of the batch, in the order of the variants. A
+            variant that could not be submitted has its `error` set.
+        """
+        if len(variants) == 0:
+            raise ValueError("🛑 A batch needs at least one variant.")
+
+        logger.info(
+            f"🚀 Submitting batch of {len(variants)} workflow"
+            f"{'s' if len(variants) != 1 else ''}"
+        )
+
+        seeds: dict[object, tuple[str, list[str]]] = {}
+        builders: list[WorkflowBuilder] = []
+        for variant in variants:
+            seed = None
+            if variant.seed_dataset is not None:
+                key = _seed_dataset_key(variant.seed_dataset)
+                if key not in seeds:
+                    seeds[key] = self._resolve_seed_dataset(variant.seed_dataset)
+                    logger.info(f"🌱 Using seed dataset with file ID: {seeds[key][0]}")
+                seed = seeds[key]
+
+            builder = self._variant(variant, seed)._build_workflow(
+                num_records=variant.num_records, parallel=parallel, validate=False
+            )
+            if name:
+                builder.for_workflow(workflow_name=name)
+            builders.append(builder)
+
+        validate_workflows(builders)
+
+        runs = [BatchRun(variant=variant) for variant in variants]
+
+        def submit(index: int) -> None:
+            try:
+                runs[index].workflow_run = builders[index].run(
+                    run_name=variants[index].run_name
+                )
+            except Exception as exc:
+                logger.error(f"🛑 Could not submit variant {index}: {exc}")
+                runs[index].error = exc
+
+        # The first run creates the workflow that the other runs are added to.
+        submit(0)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            list(executor.map(submit, range(1, len(runs))))
+
+        batch_runs = BatchRuns(runs, max_workers=max_workers)
+        if wait_until_done:
+            batch_runs.wait_until_done()
+        return batch_runs
+
+    def dry_run(self) -> ExecutionPlan:
+        """Plan the generation of the DAG columns without running a workflow.
+
+        Columns are grouped into levels of columns that don't depend on each
+        other. With `parallel=True`, `preview` and `create` generate the
+        columns of a level concurrently, so generation takes about as many
+        steps as there are levels rather than columns. The levels, the
+        critical path and the expected speedup are logged.
+
+        Returns:
+            The execution plan.
+        """
+        plan = plan_column_levels(self._dag_columns)
+        logger.info(
+            f"🗺️ {plan.num_columns} generated column"
+            f"{'s' if plan.num_columns != 1 else ''} in {plan.depth} "
+            f"level{'s' if plan.depth != 1 else ''}"
+        )
+        for i, level in enumerate(plan.levels):
+            logger.info(
+                f"  |-- Level {i + 1}: {', '.join(f'`{name}`' for name in level)}"
+            )
+        if plan.critical_path:
+            logger.info(
+                "⛓️ Critical path: "
+                + " -> ".join(f"`{name}`" for name in plan.critical_path)
+            )
+        logger.info(
+            f"⚡ Expected speedup of parallel generation: {plan.expected_speedup:.1f}x"
+        )
+        return plan
+
     def with_person_samplers(
         self,
         person_samplers: dict[str, PersonSamplerParams],
@@ -574,28 +811,17 @@ class DataDesigner:
             sampling_strategy: Sampling strategy to use.
             with_replacement: If True, the same row can be sampled multiple times.
         """
-        if isinstance(dataset, File):
-            file_id = dataset.id
-            dataset_columns = self._retrieve_remote_dataset_columns(file_id)
-
-        elif isinstance(dataset, str) and dataset.startswith("file_"):
-            file_id = dataset
-            dataset_columns = self._retrieve_remote_dataset_columns(file_id)
-
-        else:
-            df = smart_load_dataframe(dataset)
-            file_id = self._files.upload(df, "dataset").id
-            dataset_columns = df.columns.tolist()
+        file_id, dataset_columns = self._resolve_seed_dataset(dataset)
 
         logger.info(f"🌱 Using seed dataset with file ID: {file_id}")
 
-        for column in dataset_columns:
-            self._columns[column] = DataSeedColumn(name=column, file_id=file_id)
-
-        self._seed_dataset = SeedDataset(
-            file_id=file_id,
-            sampling_strategy=sampling_strategy,
-            with_replacement=with_replacement,
+        self._set_seed_dataset(
+            SeedDataset(
+                file_id=file_id,
+                sampling_strategy=sampling_strategy,
+                with_replacement=with_replacement,
+            ),
+            dataset_columns,
         )
 
         return self
@@ -716,8 +942,16 @@ class DataDesigner:
         num_records: int | None = None,
         verbose_logging: bool = False,
         streaming: bool = False,
+        parallel: bool = False,
+        validate: bool = True,
     ) -> WorkflowBuilder:
-        """Build a workflow from the current Data Designer configuration."""
+        """Build a workflow from the current Data Designer configuration.
+
+        If `parallel` is True, independent DAG columns are generated by
+        concurrent branches of the workflow that are merged afterwards, rather
+        than by a chain of steps. If `validate` is False, the steps are not
+        validated and it is up to the caller to validate them.
+        """
         if self._seed_dataset is None and len(self.sampler_columns) == 0:
             raise ValueError(
                 "🛑 Data Designer needs a seed dataset and/or at least one column that is "
@@ -755,6 +989,7 @@ class DataDesigner:
                 step=sample_from_dataset_step,
                 step_inputs=[self._seed_dataset.file_id],
                 step_name="seeding-workflow-with-dataset",
+                validate=False,
             )
             last_step_added = sample_from_dataset_step
 
@@ -776,6 +1011,7 @@ class DataDesigner:
                 step=columns_using_samples_step,
                 step_inputs=[],
                 step_name=f"using-samplers-to-generate-{len(self.sampler_columns)}-columns",
+                validate=False,
             )
             last_step_added = columns_using_samples_step
 
@@ -792,6 +1028,7 @@ class DataDesigner:
                 step=concat_step,
                 step_inputs=[sample_from_dataset_step, columns_using_samples_step],
                 step_name="concatenating-seed-and-sampler-datasets",
+                validate=False,
             )
             last_step_added = concat_step
 
@@ -799,23 +1036,22 @@ class DataDesigner:
         # Add DAG columns to workflow (multiple steps)
         ########################################################
 
-        sorted_columns_names = topologically_sort_columns(
-            self._dag_columns, logger=logger if verbose_logging else None
-        )
-
-        for column_name in sorted_columns_names:
-            column = self.get_column(column_name)
-            next_step = self._get_next_dag_step(column_name)
-
-            if hasattr(next_step, "num_records"):
-                next_step.num_records = num_records
-
-            builder.add_step(
-                step=next_step,
-                step_inputs=[last_step_added],
-                step_name=column.step_name,
+        if parallel:
+            last_step_added = self._add_parallel_dag_steps(
+                builder,
+                last_step_added,
+                num_records=num_records,
+                verbose_logging=verbose_logging,
+            )
+        else:
+            sorted_columns_names = topologically_sort_columns(
+                self._dag_columns, logger=logger if verbose_logging else None
             )
-            last_step_added = next_step
+
+            for column_name in sorted_columns_names:
+                last_step_added = self._add_dag_step(
+                    builder, column_name, last_step_added, num_records=num_records
+                )
 
         ########################################################
         # Drop intermediate columns (`drop=True`) and latent person columns
@@ -832,6 +1068,7 @@ class DataDesigner:
                     f"dropping-{len(self._latent_person_columns)}-latent-person-"
                     f"column{'s' if len(self._latent_person_columns) > 1 else ''}"
                 ),
+                validate=False,
             )
             last_step_added = drop_latent_columns_step
 
@@ -844,6 +1081,7 @@ class DataDesigner:
                     f"dropping-{len(self._drop_columns)}-intermediate-column"
                     f"{'s' if len(self._drop_columns) != 1 else ''}"
                 ),
+                validate=False,
             )
             last_step_added = drop_cols_step
 
@@ -893,15 +1131,30 @@ class DataDesigner:
                 step=general_eval_step,
                 step_inputs=[last_step_added],
                 step_name="evaluating-dataset",
+                validate=False,
             )
             last_step_added = general_eval_step
 
+        ########################################################
+        # Validate all steps concurrently
+        ########################################################
+
+        if validate:
+            builder.validate_steps()
+
         return builder
 
     def _capture_preview_result(
-        self, workflow: WorkflowBuilder, verbose_logging: bool
+        self,
+        workflow: WorkflowBuilder,
+        verbose_logging: bool,
+        datasets_by_step: dict[str, pd.DataFrame] | None = None,
     ) -> PreviewResults:
-        """Capture the results (including logs) of a workflow preview."""
+        """Capture the results (including logs) of a workflow preview.
+
+        If `datasets_by_step` is given, the dataset produced by each step is
+        added to it, keyed by step name.
+        """
         step_idx = 0
         message: Message
         current_step = None
@@ -948,17 +1201,22 @@ class DataDesigner:
                             logger.error(formatted_msg)
 
             if message.has_output:
-                try:
-                    logger.debug(
-                        f"Step output: {json.dumps(message.payload, indent=4)}"
-                    )
-                except (TypeError, ValueError):
-                    # Some payloads (like DataFrames) can't be JSON serialized
-                    logger.debug(f"Step output: {type(message.payload).__name__}")
+                # serializing large payloads is expensive, so only do it
+                # when the output is actually going to be logged.
+                if logger.isEnabledFor(logging.DEBUG):
+                    try:
+                        logger.debug(
+                            f"Step output: {json.dumps(message.payload, indent=4)}"
+                        )
+                    except (TypeError, ValueError):
+                        # Some payloads (like DataFrames) can't be JSON serialized
+                        logger.debug(f"Step output: {type(message.payload).__name__}")
 
                 output = message.payload
                 if message.has_dataset:
                     final_output = message.dataset
+                    if datasets_by_step is not None:
+                        datasets_by_step[message.step] = final_output
                 outputs_by_step[message.step] = output
         # the final output is either the dataset produced by the last
         # task in the workflow, or, if no dataset is produced by the workflow
@@ -981,6 +1239,162 @@ class DataDesigner:
             success=success,
         )
 
+    def _find_preview_resume_index(
+        self, workflow: WorkflowBuilder, fingerprints: dict[str, str]
+    ) -> int | None:
+        """Return the index of the last step a preview can be resumed from.
+
+        A preview can be resumed from a step if its output is cached and no
+        step after it depends on a step before it.
+        """
+        steps = workflow.get_steps()
+        step_names = set(workflow.step_names)
+        for index in reversed(range(len(steps))):
+            if fingerprints[steps[index].name] not in self._preview_cache:
+                continue
+            upstream = {step.name for step in steps[:index]}
+            if not any(
+                name in upstream
+                for step in steps[index + 1 :]
+                for name in step.inputs or []
+                if name in step_names
+            ):
+                return index
+        return None
+
+    def _resume_preview_workflow(
+        self, workflow: WorkflowBuilder, resume_index: int, fingerprint: str
+    ) -> WorkflowBuilder:
+        """Build a workflow that is seeded with the cached output of a step and
+        only executes the steps after it."""
+        steps = workflow.get_steps()
+        resume_step_name = steps[resume_index].name
+        file_id = self._preview_cache.file_id(
+            fingerprint, upload=lambda df: self._files.upload(df, "dataset").id
+        )
+        num_records = len(self._preview_cache.get(fingerprint))
+
+        builder = self._workflow_manager.builder(
+            globals=Globals(
+                num_records=NUM_PREVIEW_RECORDS,
+                model_suite=self._model_suite,
+                model_configs=self._model_configs,
+            )
+        )
+        seed_step_name = f"resuming-from-{resume_step_name}"
+        builder.add_step(
+            step=self._task_registry.SampleFromDataset(
+                num_samples=num_records,
+                strategy=SamplingStrategy.ORDERED,
+                with_replacement=False,
+            ),
+            step_inputs=[file_id],
+            step_name=seed_step_name,
+            validate=False,
+        )
+        for step in steps[resume_index + 1 :]:
+            builder.add_step(
+                step=step.model_copy(deep=True),
+                step_inputs=[
+                    seed_step_name if name == resume_step_name else name
+                    for name in step.inputs or []
+                ],
+                step_name=step.name,
+                validate=False,
+            )
+        return builder
+
+    def _add_dag_step(
+        self,
+        builder: WorkflowBuilder,
+        column_name: str,
+        step_input: TaskConfig,
+        *,
+        num_records: int,
+    ) -> TaskConfig:
+        """Add the step generating the given DAG column to the workflow."""
+        column = self.get_column(column_name)
+        next_step = self._get_next_dag_step(column_name)
+
+        if hasattr(next_step, "num_records"):
+            next_step.num_records = num_records
+
+        builder.add_step(
+            step=next_step,
+            step_inputs=[step_input],
+            step_name=column.step_name,
+            validate=False,
+        )
+        return next_step
+
+    def _add_parallel_dag_steps(
+        self,
+        builder: WorkflowBuilder,
+        step_input: TaskConfig,
+        *,
+        num_records: int,
+        verbose_logging: bool,
+    ) -> TaskConfig:
+        """Add the DAG columns to the workflow, one level at a time.
+
+        The columns of a level fan out from the output of the previous level.
+        Every branch but the first drops the columns it received, so the
+        branches can be merged without duplicating columns.
+
+        Merging the branches relies on every branch keeping the records, and
+        their order, of its input: the merge pairs up records by position. A
+        level is therefore only fanned out if every column of it is known to
+        preserve rows, otherwise its columns are generated one after another.
+        """
+        plan = plan_column_levels(
+            self._dag_columns, logger=logger if verbose_logging else None
+        )
+        available_columns = [c.name for c in self.seed_columns + self.sampler_columns]
+        for level in plan.levels:
+            if len(level) == 1 or not all(
+                _preserves_rows(self.get_column(name)) for name in level
+            ):
+                for column_name in level:
+                    step_input = self._add_dag_step(
+                        builder, column_name, step_input, num_records=num_records
+                    )
+                branch_outputs = [step_input]
+            else:
+                branch_outputs = []
+                for i, column_name in enumerate(level):
+                    branch_output = self._add_dag_step(
+                        builder, column_name, step_input, num_records=num_records
+                    )
+                    if i > 0 and available_columns:
+                        drop_step = self._task_registry.DropColumns(
+                            columns=list(available_columns)
+                        )
+                        builder.add_step(
+                            step=drop_step,
+                            step_inputs=[branch_output],
+                            step_name=f"isolating-column-{to_kebab(column_name)}",
+                            validate=False,
+                        )
+                        branch_output = drop_step
+                    branch_outputs.append(branch_output)
+
+                merge_step = self._task_registry.ConcatDatasets()
+                builder.add_step(
+                    step=merge_step,
+                    step_inputs=branch_outputs,
+                    step_name=f"concatenating-{len(level)}-parallel-columns",
+                    validate=False,
+                )
+                branch_outputs = [merge_step]
+
+            step_input = branch_outputs[0]
+            for column_name in level:
+                available_columns.append(column_name)
+                available_columns.extend(
+                    self.get_column(column_name).side_effect_columns
+                )
+        return step_input
+
     def _get_next_dag_step(self, column_name: str) -> TaskConfig:
         """Return the task for the given column for the next step in the DAG."""
         column = self.get_column(column_name)
@@ -1008,10 +1422,77 @@ class DataDesigner:
             raise ValueError(f"🛑 Columns of type {type(column)} do not go in the DAG.")
         return next_step
 
+    def _resolve_seed_dataset(
+        self, dataset: pd.DataFrame | Path | str | File
+    ) -> tuple[str, list[str]]:
+        """Return the file id and columns of a seed dataset, uploading it if needed."""
+        if isinstance(dataset, File):
+            return dataset.id, self._retrieve_remote_dataset_columns(dataset.id)
+
+        if isinstance(dataset, str) and dataset.startswith("file_"):
+            return dataset, self._retrieve_remote_dataset_columns(dataset)
+
+        df = smart_load_dataframe(dataset)
+        file_id = self._files.upload(df, "dataset").id
+        return file_id, df.columns.tolist()
+
+    def _set_seed_dataset(
+        self, seed_dataset: SeedDataset, dataset_columns: list[str]
+    ) -> None:
+        for column in dataset_columns:
+            self._columns[column] = DataSeedColumn(
+                name=column, file_id=seed_dataset.file_id
+            )
+        self._seed_dataset = seed_dataset
+
+    def _variant(
+        self,
+        variant: BatchVariant,
+        seed: tuple[str, list[str]] | None = None,
+    ) -> DataDesigner:
+        """Return a copy of this Data Designer with the settings of a batch variant."""
+        designer = DataDesigner(
+            gretel_resource_provider=self._gretel_resource_provider,
+            model_suite=variant.model_suite or self._model_suite,
+            model_configs=(
+                variant.model_configs
+                if variant.model_configs is not None
+                else self._model_configs
+            ),
+            columns={
+                name: column
+                for name, column in self._columns.items()
+                if seed is None or not isinstance(column, DataSeedColumn)
+            },
+            constraints=self._constraints,
+            evaluation_report=self._evaluation_report,
+        )
+        designer._latent_person_columns = dict(self._latent_person_columns)
+        designer._seed_dataset = self._seed_dataset
+
+        if seed is not None:
+            file_id, dataset_columns = seed
+            designer._set_seed_dataset(
+                SeedDataset(
+                    file_id=file_id,
+                    sampling_strategy=(
+                        self._seed_dataset.sampling_strategy
+                        if self._seed_dataset
+                        else SamplingStrategy.ORDERED
+                    ),
+                    with_replacement=(
+                        self._seed_dataset.with_replacement
+                        if self._seed_dataset
+                        else False
+                    ),
+                ),
+                dataset_columns,
+            )
+        return designer
+
     def _retrieve_remote_dataset_columns(self, file_id: str) -> list[str]:
         """Return the columns of a dataset given its file id."""
-        retrieved_df = self._files.download_dataset(file_id)
-        return retrieved_df.columns.tolist()
+        return self._files.get_dataset_columns(file_id)
 
     def _run_semantic_validation(
         self, raise_exceptions: bool = False
@@ -1130,6 +1611,26 @@ def get_column_from_kwargs(
     return column_klass(name=name, **kwargs)
 
 
+def _seed_dataset_key(dataset: pd.DataFrame | Path | str | File) -> object:
+    """Key that identifies the same seed dataset across the variants of a batch."""
+    if isinstance(dataset, File):
+        return dataset.id
+    if isinstance(dataset, pd.DataFrame):
+        return id(dataset)
+    return str(dataset)
+
+
+def _preserves_rows(column: AIDDColumnT) -> bool:
+    """Whether the step generating the column keeps the records of its input.
+
+    Judges of a sample of the records return fewer records. Column types not
+    listed here are conservatively assumed to change the records.
+    """
+    if isinstance(column, LLMJudgeColumn):
+        return column.num_samples_to_judge is None
+    return isinstance(column, (LLMGenColumn, CodeValidationColumn, ExpressionColumn))
+
+
 def _add_backticks_to_column_names(step_name: str, column_names: list[str]) -> str:
     """Add backticks to the column names in the step name if they are present.
 
@@ -6,8 +6,9 @@ import json
 import logging
 import random
 
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from copy import deepcopy
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from itertools import cycle
 from typing import Any, Generator, Generic, Optional, Self, TypeAlias, TypeVar
 
@@ -50,6 +51,9 @@ logger = logging.getLogger(__name__)
 
 ACTION_FUN_NAMES = ["Greteling", "Vibing", "Magicking", "Noodling"]
 
+DEFAULT_MAGIC_WORKERS = 8
+"""Maximum number of column instructions executed at the same time."""
+
 EXPERIMENTAL_WARNING = """\
 Thanks for trying the 🪄 Magic `DataDesigner` interface! This interface is experimental \
 and will likely change in the future. Please let us know your feedback and any issues \
@@ -361,6 +365,57 @@ def remote_streaming_execute_stateless_task(
     )
 
 
+def execute_stateless_task(
+    task: ConfigBase,
+    workflow_manager: WorkflowManager,
+    output_type_name: str,
+    globals: Globals = Globals(),
+) -> dict:
+    """Execute a stateless task without displaying a processing animation.
+
+    Unlike `remote_streaming_execute_stateless_task`, this function is safe
+    to call from several threads at the same time.
+
+    Args:
+        task (ConfigBase): An instanstiated task configuration from the task registry.
+        workflow_manager: An instantiated workflow manager object.
+        output_type_name (str): Specifies the output type that
+            should be retrieved from the message stream.
+        globals (optional, Globals): Globals for the workflow builder.
+
+    Returns:
+        Whatever the output of this task run is.
+    """
+    stream = remote_streaming_execute_stateless_task.__wrapped__(
+        task, workflow_manager, output_type_name, globals
+    )
+    try:
+        while True:
+            next(stream)
+    except StopIteration as e:
+        return e.value
+
+
+@dataclass
+class ColumnInstruction:
+    """A natural language instruction for a column, see `MagicDataDesignerEditor.add_columns`.
+
+    Attributes:
+        name (str): The name of the column to add or edit.
+        instruction (str): The instruction describing the column.
+        sampler (bool): If True, the column is generated with a non-LLM
+            sampler, as with `add_sampling_column`. Otherwise it is an LLM
+            generation column, as with `add_column`.
+        must_depend_on (list[str]): Columns that the prompt template of an
+            LLM generation column must refer to.
+    """
+
+    name: str
+    instruction: str
+    sampler: bool = False
+    must_depend_on: list[str] = field(default_factory=list)
+
+
 @dataclass
 class DataDesignerState:
     """State management for the DD object.
@@ -457,17 +512,21 @@ class MagicDataDesignerEditor(Generic[DataDesignerT]):
 
         self.reset()
 
-    def _run_and_display_preview(self, name: str, syntax: Optional[str] = None) -> None:
+    def _run_preview(self, status_string: str):
         # Export and then reset. Wonder if this could be a context manager.
         self._working_dd_state.set_data_designer_object(self._dd_obj)
 
         console = Console(theme=RICH_CONSOLE_THEME)
-        status_string = f"{action_fun_name()} samples of {pprint_column_name(name)}..."
-
         with console.status(status_string, spinner="toggle10"):
             outs = self._dd_obj.preview()
 
         self._source_dd_state.set_data_designer_object(self._dd_obj)
+        return outs
+
+    def _run_and_display_preview(self, name: str, syntax: Optional[str] = None) -> None:
+        outs = self._run_preview(
+            f"{action_fun_name()} samples of {pprint_column_name(name)}..."
+        )
         pprint_outputs(outs, name, n=3, syntax=syntax)
 
     def _instruction_to_data_column(
@@ -478,12 +537,40 @@ class MagicDataDesignerEditor(Generic[DataDesignerT]):
         verbose: bool = True,
     ) -> AIDDColumnT:
         """Single call to get a generation config."""
+        new_data_column = self._generate_data_column(
+            task, edit_instruction=edit_instruction, previous_attempt=previous_attempt
+        )
+
+        if verbose:
+            pprint_datacolumn(new_data_column)
+
+        self._working_dd_state.columns[task.name] = new_data_column
+
+        return new_data_column
+
+    def _generate_data_column(
+        self,
+        task: AIDDColumnConfigGenerationTask,
+        edit_instruction: Optional[str] = None,
+        previous_attempt: Optional[EditableColumnT] = None,
+        animate: bool = True,
+    ) -> AIDDColumnT:
+        """Get a generation config without touching the working state.
+
+        With `animate=False` no processing animation is displayed, so the
+        method can be called from several threads at the same time.
+        """
 
         _task = deepcopy(task)
         if edit_instruction and previous_attempt:
             _task.instruction = edit_instruction
             _task.edit_task = cast_column_cfg_to_edit_task_cfg(previous_attempt)
 
+        execute = (
+            remote_streaming_execute_stateless_task
+            if animate
+            else execute_stateless_task
+        )
         execution_args = {
             "workflow_manager": self._dd_obj.workflow_manager,
             "globals": Globals(model_suite=self.model_suite),
@@ -491,13 +578,13 @@ class MagicDataDesignerEditor(Generic[DataDesignerT]):
         }
 
         if isinstance(task, GenerateSamplingColumnConfigFromInstruction):
-            task_output = remote_streaming_execute_stateless_task(
+            task_output = execute(
                 output_type_name="serializable_conditional_data_column",
                 **execution_args,
             )
             new_data_column = SamplerColumn.unpack(task_output)
         elif isinstance(task, GenerateColumnConfigFromInstruction):
-            task_output = remote_streaming_execute_stateless_task(
+            task_output = execute(
                 output_type_name="generate_column_from_template_v2_config",
                 **execution_args,
             )
@@ -514,11 +601,6 @@ class MagicDataDesignerEditor(Generic[DataDesignerT]):
         if hasattr(new_data_column, "model_suite"):
             new_data_column.model_suite = self._dd_obj.model_suite
 
-        if verbose:
-            pprint_datacolumn(new_data_column)
-
-        self._working_dd_state.columns[task.name] = new_data_column
-
         return new_data_column
 
     def _instruction_loop_for_aidd_column(
@@ -629,37 +711,7 @@ class MagicDataDesignerEditor(Generic[DataDesignerT]):
         save: bool = True,
         interactive: bool = False,
     ) -> DataDesignerT:
-        if self.is_known_column_name(name) and not self.is_editable_column(name):
-            _col = self._dd_obj.get_column(name)
-            _type_name = _col.__class__.__name__
-            raise KeyError(
-                f"The column '{name}' already exists as type {_type_name}, it cannot be updated with this function. "
-            )
-
-        if must_depend_on is None:
-            must_depend_on = []
-
-        for dependency_column_name in must_depend_on:
-            if not self.is_known_column_name(dependency_column_name):
-                raise KeyError(
-                    f"Required dependency {dependency_column_name} does not exist."
-                )
-
-        ## Get previously existing column if present
-        edit_task = None
-        if self.is_known_column_name(name):
-            edit_data_column = self._dd_obj.get_column(name)
-            edit_task = GenerateColumnFromTemplateV2Config.model_validate(
-                edit_data_column.model_dump()
-            )
-
-        task = self._task_registry.GenerateColumnConfigFromInstruction(
-            name=name,
-            instruction=instruction,
-            must_depend_on=must_depend_on,
-            existing_columns=self.existing_columns,
-            edit_task=edit_task,
-        )
+        task = self._column_config_task(name, instruction, must_depend_on)
 
         new_data_column = self._instruction_loop_for_aidd_column(
             task, interactive=interactive, preview=preview
@@ -804,6 +856,190 @@ class MagicDataDesignerEditor(Generic[DataDesignerT]):
         save: bool = True,
         interactive: bool = False,
     ) -> DataDesignerT:
+        task = self._sampling_column_config_task(name, instruction)
+
+        new_data_column = self._instruction_loop_for_aidd_column(
+            task, interactive=interactive, preview=preview
+        )
+
+        if new_data_column is None:
+            self._working_dd_state = self._source_dd_state.fork()
+            rich.print(f"🗑️ Trashed {pprint_column_name(name)}")
+        elif not save:
+            rich.print(
+                f"🪄 Column {pprint_column_name(name)} buffered! Use .save() to apply later."
+            )
+        else:
+            self.save()
+
+        return self._dd_obj
+
+    @experimental(message=EXPERIMENTAL_WARNING, emoji="🧪")
+    def add_columns(
+        self,
+        instructions: list[ColumnInstruction] | dict[str, str],
+        *,
+        preview: bool = False,
+        save: bool = True,
+        max_workers: int = DEFAULT_MAGIC_WORKERS,
+    ) -> DataDesignerT:
+        """Add or edit several columns from natural language instructions at once.
+
+        The instructions are executed concurrently. Each of them sees the
+        columns as they were before the call, so the instructions must be
+        independent of each other. The generated columns are merged in the
+        order of the instructions, no matter which finishes first, and a
+        single preview is generated for all of them.
+
+        ```python
+        designer.magic.add_columns(
+            {
+                "review": "A product review of {{ product_name }}.",
+                "title": "A catchy title for a listing of {{ product_name }}.",
+            }
+        )
+        ```
+
+        Args:
+            instructions (list[ColumnInstruction] | dict[str, str]): The
+                instructions for each column. A dictionary maps the names of
+                LLM generation columns to their instructions.
+            preview (bool): If True, display preview samples of the new columns.
+            save (bool): If True, save the new columns to the DataDesigner
+                object. Otherwise use `.save()` to apply them later.
+            max_workers (int): Maximum number of instructions that are executed
+                at the same time.
+
+        Returns:
+            An updated DataDesigner object.
+
+        Raises:
+            ValueError: If a column is given more than one instruction.
+            KeyError: If a column can't be added or edited, see `add_column`
+                and `add_sampling_column`.
+            MagicError: If some of the instructions failed. The columns of the
+                successful instructions are still applied.
+        """
+        if isinstance(instructions, dict):
+            instructions = [
+                ColumnInstruction(name=name, instruction=instruction)
+                for name, instruction in instructions.items()
+            ]
+
+        names = [instruction.name for instruction in instructions]
+        if len(set(names)) != len(names):
+            raise ValueError("Each column can only be given a single instruction.")
+
+        tasks = [
+            (
+                self._sampling_column_config_task(i.name, i.instruction)
+                if i.sampler
+                else self._column_config_task(i.name, i.instruction, i.must_depend_on)
+            )
+            for i in instructions
+        ]
+
+        new_data_columns: dict[str, AIDDColumnT] = {}
+        errors: dict[str, Exception] = {}
+        status_string = (
+            f"{action_fun_name()} {len(tasks)} column{'s' if len(tasks) != 1 else ''}"
+        )
+        with (
+            Console().status(status_string, spinner="toggle10") as status,
+            ThreadPoolExecutor(max_workers=max_workers) as executor,
+        ):
+            futures = {
+                executor.submit(self._generate_data_column, task, animate=False): (
+                    task.name
+                )
+                for task in tasks
+            }
+            for future in as_completed(futures):
+                name = futures[future]
+                try:
+                    new_data_columns[name] = future.result()
+                except Exception as exc:
+                    errors[name] = exc
+                status.update(
+                    f"{status_string} [cyan]({len(new_data_columns) + len(errors)}"
+                    f"/{len(tasks)})[/cyan]"
+                )
+
+        ## Merge in the order of the instructions, not of completion.
+        merged_names = [name for name in names if name in new_data_columns]
+        for name in merged_names:
+            pprint_datacolumn(new_data_columns[name])
+            self._working_dd_state.columns[name] = new_data_columns[name]
+
+        if preview and merged_names:
+            outs = self._run_preview(
+                f"{action_fun_name()} samples of {len(merged_names)} columns..."
+            )
+            for name in merged_names:
+                output_type = getattr(new_data_columns[name], "output_type", None)
+                output_format = getattr(new_data_columns[name], "output_format", None)
+                syntax = output_format if output_type == "code" else None
+                pprint_outputs(outs, name, n=3, syntax=syntax)
+
+        if save:
+            self.save()
+        elif merged_names:
+            rich.print(
+                f"🪄 Columns {', '.join(pprint_column_name(n) for n in merged_names)} "
+                "buffered! Use .save() to apply later."
+            )
+
+        if errors:
+            failures = "; ".join(f"{name}: {exc}" for name, exc in errors.items())
+            raise MagicError(
+                f"Could not generate {len(errors)} of {len(tasks)} columns: {failures}"
+            ) from next(iter(errors.values()))
+
+        return self._dd_obj
+
+    def _column_config_task(
+        self,
+        name: str,
+        instruction: str,
+        must_depend_on: Optional[list[str]] = None,
+    ) -> GenerateColumnConfigFromInstruction:
+        """Task that generates the config of an LLM generation column."""
+        if self.is_known_column_name(name) and not self.is_editable_column(name):
+            _col = self._dd_obj.get_column(name)
+            _type_name = _col.__class__.__name__
+            raise KeyError(
+                f"The column '{name}' already exists as type {_type_name}, it cannot be updated with this function. "
+            )
+
+        if must_depend_on is None:
+            must_depend_on = []
+
+        for dependency_column_name in must_depend_on:
+            if not self.is_known_column_name(dependency_column_name):
+                raise KeyError(
+                    f"Required dependency {dependency_column_name} does not exist."
+                )
+
+        ## Get previously existing column if present
+        edit_task = None
+        if self.is_known_column_name(name):
+            edit_data_column = self._dd_obj.get_column(name)
+            edit_task = GenerateColumnFromTemplateV2Config.model_validate(
+                edit_data_column.model_dump()
+            )
+
+        return self._task_registry.GenerateColumnConfigFromInstruction(
+            name=name,
+            instruction=instruction,
+            must_depend_on=must_depend_on,
+            existing_columns=self.existing_columns,
+            edit_task=edit_task,
+        )
+
+    def _sampling_column_config_task(
+        self, name: str, instruction: str
+    ) -> GenerateSamplingColumnConfigFromInstruction:
+        """Task that generates the config of a sampler column."""
         if self.is_known_column_name(name):
             _col = self._dd_obj.get_column(name)
 
@@ -819,7 +1055,7 @@ class MagicDataDesignerEditor(Generic[DataDesignerT]):
         if self.is_known_column_name(name):
             edit_task = self._dd_obj.get_column(name).pack()
 
-        task = self._task_registry.GenerateSamplingColumnConfigFromInstruction(
+        return self._task_registry.GenerateSamplingColumnConfigFromInstruction(
             name=name,
             instruction=instruction,
             edit_task=edit_task,
@@ -828,22 +1064,6 @@ class MagicDataDesignerEditor(Generic[DataDesignerT]):
             ],
         )
 
-        new_data_column = self._instruction_loop_for_aidd_column(
-            task, interactive=interactive, preview=preview
-        )
-
-        if new_data_column is None:
-            self._working_dd_state = self._source_dd_state.fork()
-            rich.print(f"🗑️ Trashed {pprint_column_name(name)}")
-        elif not save:
-            rich.print(
-                f"🪄 Column {pprint_column_name(name)} buffered! Use .save() to apply later."
-            )
-        else:
-            self.save()
-
-        return self._dd_obj
-
     def extend_category(
         self, name: str, *, n: int = 5, max_attempts: int = 3
     ) -> DataDesignerT:
@@ -1,9 +1,16 @@
-from dataclasses import dataclass
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Callable
 
 import pandas as pd
 
 from gretel_client.data_designer.types import TaskOutputT
-from gretel_client.data_designer.viz_tools import AIDDMetadata, display_sample_record
+from gretel_client.data_designer.viz_tools import (
+    DEFAULT_MAX_CELL_LENGTH,
+    AIDDMetadata,
+    RecordRenderPlan,
+    display_sample_record,
+)
 from gretel_client.workflows.io import Dataset
 
 
@@ -24,6 +31,9 @@ class PreviewResults:
     evaluation_results: dict | None = None
     success: bool = True
     _display_cycle_index: int = 0
+    _render_plans: dict[bool, RecordRenderPlan] = field(
+        default_factory=dict, init=False, repr=False
+    )
 
     @property
     def dataset(self) -> Dataset | None:
@@ -39,6 +49,7 @@ class PreviewResults:
         hide_seed_columns: bool = False,
         syntax_highlighting_theme: str = "dracula",
         background_color: str | None = None,
+        max_cell_length: int | None = DEFAULT_MAX_CELL_LENGTH,
     ) -> None:
         """Display a sample record from the AIDD dataset preview.
 
@@ -50,19 +61,88 @@ class PreviewResults:
                 documentation from `rich` for information about available themes.
             background_color: Background color to use for the record. See the `Syntax`
                 documentation from `rich` for information about available background colors.
+            max_cell_length: Maximum number of characters shown per value. Longer values
+                are truncated. If None, values are shown in full.
         """
         if self.dataset is None:
             raise ValueError("No dataset found in the preview results.")
-        i = index or self._display_cycle_index
+        df = self.output
+        i = self._display_cycle_index if index is None else index
         display_sample_record(
-            record=self.dataset.df.iloc[i],
+            record=df.iloc[i],
             aidd_metadata=self.aidd_metadata,
             background_color=background_color,
             syntax_highlighting_theme=syntax_highlighting_theme,
             hide_seed_columns=hide_seed_columns,
             record_index=i,
+            max_cell_length=max_cell_length,
+            render_plan=self._get_render_plan(hide_seed_columns),
         )
         if index is None:
-            self._display_cycle_index = (self._display_cycle_index + 1) % len(
-                self.dataset.df
+            self._display_cycle_index = (self._display_cycle_index + 1) % len(df)
+
+    def _get_render_plan(self, hide_seed_columns: bool) -> RecordRenderPlan:
+        # The plan only depends on the metadata and the dataset, so it is built
+        # once per preview instead of once per displayed record.
+        if hide_seed_columns not in self._render_plans:
+            self._render_plans[hide_seed_columns] = RecordRenderPlan.from_metadata(
+                self.aidd_metadata,
+                hide_seed_columns=hide_seed_columns,
+                dataset=self.output,
             )
+        return self._render_plans[hide_seed_columns]
+
+
+DEFAULT_PREVIEW_CACHE_SIZE = 128
+"""Maximum number of step outputs kept in a preview cache."""
+
+
+@dataclass
+class _CachedStepOutput:
+    dataset: pd.DataFrame
+    file_id: str | None = None
+
+
+class PreviewCache:
+    """LRU cache of the datasets produced by the steps of preview workflows.
+
+    Entries are keyed by step fingerprint, see `WorkflowBuilder.step_fingerprints`,
+    so an entry is only hit if neither the step nor any step upstream of it has
+    changed since the output was cached.
+
+    Args:
+        max_size: Maximum number of step outputs to keep.
+    """
+
+    def __init__(self, max_size: int = DEFAULT_PREVIEW_CACHE_SIZE):
+        self._max_size = max_size
+        self._entries: OrderedDict[str, _CachedStepOutput] = OrderedDict()
+
+    def __contains__(self, fingerprint: str) -> bool:
+        return fingerprint in self._entries
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, fingerprint: str) -> pd.DataFrame | None:
+        if fingerprint not in self._entries:
+            return None
+        self._entries.move_to_end(fingerprint)
+        return self._entries[fingerprint].dataset.copy()
+
+    def put(self, fingerprint: str, dataset: pd.DataFrame) -> None:
+        self._entries[fingerprint] = _CachedStepOutput(dataset=dataset)
+        self._entries.move_to_end(fingerprint)
+        while len(self._entries) > self._max_size:
+            self._entries.popitem(last=False)
+
+    def file_id(self, fingerprint: str, upload: Callable[[pd.DataFrame], str]) -> str:
+        """Return the id of the uploaded dataset, uploading it the first time."""
+        entry = self._entries[fingerprint]
+        if entry.file_id is None:
+            entry.file_id = upload(entry.dataset)
+        self._entries.move_to_end(fingerprint)
+        return entry.file_id
+
+    def clear(self) -> None:
+        self._entries.clear()
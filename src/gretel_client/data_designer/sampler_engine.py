@@ -0,0 +1,548 @@
+"""Local engine for sampler columns.
+
+The engine executes the sampler columns of a Data Designer configuration,
+including their conditional parameters and constraints, with vectorized
+numpy operations. No workflow is submitted, so distributions can be
+iterated on and configurations can be tested without access to the Gretel
+service.
+
+The engine mirrors the semantics of the managed sampler task, but the
+values it produces are not bit-for-bit identical to the ones generated by
+the service. In particular, person samplers are backed by `Faker` rather
+than by the demographic datasets used by the service.
+
+Example::
+
+    from gretel_client.data_designer.sampler_engine import SamplerEngine
+
+    df = SamplerEngine(aidd.sampler_columns, seed=42).sample(1_000_000)
+"""
+
+from __future__ import annotations
+
+import graphlib
+import operator
+import re
+
+from typing import Any, Callable
+
+import numpy as np
+import pandas as pd
+
+from gretel_client.data_designer.exceptions import DataDesignerValidationError
+from gretel_client.data_designer.types import SamplerColumn
+from gretel_client.workflows.configs import tasks
+from gretel_client.workflows.configs.base import ConfigBase
+from gretel_client.workflows.configs.tasks import (
+    ColumnConstraint,
+    ConstraintType,
+    InequalityOperator,
+    SamplerType,
+)
+
+DEFAULT_MAX_REJECTIONS_FACTOR = 5
+
+PARAMS_BY_SAMPLER_TYPE: dict[SamplerType, type[ConfigBase]] = {
+    SamplerType.BERNOULLI: tasks.BernoulliSamplerParams,
+    SamplerType.BERNOULLI_MIXTURE: tasks.BernoulliMixtureSamplerParams,
+    SamplerType.BINOMIAL: tasks.BinomialSamplerParams,
+    SamplerType.CATEGORY: tasks.CategorySamplerParams,
+    SamplerType.DATETIME: tasks.DatetimeSamplerParams,
+    SamplerType.GAUSSIAN: tasks.GaussianSamplerParams,
+    SamplerType.PERSON: tasks.PersonSamplerParams,
+    SamplerType.POISSON: tasks.PoissonSamplerParams,
+    SamplerType.SCIPY: tasks.ScipySamplerParams,
+    SamplerType.SUBCATEGORY: tasks.SubcategorySamplerParams,
+    SamplerType.TIMEDELTA: tasks.TimeDeltaSamplerParams,
+    SamplerType.UNIFORM: tasks.UniformSamplerParams,
+    SamplerType.UUID: tasks.UUIDSamplerParams,
+}
+
+_INEQUALITY_OPERATORS: dict[InequalityOperator, Callable[[Any, Any], Any]] = {
+    InequalityOperator.LT: operator.lt,
+    InequalityOperator.LE: operator.le,
+    InequalityOperator.GT: operator.gt,
+    InequalityOperator.GE: operator.ge,
+}
+
+_NUMERIC_CONVERSIONS = ("int", "float")
+
+_UUID_GROUPS = [(0, 8, 0), (8, 12, 1), (12, 16, 2), (16, 20, 3), (20, 32, 4)]
+"""Start and end of each group of hex digits, and the number of dashes
+preceding the group in the formatted UUID."""
+
+_IDENTIFIER_PATTERN = re.compile(r"`([^`]+)`|([A-Za-z_]\w*)")
+
+
+class SamplerEngine:
+    """Samples the values of sampler columns locally.
+
+    Args:
+        columns: Sampler columns to sample.
+        constraints: Constraints the sampled records must satisfy. Records
+            that violate a constraint are rejected and sampled again.
+        seed: Seed of the random number generator, for reproducible samples.
+        max_rejections_factor: Sampling fails once more than
+            `max_rejections_factor` times the requested number of records
+            have been sampled without satisfying the constraints.
+    """
+
+    def __init__(
+        self,
+        columns: list[SamplerColumn],
+        constraints: list[ColumnConstraint] | None = None,
+        *,
+        seed: int | None = None,
+        max_rejections_factor: int = DEFAULT_MAX_REJECTIONS_FACTOR,
+    ):
+        self._columns = {c.name: c for c in columns}
+        self._constraints = constraints or []
+        self._max_rejections_factor = max_rejections_factor
+        self._rng = np.random.default_rng(seed)
+        self._seed = seed
+        self._faker_by_locale = {}
+        self._params = {
+            c.name: (
+                _validate_params(c.type, c.params),
+                {
+                    condition: _validate_params(c.type, params)
+                    for condition, params in (c.conditional_params or {}).items()
+                },
+            )
+            for c in columns
+        }
+        self._sampling_order = self._resolve_sampling_order()
+        self._validate_constraints()
+
+    def sample(self, num_records: int) -> pd.DataFrame:
+        """Sample `num_records` records that satisfy all constraints.
+
+        Args:
+            num_records: Number of records to sample.
+
+        Returns:
+            DataFrame with a column for each sampler column, in the order
+            the columns were given.
+
+        Raises:
+            DataDesignerValidationError: If not enough records satisfying the
+                constraints could be sampled.
+        """
+        if num_records < 0:
+            raise ValueError("num_records must not be negative.")
+
+        budget = max(num_records, self._max_rejections_factor * num_records)
+        batches = []
+        num_accepted = num_sampled = 0
+        acceptance_rate = 1.0
+        while num_accepted < num_records:
+            if num_sampled >= budget:
+                raise DataDesignerValidationError(
+                    f"🛑 Only {num_accepted} of {num_records} sampled records satisfy "
+                    "the constraints. Please check that the constraints are "
+                    "consistent with the sampler parameters."
+                )
+            # Oversample by the observed acceptance rate, so that most
+            # configurations need a single additional round at most.
+            num_missing = num_records - num_accepted
+            batch_size = min(
+                budget - num_sampled,
+                int(np.ceil(num_missing / max(acceptance_rate, 1e-3))),
+            )
+            batch = self._sample_batch(batch_size)
+            batch = batch[self._satisfies_constraints(batch)]
+            num_sampled += batch_size
+            num_accepted += len(batch)
+            acceptance_rate = num_accepted / num_sampled
+            batches.append(batch)
+
+        if batches:
+            df = pd.concat(batches, ignore_index=True).iloc[:num_records]
+            df = df.reset_index(drop=True)
+        else:
+            df = self._sample_batch(0)
+        for name, column in self._columns.items():
+            if column.convert_to and column.convert_to not in _NUMERIC_CONVERSIONS:
+                df[name] = _convert(df[name], column.convert_to)
+        return df
+
+    def _sample_batch(self, num_records: int) -> pd.DataFrame:
+        df = pd.DataFrame(index=pd.RangeIndex(num_records))
+        for name in self._sampling_order:
+            sampler_type = SamplerType(self._columns[name].type)
+            params, conditional_params = self._params[name]
+            if not conditional_params:
+                df[name] = self._sample_values(sampler_type, params, df)
+            else:
+                df[name] = self._sample_conditional_values(
+                    sampler_type, params, conditional_params, df
+                )
+            # Numeric conversions are applied right away, so conditions and
+            # constraints see the converted values. Formatting conversions
+            # are applied once all columns have been sampled.
+            convert_to = self._columns[name].convert_to
+            if convert_to in _NUMERIC_CONVERSIONS:
+                df[name] = _convert(df[name], convert_to)
+        return df[list(self._columns)]
+
+    def _sample_conditional_values(
+        self,
+        sampler_type: SamplerType,
+        params: Any,
+        conditional_params: dict[str, Any],
+        df: pd.DataFrame,
+    ) -> pd.Series:
+        values = pd.Series(None, index=df.index, dtype=object)
+        unassigned = np.ones(len(df), dtype=bool)
+        for condition, condition_params in conditional_params.items():
+            # Rows matching several conditions use the first one.
+            mask = unassigned & _evaluate_condition(df, condition)
+            if mask.any():
+                values[mask] = self._sample_values(
+                    sampler_type, condition_params, df[mask]
+                )
+            unassigned &= ~mask
+        if unassigned.any():
+            values[unassigned] = self._sample_values(
+                sampler_type, params, df[unassigned]
+            )
+        return values.infer_objects()
+
+    def _sample_values(
+        self, sampler_type: SamplerType, params: Any, df: pd.DataFrame
+    ) -> np.ndarray | pd.Series | list:
+        num_records = len(df)
+        rng = self._rng
+        match sampler_type:
+            case SamplerType.BERNOULLI:
+                return (rng.random(num_records) < params.p).astype(int)
+            case SamplerType.BERNOULLI_MIXTURE:
+                samples = _scipy_distribution(params.dist_name, params.dist_params).rvs(
+                    size=num_records, random_state=rng
+                )
+                return np.where(rng.random(num_records) < params.p, samples, 0)
+            case SamplerType.BINOMIAL:
+                return rng.binomial(params.n, params.p, num_records)
+            case SamplerType.CATEGORY:
+                return _choice(rng, params.values, params.weights, num_records)
+            case SamplerType.DATETIME:
+                return _sample_datetimes(rng, params, num_records)
+            case SamplerType.GAUSSIAN:
+                return rng.normal(params.mean, params.stddev, num_records)
+            case SamplerType.PERSON:
+                return self._sample_people(params, num_records)
+            case SamplerType.POISSON:
+                return rng.poisson(params.mean, num_records)
+            case SamplerType.SCIPY:
+                return _scipy_distribution(params.dist_name, params.dist_params).rvs(
+                    size=num_records, random_state=rng
+                )
+            case SamplerType.SUBCATEGORY:
+                return _sample_subcategories(rng, params, df[params.category])
+            case SamplerType.TIMEDELTA:
+                unit = _enum_value(params.unit or "D")
+                # dt_max is exclusive, as documented by the sampler params.
+                deltas = rng.integers(params.dt_min, params.dt_max, num_records)
+                return pd.to_datetime(
+                    df[params.reference_column_name]
+                ) + pd.to_timedelta(deltas, unit="min" if unit == "m" else unit)
+            case SamplerType.UNIFORM:
+                return rng.uniform(params.low, params.high, num_records)
+            case SamplerType.UUID:
+                return _sample_uuids(rng, params, num_records)
+        raise ValueError(f"🛑 Unsupported sampler type: {sampler_type}")
+
+    def _sample_people(self, params: tasks.PersonSamplerParams, num_records: int):
+        try:
+            from faker import Faker
+        except ImportError as ex:
+            raise ImportError(
+                "Sampling person columns locally requires the `faker` package. "
+                "Install it by running `pip install faker`."
+            ) from ex
+
+        locale = params.locale or "en_US"
+        if locale not in self._faker_by_locale:
+            faker = Faker(locale)
+            if self._seed is not None:
+                faker.seed_instance(self._seed)
+            self._faker_by_locale[locale] = faker
+        faker = self._faker_by_locale[locale]
+
+        rng = self._rng
+        if params.sex:
+            sexes = [_enum_value(params.sex)] * num_records
+        else:
+            sexes = rng.choice(["Male", "Female"], num_records).tolist()
+        low, high = params.age_range or (18, 114)
+        ages = rng.integers(low, high, num_records, endpoint=True)
+        cities = _choice_or_none(rng, params.city, num_records)
+        states = _choice_or_none(rng, params.state, num_records)
+        uuids = _sample_uuids(rng, tasks.UUIDSamplerParams(), num_records).tolist()
+
+        people = []
+        for i in range(num_records):
+            male = sexes[i] == "Male"
+            people.append(
+                {
+                    "first_name": (
+                        faker.first_name_male() if male else faker.first_name_female()
+                    ),
+                    "middle_name": None,
+                    "last_name": faker.last_name(),
+                    "sex": sexes[i],
+                    "age": int(ages[i]),
+                    "postcode": faker.postcode(),
+                    "street_number": faker.building_number(),
+                    "street_name": faker.street_name(),
+                    "unit": "",
+                    "city": cities[i] if cities is not None else faker.city(),
+                    "region": (
+                        states[i]
+                        if states is not None
+                        else _optional_faker_field(faker, "administrative_unit")
+                    ),
+                    "district": None,
+                    "country": _optional_faker_field(faker, "current_country"),
+                    "ethnic_background": None,
+                    "marital_status": None,
+                    "education_level": None,
+                    "bachelors_field": None,
+                    "occupation": faker.job(),
+                    "uuid": uuids[i],
+                    "locale": locale,
+                }
+            )
+        return people
+
+    def _resolve_sampling_order(self) -> list[str]:
+        """Order the columns so that each column is sampled after the columns
+        its conditions, parent category or reference datetime depend on."""
+        graph = graphlib.TopologicalSorter()
+        for name, column in self._columns.items():
+            params, conditional_params = self._params[name]
+            dependencies = set()
+            for condition in conditional_params:
+                dependencies |= _referenced_columns(condition, self._columns)
+            if isinstance(params, tasks.SubcategorySamplerParams):
+                dependencies.add(params.category)
+            if isinstance(params, tasks.TimeDeltaSamplerParams):
+                dependencies.add(params.reference_column_name)
+            dependencies.discard(name)
+
+            missing = dependencies - set(self._columns)
+            if missing:
+                raise DataDesignerValidationError(
+                    f"🛑 Sampler column `{name}` depends on undefined sampler "
+                    f"column(s) {sorted(missing)}."
+                )
+            graph.add(name, *sorted(dependencies))
+        try:
+            return list(graph.static_order())
+        except graphlib.CycleError as ex:
+            raise DataDesignerValidationError(
+                f"🛑 Sampler columns {ex.args[1]} have circular dependencies."
+            ) from ex
+
+    def _validate_constraints(self) -> None:
+        for constraint in self._constraints:
+            columns = [constraint.target_column]
+            if constraint.type == ConstraintType.COLUMN_INEQUALITY:
+                columns.append(str(constraint.params.rhs))
+            for column in columns:
+                if column not in self._columns:
+                    raise DataDesignerValidationError(
+                        f"🛑 Constraint references `{column}`, which is not a "
+                        "sampler column."
+                    )
+
+    def _satisfies_constraints(self, df: pd.DataFrame) -> np.ndarray:
+        mask = np.ones(len(df), dtype=bool)
+        for constraint in self._constraints:
+            op = _INEQUALITY_OPERATORS[InequalityOperator(constraint.params.operator)]
+            rhs = constraint.params.rhs
+            if constraint.type == ConstraintType.COLUMN_INEQUALITY:
+                rhs = df[rhs]
+            mask &= np.asarray(op(df[constraint.target_column], rhs), dtype=bool)
+        return mask
+
+
+def sample_columns(
+    columns: list[SamplerColumn],
+    num_records: int,
+    *,
+    constraints: list[ColumnConstraint] | None = None,
+    seed: int | None = None,
+    max_rejections_factor: int = DEFAULT_MAX_REJECTIONS_FACTOR,
+) -> pd.DataFrame:
+    """Sample `num_records` records of the given sampler columns locally.
+
+    Shortcut for `SamplerEngine(...).sample(num_records)`, see `SamplerEngine`
+    for a description of the arguments.
+    """
+    return SamplerEngine(
+        columns,
+        constraints,
+        seed=seed,
+        max_rejections_factor=max_rejections_factor,
+    ).sample(num_records)
+
+
+def _enum_value(value: Any) -> Any:
+    return getattr(value, "value", value)
+
+
+def _validate_params(sampler_type: SamplerType, params: Any) -> Any:
+    # Sampler params are a union of models, so pydantic may have parsed the
+    # params of a column into the model of another sampler type.
+    params_cls = PARAMS_BY_SAMPLER_TYPE.get(SamplerType(sampler_type))
+    if params_cls is None:
+        raise ValueError(
+            f"🛑 Sampler type `{_enum_value(sampler_type)}` can't be sampled locally."
+        )
+    if isinstance(params, params_cls):
+        return params
+    if isinstance(params, ConfigBase):
+        params = params.model_dump()
+    return params_cls.model_validate(params)
+
+
+def _referenced_columns(condition: str, columns: dict[str, Any]) -> set[str]:
+    return {
+        quoted or name
+        for quoted, name in _IDENTIFIER_PATTERN.findall(condition)
+        if (quoted or name) in columns
+    }
+
+
+def _evaluate_condition(df: pd.DataFrame, condition: str) -> np.ndarray:
+    try:
+        return np.asarray(df.eval(condition), dtype=bool)
+    except Exception as ex:
+        raise DataDesignerValidationError(
+            f"🛑 Could not evaluate the condition `{condition}`: {ex}"
+        ) from ex
+
+
+def _choice(
+    rng: np.random.Generator,
+    values: list,
+    weights: list[float] | None,
+    num_records: int,
+) -> np.ndarray:
+    p = None
+    if weights:
+        p = np.asarray(weights, dtype=float)
+        p = p / p.sum()
+    indices = rng.choice(len(values), size=num_records, p=p)
+    return np.asarray(values, dtype=object)[indices]
+
+
+def _choice_or_none(
+    rng: np.random.Generator, values: str | list | None, num_records: int
+) -> np.ndarray | None:
+    if not values:
+        return None
+    return _choice(
+        rng, [values] if isinstance(values, str) else values, None, num_records
+    )
+
+
+def _sample_subcategories(
+    rng: np.random.Generator,
+    params: tasks.SubcategorySamplerParams,
+    parent_values: pd.Series,
+) -> np.ndarray:
+    values = np.full(len(parent_values), None, dtype=object)
+    parents = parent_values.astype(str).to_numpy()
+    for parent, subcategories in params.values.items():
+        mask = parents == str(parent)
+        if mask.any() and subcategories:
+            values[mask] = _choice(rng, subcategories, None, int(mask.sum()))
+    return values
+
+
+def _sample_datetimes(
+    rng: np.random.Generator, params: tasks.DatetimeSamplerParams, num_records: int
+) -> np.ndarray:
+    unit = _enum_value(params.unit or "D")
+    start = pd.Timestamp(params.start).to_datetime64().astype(f"datetime64[{unit}]")
+    end = pd.Timestamp(params.end).to_datetime64().astype(f"datetime64[{unit}]")
+    if end < start:
+        raise DataDesignerValidationError(
+            f"🛑 The datetime sampler start {params.start} is after its end {params.end}."
+        )
+    offsets = rng.integers(0, (end - start).astype(int), num_records, endpoint=True)
+    return (start + offsets.astype(f"timedelta64[{unit}]")).astype("datetime64[ns]")
+
+
+def _sample_uuids(
+    rng: np.random.Generator, params: tasks.UUIDSamplerParams, num_records: int
+) -> np.ndarray:
+    # Random (version 4) UUIDs. The hex digits of all UUIDs are looked up in
+    # a single array operation, rather than formatting one UUID at a time.
+    data = rng.integers(0, 256, size=(num_records, 16), dtype=np.uint8)
+    data[:, 6] = (data[:, 6] & 0x0F) | 0x40
+    data[:, 8] = (data[:, 8] & 0x3F) | 0x80
+
+    digits = np.frombuffer(
+        b"0123456789ABCDEF" if params.uppercase else b"0123456789abcdef",
+        dtype=np.uint8,
+    )
+    hex_digits = np.empty((num_records, 32), dtype=np.uint8)
+    hex_digits[:, 0::2] = digits[data >> 4]
+    hex_digits[:, 1::2] = digits[data & 0x0F]
+
+    if params.short_form:
+        chars = hex_digits[:, :8]
+    else:
+        chars = np.full((num_records, 36), ord("-"), dtype=np.uint8)
+        for start, end, offset in _UUID_GROUPS:
+            chars[:, start + offset : end + offset] = hex_digits[:, start:end]
+
+    uuids = np.ascontiguousarray(chars).view(f"S{chars.shape[1]}").ravel()
+    uuids = uuids.astype(str)
+    if params.prefix:
+        uuids = np.char.add(params.prefix, uuids)
+    return uuids
+
+
+def _scipy_distribution(dist_name: str, dist_params: dict):
+    try:
+        from scipy import stats
+    except ImportError as ex:
+        raise ImportError(
+            "Sampling scipy distributions locally requires the `scipy` package. "
+            "Install it by running `pip install scipy`."
+        ) from ex
+
+    dist = getattr(stats, dist_name, None)
+    if dist is None:
+        raise DataDesignerValidationError(
+            f"🛑 `{dist_name}` is not a valid scipy.stats distribution."
+        )
+    return dist(**dist_params)
+
+
+def _optional_faker_field(faker: Any, field: str) -> str | None:
+    try:
+        return getattr(faker, field)()
+    except AttributeError:
+        return None
+
+
+def _convert(series: pd.Series, convert_to: str) -> pd.Series:
+    if convert_to == "int":
+        return series.round().astype("int64")
+    if convert_to == "float":
+        return series.astype(float)
+    if convert_to == "str":
+        return series.astype(str)
+    if pd.api.types.is_datetime64_any_dtype(series):
+        # Formatting is slow, so only format each distinct value once.
+        codes, uniques = pd.factorize(series)
+        formatted = np.append(uniques.strftime(convert_to).to_numpy(object), None)
+        return pd.Series(formatted[codes], index=series.index, name=series.name)
+    raise DataDesignerValidationError(
+        f"🛑 Cannot convert column `{series.name}` to `{convert_to}`."
+    )
@@ -1,4 +1,5 @@
 import collections
+import functools
 import inspect
 import json
 import re
@@ -26,15 +27,34 @@ from gretel_client.data_designer.constants import (
 )
 from gretel_client.workflows.configs import tasks
 
+_remote_configs: dict[str, str] = {}
 
-def fetch_config_if_remote(config: Any) -> str:
+
+def fetch_config_if_remote(config: Any, *, use_cache: bool = True) -> str:
+    """Return the content of a remote config, or the config itself if it isn't remote.
+
+    Remote configs are cached for the lifetime of the process, unless
+    `use_cache` is False. Use `clear_remote_config_cache` to fetch them again.
+    """
     is_remote = isinstance(config, str) and (
         config.startswith("https://gretel")
         or config.startswith("https://raw.githubusercontent.com/gretelai")
     )
-    if is_remote:
-        config = requests.get(config).content.decode("utf-8")
-    return config
+    if not is_remote:
+        return config
+    if use_cache and config in _remote_configs:
+        return _remote_configs[config]
+
+    response = requests.get(config)
+    content = response.content.decode("utf-8")
+    if response.ok:
+        _remote_configs[config] = content
+    return content
+
+
+def clear_remote_config_cache() -> None:
+    """Clear the cache of remote configs fetched by `fetch_config_if_remote`."""
+    _remote_configs.clear()
 
 
 def get_task_log_emoji(task_name: str) -> str:
@@ -53,6 +73,12 @@ def camel_to_kebab(s: str) -> str:
     return _split_camel_case(s, "-")
 
 
+def to_kebab(s: str) -> str:
+    """Convert a camel case, snake case or free text name to kebab case."""
+    s = re.sub(r"(?<=[a-z0-9])(?=[A-Z])", "-", s).lower()
+    return re.sub(r"[^a-z0-9]+", "-", s).strip("-")
+
+
 def camel_to_snake(s: str) -> str:
     return _split_camel_case(s, "_")
 
@@ -124,17 +150,44 @@ def template_error_handler():
         raise
 
 
+TEMPLATE_CACHE_SIZE = 4096
+"""Maximum number of templates whose references are cached."""
+
+# Parsing doesn't modify the environment, so a single environment is shared
+# by all templates.
+_template_environment = ImmutableSandboxedEnvironment()
+
+
+@functools.lru_cache(maxsize=TEMPLATE_CACHE_SIZE)
+def find_template_references(template: str) -> frozenset[str]:
+    """Return the variables referenced by a template.
+
+    Results are cached by template text, so validating the same templates
+    again doesn't parse them again.
+
+    Raises:
+        TemplateSyntaxError: If the template cannot be parsed.
+    """
+    return frozenset(
+        meta.find_undeclared_variables(_template_environment.parse(template))
+    )
+
+
+def clear_template_cache() -> None:
+    """Clear the cache of parsed templates."""
+    find_template_references.cache_clear()
+
+
 def assert_valid_jinja2_template(template: str) -> None:
     """Raises an error if the template cannot be parsed."""
     with template_error_handler():
-        meta.find_undeclared_variables(ImmutableSandboxedEnvironment().parse(template))
+        find_template_references(template)
 
 
 def get_prompt_template_keywords(template: str) -> set[str]:
     """Extract all keywords from a valid string template."""
     with template_error_handler():
-        ast = ImmutableSandboxedEnvironment().parse(template)
-        keywords = set(meta.find_undeclared_variables(ast))
+        keywords = set(find_template_references(template))
 
     return keywords
 
@@ -1,8 +1,6 @@
 from enum import Enum
 from string import Formatter
 
-from jinja2 import meta
-from jinja2.sandbox import ImmutableSandboxedEnvironment
 from pydantic import BaseModel
 from rich import box
 from rich.console import Console, Group
@@ -17,6 +15,7 @@ from gretel_client.data_designer.types import (
     LLMJudgeColumn,
     ModelSuite,
 )
+from gretel_client.data_designer.utils import find_template_references
 from gretel_client.workflows.configs.workflows import ModelConfig
 from gretel_client.workflows.manager import WorkflowManager
 
@@ -118,7 +117,7 @@ def rich_print_violations(violations: list[Violation]) -> None:
 
 
 def _get_string_formatter_references(
-    template: str, allowed_references: list[str]
+    template: str, allowed_references: set[str] | list[str]
 ) -> list[str]:
     return [
         k[1].strip()
@@ -131,11 +130,10 @@ def _validate_prompt_templates(
     columns: list[AIDDColumnT],
     allowed_references: list[str],
 ) -> list[Violation]:
-    env = ImmutableSandboxedEnvironment()
-
     columns_with_prompts = [
         c for c in columns if isinstance(c, (LLMGenColumn, LLMJudgeColumn))
     ]
+    allowed_references = set(allowed_references)
 
     violations = []
     for column in columns_with_prompts:
@@ -146,9 +144,8 @@ def _validate_prompt_templates(
             prompt = getattr(column, prompt_type)
 
             # check for invalid references
-            prompt_references = set()
-            prompt_references.update(meta.find_undeclared_variables(env.parse(prompt)))
-            invalid_references = list(set(prompt_references) - set(allowed_references))
+            prompt_references = set(find_template_references(prompt))
+            invalid_references = list(prompt_references - allowed_references)
             num_invalid = len(invalid_references)
             if num_invalid > 0:
                 ref_msg = (
@@ -2,6 +2,7 @@ import json
 import numbers
 
 from collections import OrderedDict
+from dataclasses import dataclass
 from typing import TYPE_CHECKING, Self
 
 import numpy as np
@@ -132,6 +133,95 @@ def create_rich_histogram_table(
     return table
 
 
+DEFAULT_MAX_CELL_LENGTH = 2_000
+"""Maximum number of characters of a cell value shown by `display_sample_record`."""
+
+
+@dataclass(frozen=True)
+class RecordRenderPlan:
+    """The columns rendered in each section of a sample record.
+
+    Deriving the sections from `AIDDMetadata` is independent of the record,
+    so a plan can be built once and reused to display any record of a dataset.
+
+    Args:
+        seed_columns: Columns of the seed dataset table.
+        generated_columns: Columns of the generated columns table.
+        code_columns: Code columns and the syntax lexer of their language.
+        validation_columns: Columns of the validation table.
+        judge_columns: Columns that get an LLM-as-a-Judge table each.
+        json_columns: Columns with JSON strings that are pretty printed. If None,
+            every string that looks like a JSON object or array is parsed.
+    """
+
+    seed_columns: tuple[str, ...] = ()
+    generated_columns: tuple[str, ...] = ()
+    code_columns: tuple[tuple[str, str], ...] = ()
+    validation_columns: tuple[str, ...] = ()
+    judge_columns: tuple[str, ...] = ()
+    json_columns: frozenset[str] | None = None
+
+    @classmethod
+    def from_metadata(
+        cls,
+        aidd_metadata: AIDDMetadata,
+        *,
+        hide_seed_columns: bool = False,
+        dataset: pd.DataFrame | None = None,
+    ) -> Self:
+        """Build the render plan of the records of a dataset.
+
+        Args:
+            aidd_metadata: Metadata of the dataset.
+            hide_seed_columns: If True, the seed columns are not rendered.
+            dataset: The dataset the records are taken from. If provided, the
+                columns holding JSON strings are detected once for all records.
+        """
+        drop_columns = set(aidd_metadata.drop_columns)
+
+        def keep(columns: list[str]) -> tuple[str, ...]:
+            return tuple(c for c in columns if c not in drop_columns)
+
+        code_columns = []
+        for num, col in enumerate(aidd_metadata.llm_code_columns):
+            if not aidd_metadata.code_langs:
+                raise ValueError(
+                    "`code_langs` must be provided when code columns are specified."
+                )
+            code_lang = aidd_metadata.code_langs[num]
+            if code_lang is None:
+                raise ValueError(
+                    "`code_lang` must be provided when code columns are specified."
+                    f"Valid options are: {', '.join([c.value for c in CodeLang])}"
+                )
+            code_columns.append((col, code_lang_to_syntax_lexer(code_lang)))
+
+        seed_columns = () if hide_seed_columns else keep(aidd_metadata.seed_columns)
+        generated_columns = keep(
+            aidd_metadata.sampler_columns
+            + aidd_metadata.expression_columns
+            + aidd_metadata.llm_text_columns
+            + aidd_metadata.llm_structured_columns
+        )
+
+        json_columns = None
+        if dataset is not None:
+            json_columns = frozenset(
+                col
+                for col in seed_columns + generated_columns
+                if col in dataset.columns and _has_json_strings(dataset[col])
+            )
+
+        return cls(
+            seed_columns=seed_columns,
+            generated_columns=generated_columns,
+            code_columns=tuple(code_columns),
+            validation_columns=keep(aidd_metadata.validation_columns),
+            judge_columns=keep(aidd_metadata.llm_judge_columns),
+            json_columns=json_columns,
+        )
+
+
 def display_sample_record(
     record: dict | pd.Series | pd.DataFrame,
     aidd_metadata: AIDDMetadata,
@@ -139,65 +229,58 @@ def display_sample_record(
     syntax_highlighting_theme: str = "dracula",
     record_index: int | None = None,
     hide_seed_columns: bool = False,
+    max_cell_length: int | None = DEFAULT_MAX_CELL_LENGTH,
+    render_plan: RecordRenderPlan | None = None,
 ):
-    if isinstance(record, (dict, pd.Series)):
-        record = pd.DataFrame([record]).iloc[0]
-    elif isinstance(record, pd.DataFrame):
+    if isinstance(record, pd.DataFrame):
         if record.shape[0] > 1:
             raise ValueError(
                 "The record must be a single record. You provided a "
                 f"DataFrame with {record.shape[0]} records."
             )
         record = record.iloc[0]
-    else:
+    elif not isinstance(record, (dict, pd.Series)):
         raise ValueError(
             "The record must be a single record in a dictionary, pandas Series, "
             f"or pandas DataFrame. You provided: {type(record)}."
         )
 
+    if render_plan is None:
+        render_plan = RecordRenderPlan.from_metadata(
+            aidd_metadata, hide_seed_columns=hide_seed_columns
+        )
+
+    def row_element(col: str):
+        parse_json = render_plan.json_columns is None or col in render_plan.json_columns
+        return _convert_to_row_element(
+            record[col], max_cell_length=max_cell_length, parse_json=parse_json
+        )
+
     table_kws = dict(show_lines=True, expand=True)
 
     render_list = []
 
-    if not hide_seed_columns and len(aidd_metadata.seed_columns) > 0:
+    if len(render_plan.seed_columns) > 0:
         table = Table(title="Seed Columns", **table_kws)
         table.add_column("Name")
         table.add_column("Value")
-        for col in aidd_metadata.seed_columns:
-            if col not in aidd_metadata.drop_columns:
-                table.add_row(col, _convert_to_row_element(record[col]))
+        for col in render_plan.seed_columns:
+            table.add_row(col, row_element(col))
         render_list.append(_pad_console_element(table))
 
-    non_code_columns = (
-        aidd_metadata.sampler_columns
-        + aidd_metadata.expression_columns
-        + aidd_metadata.llm_text_columns
-        + aidd_metadata.llm_structured_columns
-    )
-
-    if len(non_code_columns) > 0:
+    if len(render_plan.generated_columns) > 0:
         table = Table(title="Generated Columns", **table_kws)
         table.add_column("Name")
         table.add_column("Value")
-        for col in [c for c in non_code_columns if c not in aidd_metadata.drop_columns]:
-            table.add_row(col, _convert_to_row_element(record[col]))
+        for col in render_plan.generated_columns:
+            table.add_row(col, row_element(col))
         render_list.append(_pad_console_element(table))
 
-    for num, col in enumerate(aidd_metadata.llm_code_columns):
-        if not aidd_metadata.code_langs:
-            raise ValueError(
-                "`code_langs` must be provided when code columns are specified."
-            )
-        code_lang = aidd_metadata.code_langs[num]
-        if code_lang is None:
-            raise ValueError(
-                "`code_lang` must be provided when code columns are specified."
-                f"Valid options are: {', '.join([c.value for c in CodeLang])}"
-            )
+    for col, lexer in render_plan.code_columns:
         panel = Panel(
             Syntax(
-                record[col],
-                lexer=code_lang_to_syntax_lexer(code_lang),
+                _truncate(record[col], max_cell_length),
+                lexer=lexer,
                 theme=syntax_highlighting_theme,
                 word_wrap=True,
                 background_color=background_color,
@@ -207,14 +290,10 @@ def display_sample_record(
         )
         render_list.append(_pad_console_element(panel))
 
-    if len(aidd_metadata.validation_columns) > 0:
+    if len(render_plan.validation_columns) > 0:
         table = Table(title="Validation", **table_kws)
         row = []
-        for col in [
-            c
-            for c in aidd_metadata.validation_columns
-            if c not in aidd_metadata.drop_columns
-        ]:
+        for col in render_plan.validation_columns:
             value = record[col]
             if isinstance(value, numbers.Number):
                 table.add_column(col)
@@ -223,30 +302,24 @@ def display_sample_record(
                 length = len(value)
                 label = "" if length == 1 else f" (first of {length} messages)"
                 table.add_column(f"{col}{label}")
-                row.append(str(value[0]))
+                row.append(_truncate(str(value[0]), max_cell_length))
             else:
                 table.add_column(col)
-                row.append(str(value))
+                row.append(_truncate(str(value), max_cell_length))
         table.add_row(*row)
         render_list.append(_pad_console_element(table, (1, 0, 1, 0)))
 
-    if len(aidd_metadata.llm_judge_columns) > 0:
-        for col in [
-            c
-            for c in aidd_metadata.llm_judge_columns
-            if c not in aidd_metadata.drop_columns
-        ]:
-            table = Table(title=f"LLM-as-a-Judge: {col}", **table_kws)
-            row = []
-            judge = record[col]
-
-            for measure, results in judge.items():
-                table.add_column(measure)
-                row.append(
-                    f"score: {results['score']}\nreasoning: {results['reasoning']}"
-                )
-            table.add_row(*row)
-            render_list.append(_pad_console_element(table, (1, 0, 1, 0)))
+    for col in render_plan.judge_columns:
+        table = Table(title=f"LLM-as-a-Judge: {col}", **table_kws)
+        row = []
+        judge = record[col]
+
+        for measure, results in judge.items():
+            table.add_column(measure)
+            reasoning = _truncate(str(results["reasoning"]), max_cell_length)
+            row.append(f"score: {results['score']}\nreasoning: {reasoning}")
+        table.add_row(*row)
+        render_list.append(_pad_console_element(table, (1, 0, 1, 0)))
 
     if record_index is not None:
         index_label = Text(f"[index: {record_index}]", justify="center")
@@ -447,18 +520,41 @@ def display_model_suite_info(
     console.print(Group(*render_list), markup=False)
 
 
-def _convert_to_row_element(elem):
-    try:
-        elem = Pretty(json.loads(elem))
-    except (TypeError, json.JSONDecodeError):
-        pass
-    if isinstance(elem, (np.integer, np.floating, np.ndarray)):
-        elem = str(elem)
+def _convert_to_row_element(
+    elem, max_cell_length: int | None = None, parse_json: bool = True
+):
+    if parse_json and _looks_like_json(elem):
+        try:
+            elem = json.loads(elem)
+        except json.JSONDecodeError:
+            pass
+    if isinstance(elem, str):
+        elem = _truncate(elem, max_cell_length)
     elif isinstance(elem, (list, dict)):
-        elem = Pretty(elem)
+        elem = Pretty(elem, max_string=max_cell_length)
+    else:
+        elem = str(elem)
     return elem
 
 
+def _looks_like_json(elem) -> bool:
+    return isinstance(elem, str) and elem.lstrip().startswith(("{", "["))
+
+
+def _has_json_strings(values: pd.Series) -> bool:
+    if not pd.api.types.is_object_dtype(values) and not pd.api.types.is_string_dtype(
+        values
+    ):
+        return False
+    return bool(values.map(_looks_like_json).any())
+
+
+def _truncate(value: str, max_length: int | None) -> str:
+    if max_length is None or len(value) <= max_length:
+        return value
+    return f"{value[:max_length]}… [{len(value) - max_length:,} more characters]"
+
+
 def _pad_console_element(elem, padding=(1, 0, 1, 0)):
     return Padding(elem, padding)
 
@@ -3,7 +3,6 @@ from __future__ import annotations
 import gzip
 import json
 import os
-import time
 
 from abc import ABC, abstractproperty
 from ctypes import Union
@@ -19,6 +18,7 @@ from gretel_client.config import (
     get_logger,
     get_session_config,
 )
+from gretel_client.polling import AdaptivePollPolicy, resolve_poll_policy
 from gretel_client.projects.common import DataSourceTypes, RefDataTypes
 from gretel_client.projects.jobs import END_STATES, Job, Status
 from gretel_client.projects.models import Model
@@ -32,6 +32,10 @@ DEFAULT_SQS_REPORT_COLUMNS = 250
 DEFAULT_RECORD_COUNT = 5000
 DEFAULT_TEXT_RECORD_COUNT = 80
 
+REPORT_POLL_POLICY = AdaptivePollPolicy(initial=5, maximum=60)
+"""Default policy for polling report jobs, used unless the session
+configures a ``poll_policy``."""
+
 
 class ModelRunException(Exception): ...
 
@@ -125,12 +129,14 @@ class BaseReport(ABC):
     def _await_completion(self, job: Job):
         refresh_attempts = 0
         log = get_logger(__name__)
+        poller = resolve_poll_policy(job.session, REPORT_POLL_POLICY).poller()
+        last_status = None
         while True:
             exception = None
             if refresh_attempts >= 5:
                 raise ModelRunException("Lost contact with job") from exception
 
-            time.sleep(10)
+            poller.sleep()
 
             try:
                 job.refresh()
@@ -144,6 +150,9 @@ class BaseReport(ABC):
                 )
 
             status = job.status
+            if status != last_status:
+                poller.record_activity()
+                last_status = status
 
             if status == Status.COMPLETED:
                 break
@@ -1,5 +1,7 @@
+import io
 import mimetypes
 import os
+import re
 import tempfile
 
 from io import BytesIO
@@ -19,6 +21,11 @@ from gretel_client.config import (
 )
 from gretel_client.errors import check_for_error_response
 
+PARQUET_TAIL_SIZE = 64 * 1024
+"""Number of bytes fetched from the end of a Parquet file to read its footer."""
+
+_CONTENT_RANGE = re.compile(r"bytes (\d+)-(\d+)/(\d+)")
+
 
 class File(pydantic.BaseModel):
     """Represents a file that has been uploaded/interacted with in the Gretel ecosystem."""
@@ -42,6 +49,76 @@ class File(pydantic.BaseModel):
     """The purpose of the file. (i.e. dataset, pydantic model, etc.)"""
 
 
+class _RangeReader(io.RawIOBase):
+    """
+    Read-only, seekable file over HTTP that fetches byte ranges on demand.
+
+    The last ``tail`` bytes of the file are fetched eagerly with a single
+    suffix range request, so readers that only look at the end of the file,
+    such as the Parquet footer, usually need exactly one request.
+    """
+
+    def __init__(self, url: str, headers: dict, tail: int = PARQUET_TAIL_SIZE):
+        self._url = url
+        self._headers = headers
+        self._pos = 0
+
+        response = self._request(f"bytes=-{tail}")
+        if response.status_code == 206:
+            match = _CONTENT_RANGE.match(response.headers.get("Content-Range", ""))
+            if not match:
+                raise ValueError("Range response without a valid Content-Range.")
+            self._cache_start = int(match.group(1))
+            self._size = int(match.group(3))
+        else:
+            # The server ignored the range header and sent the whole file.
+            self._cache_start = 0
+            self._size = len(response.content)
+        self._cache = response.content
+
+    def _request(self, byte_range: str) -> requests.Response:
+        response = requests.get(
+            self._url, headers={**self._headers, "Range": byte_range}
+        )
+        check_for_error_response(response)
+        return response
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def tell(self) -> int:
+        return self._pos
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        if whence == io.SEEK_CUR:
+            offset += self._pos
+        elif whence == io.SEEK_END:
+            offset += self._size
+        self._pos = max(0, offset)
+        return self._pos
+
+    def read(self, size: int = -1) -> bytes:
+        end = self._size if size is None or size < 0 else self._pos + size
+        end = min(end, self._size)
+        if end <= self._pos:
+            return b""
+
+        if self._pos >= self._cache_start:
+            data = self._cache[self._pos - self._cache_start : end - self._cache_start]
+        else:
+            data = self._request(f"bytes={self._pos}-{end - 1}").content
+        self._pos += len(data)
+        return data
+
+    def readinto(self, buffer) -> int:
+        data = self.read(len(buffer))
+        buffer[: len(data)] = data
+        return len(data)
+
+
 class FileClient:
     """
     A client for interacting with files in the Gretel ecosystem.
@@ -179,6 +256,48 @@ class FileClient:
 
         return df
 
+    def get_dataset_schema(self, file_id: str) -> pyarrow.Schema:
+        """
+        Get the schema of a dataset without downloading the whole dataset.
+
+        Only the footer of the Parquet file is fetched with HTTP range
+        requests, so the cost does not depend on the size of the dataset.
+        If the server does not support range requests, the whole file is
+        downloaded instead.
+
+        Args:
+            file_id: The unique identifier of the dataset file.
+
+        Raises:
+            ValueError: If the file is not a parquet file.
+        """
+        reader = _RangeReader(
+            f"{self.api_endpoint}/v1/files/{file_id}/download",
+            headers={"Authorization": self.session.api_key},
+        )
+        try:
+            return pyarrow.parquet.read_schema(reader)
+        except Exception as exc:
+            raise ValueError(
+                "Error loading dataset schema from parquet. Are you sure this was a dataset file?"
+            ) from exc
+
+    def get_dataset_columns(self, file_id: str) -> list[str]:
+        """
+        Get the column names of a dataset without downloading the whole dataset.
+
+        The names match the columns of the DataFrame returned by
+        ``download_dataset``, i.e. a stored pandas index is not included.
+
+        Args:
+            file_id: The unique identifier of the dataset file.
+
+        Raises:
+            ValueError: If the file is not a parquet file.
+        """
+        schema = self.get_dataset_schema(file_id)
+        return schema.empty_table().to_pandas().columns.tolist()
+
     def delete(self, file_id: str) -> None:
         """
         Delete a file from Gretel.
@@ -11,7 +11,6 @@ import logging
 import re
 import sys
 import tempfile
-import time
 
 from pathlib import Path
 from typing import TYPE_CHECKING, Optional, Union
@@ -28,6 +27,7 @@ from gretel_client.fine_tuning.base import (
     OpenAIFineTuneJob,
 )
 from gretel_client.fine_tuning.formatters import OpenAIFormatter
+from gretel_client.polling import AdaptivePollPolicy, PollPolicy
 
 if TYPE_CHECKING:
     from openai import AzureOpenAI
@@ -64,20 +64,26 @@ class OpenAIFineTuner(BaseFineTuner):
             the provided `formatter` and uploaded to the OpenAI service.
         checkpoint: The path for a checkpoint file that can be used to restore the metadata for a previous
             fine-tuning instance.
+        poll_policy: Controls how often the OpenAI service is polled while waiting on files and
+            fine-tuning jobs.
     """
 
     _client: AzureOpenAI
     formatter: Optional[OpenAIFormatter]  # type: ignore
+    poll_policy: PollPolicy = AdaptivePollPolicy(initial=5, maximum=60)
 
     def __init__(
         self,
         *,
         openai_client: AzureOpenAI,
         formatter: Optional[OpenAIFormatter] = None,
+        poll_policy: Optional[PollPolicy] = None,
         **kwargs,
     ):
         super().__init__(formatter=formatter, **kwargs)
         self._client = openai_client
+        if poll_policy is not None:
+            self.poll_policy = poll_policy
 
     def prepare_and_upload_data(self, wait: bool = True) -> None:
         """
@@ -237,12 +243,14 @@ class OpenAIFineTuner(BaseFineTuner):
         else:
             logger.info("🕒 Waiting for training file to be ready.")
 
-        stop_at = time.time() + timeout_seconds
-        while time.time() < stop_at:
+        poller = self.poll_policy.poller(timeout_seconds)
+        while True:
             if self.update_file_status(verbose=False):
                 logger.info("✅ Files are ready.")
                 return
-            time.sleep(5)
+            if poller.expired:
+                break
+            poller.sleep()
 
         raise TimeoutError("Timed out waiting for files to be ready.")
 
@@ -430,6 +438,7 @@ class OpenAIFineTuner(BaseFineTuner):
         # Each call to this method will log every event seen so far
         last_event_idx = 0
 
+        poller = self.poll_policy.poller()
         while True:
             is_done = self.update_fine_tune_job_status(verbose=False)
             if checkpoint_save_path is not None:
@@ -437,6 +446,7 @@ class OpenAIFineTuner(BaseFineTuner):
             for event in self.checkpoint.open_ai_fine_tune_job_events[last_event_idx:]:
                 logger.info(f"📅 {event.created_at_str}: {event.message}")
                 last_event_idx += 1
+                poller.record_activity()
             if is_done:
                 logger.info("✅ Fine-tuning job completed.")
                 return
@@ -447,7 +457,7 @@ class OpenAIFineTuner(BaseFineTuner):
                 logger.info("❌ Fine-tuning job did not complete.")
                 return
 
-            time.sleep(5)
+            poller.sleep()
 
     def graph_training_metrics(self) -> None:
         """
@@ -5,12 +5,21 @@ import sys
 import warnings
 import weakref
 
-from typing import Optional, Tuple
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Iterable, Iterator, List, Optional, Tuple, Union
 
 from gretel_client.config import ClientConfig, get_logger, get_session_config
 from gretel_client.models.config import get_model_type_config, get_status_description
+from gretel_client.polling import PollPolicy, resolve_poll_policy
 from gretel_client.projects.common import WAIT_UNTIL_DONE
-from gretel_client.projects.jobs import Job, WaitTimeExceeded
+from gretel_client.projects.jobs import (
+    END_STATES,
+    JOB_POLL_POLICY,
+    Job,
+    LogStatus,
+    Status,
+    WaitTimeExceeded,
+)
 from gretel_client.projects.models import Model
 from gretel_client.projects.records import RecordHandler
 
@@ -43,41 +52,130 @@ def _is_generating(log: dict) -> bool:
     return log.get("stage") == "run" and "current_valid_count" in log.get("ctx", dict())
 
 
-def _verbose_poll(job: Job, wait: int):
+class _ProgressLine:
+    """Tracks which printer owns the progress bar on the current terminal
+    line, so the bars of several jobs polled together stack on separate
+    lines instead of overwriting each other."""
+
+    def __init__(self):
+        self.owner = None
+
+    def update(self, owner: object, current: int, total: int, prefix: str, suffix: str):
+        if self.owner is not None and self.owner is not owner:
+            print()
+        self.owner = owner
+        _progress_bar(current, total, prefix, suffix)
+
+    def end(self):
+        if self.owner is not None:
+            print()
+            self.owner = None
+
+
+class _VerbosePrinter:
+    """Prints status transitions and full log lines of a job to stderr."""
+
+    def __init__(self, job: Job, prefix: str = ""):
+        self.job = job
+        self.prefix = prefix
+        self.descriptions = get_description_set(job)
+        if not self.descriptions:
+            raise ValueError("Cannot fetch Job polling descriptions")
+
+    def print_update(self, update: LogStatus):
+        if update.transitioned:
+            _stderr_print(
+                f"{self.prefix}INFO: Status is {update.status}. {get_status_description(self.descriptions, update.status, self.job.runner_mode)}"
+            )
+        for log in update.logs:
+            msg = f"{self.prefix}{log['ts']}  {log['msg']}"
+            if log["ctx"]:
+                msg += f"\n{json.dumps(log['ctx'], indent=4)}"
+            _stderr_print(msg)
+        if update.error:
+            _stderr_print(f"{self.prefix}ERROR: \t{update.error}")
+
+
+class _QuietPrinter:
+    """Prints training and generation progress bars and short log messages."""
+
+    def __init__(
+        self,
+        num_epochs: Optional[int] = None,
+        num_records: Optional[int] = None,
+        prefix: str = "",
+        progress: Optional[_ProgressLine] = None,
+    ):
+        self.num_epochs = num_epochs
+        self.num_records = num_records
+        self.prefix = prefix
+        self.progress = progress or _ProgressLine()
+
+    def print_update(self, update: LogStatus):
+        for log in update.logs:
+            if _is_training(log) and self.num_epochs:
+                self.progress.update(
+                    self,
+                    log["ctx"]["epoch"],
+                    self.num_epochs,
+                    f"{self.prefix}Training: ",
+                    " epochs.",
+                )
+            elif _is_generating(log) and self.num_records:
+                self.progress.update(
+                    self,
+                    log["ctx"]["current_valid_count"],
+                    self.num_records,
+                    f"{self.prefix}Generating: ",
+                    " records.",
+                )
+            elif "Using updated model configuration" in log["msg"]:
+                continue
+            else:
+                self.progress.end()
+                print(
+                    f"{self.prefix}{log['msg']}",
+                    (
+                        ", ".join(f"{k} {v}" for k, v in log["ctx"].items())
+                        if log["ctx"]
+                        else ""
+                    ),
+                )
+                if log["stage"] == "pre_run" and not self.num_records:
+                    if "num_records" in log["ctx"]:
+                        self.num_records = log["ctx"]["num_records"]
+                if log["stage"] == "pre" and not self.num_epochs:
+                    if "num_epochs" in log["ctx"]:
+                        self.num_epochs = log["ctx"]["num_epochs"]
+
+
+def _print_wait_exceeded(wait: int, subject: str = "Job hasn't"):
+    if wait == 0:
+        _stderr_print(
+            "INFO: Parameter wait=0 was specified, not waiting for the job completion."
+        )
+    else:
+        _stderr_print(
+            f"WARN: {subject} completed after waiting for {wait} seconds. Exiting the script, but the job will remain running until it reaches the end state."
+        )
+
+
+def _verbose_poll(job: Job, wait: int, poll_policy: Optional[PollPolicy] = None):
     """Polls a ``Model`` or ``RecordHandler``.
 
     Args:
         job: The job to poll.
         wait: The time to wait for the job to complete.
+        poll_policy: Controls the time between polls.
     """
     _stderr_print("INFO: Starting poller")
-    descriptions = get_description_set(job)
-    if not descriptions:
-        raise ValueError("Cannot fetch Job polling descriptions")
+    printer = _VerbosePrinter(job)
     print(json.dumps(job.print_obj, indent=4))
     try:
-        for update in job.poll_logs_status(wait=wait):
-            if update.transitioned:
-                _stderr_print(
-                    f"INFO: Status is {update.status}. {get_status_description(descriptions, update.status, job.runner_mode)}"
-                )
-            for log in update.logs:
-                msg = f"{log['ts']}  {log['msg']}"
-                if log["ctx"]:
-                    msg += f"\n{json.dumps(log['ctx'], indent=4)}"
-                _stderr_print(msg)
-            if update.error:
-                _stderr_print(f"ERROR: \t{update.error}")
-
+        for update in job.poll_logs_status(wait=wait, poll_policy=poll_policy):
+            printer.print_update(update)
     except WaitTimeExceeded:
-        if wait == 0:
-            _stderr_print(
-                "INFO: Parameter wait=0 was specified, not waiting for the job completion."
-            )
-        else:
-            _stderr_print(
-                f"WARN: Job hasn't completed after waiting for {wait} seconds. Exiting the script, but the job will remain running until it reaches the end state."
-            )
+        _print_wait_exceeded(wait)
 
 
 def _quiet_poll(
@@ -85,6 +183,7 @@ def _quiet_poll(
     wait: int,
     num_epochs: Optional[int] = None,
     num_records: Optional[int] = None,
+    poll_policy: Optional[PollPolicy] = None,
 ):
     """Polls a ``Model`` or ``RecordHandler`` .
 
@@ -93,54 +192,14 @@ def _quiet_poll(
         wait: The time to wait for the job to complete.
         num_epochs: Number of training epochs.
         num_records: Number of text outputs to generate.
+        poll_policy: Controls the time between polls.
     """
-    pr_bar = False
+    printer = _QuietPrinter(num_epochs, num_records)
     try:
-        for update in job.poll_logs_status(wait=wait):
-            for log in update.logs:
-                if _is_training(log) and num_epochs:
-                    _progress_bar(
-                        log["ctx"]["epoch"], num_epochs, "Training: ", " epochs."
-                    )
-                    pr_bar = True
-                elif _is_generating(log) and num_records:
-                    _progress_bar(
-                        log["ctx"]["current_valid_count"],
-                        num_records,
-                        "Generating: ",
-                        " records.",
-                    )
-                    pr_bar = True
-                elif "Using updated model configuration" in log["msg"]:
-                    continue
-                else:
-                    if pr_bar:
-                        print()
-                        pr_bar = False
-                    print(
-                        log["msg"],
-                        (
-                            ", ".join(f"{k} {v}" for k, v in log["ctx"].items())
-                            if log["ctx"]
-                            else ""
-                        ),
-                    )
-                    if log["stage"] == "pre_run" and not num_records:
-                        if "num_records" in log["ctx"]:
-                            num_records = log["ctx"]["num_records"]
-                    if log["stage"] == "pre" and not num_epochs:
-                        if "num_epochs" in log["ctx"]:
-                            num_epochs = log["ctx"]["num_epochs"]
-
+        for update in job.poll_logs_status(wait=wait, poll_policy=poll_policy):
+            printer.print_update(update)
     except WaitTimeExceeded:
-        if wait == 0:
-            _stderr_print(
-                "INFO: Parameter wait=0 was specified, not waiting for the job completion."
-            )
-        else:
-            _stderr_print(
-                f"WARN: Job hasn't completed after waiting for {wait} seconds. Exiting the script, but the job will remain running until it reaches the end state."
-            )
+        _print_wait_exceeded(wait)
 
 
 def _get_quiet_poll_context(job: Job) -> Tuple[Optional[int], Optional[int]]:
@@ -171,7 +230,12 @@ def _get_quiet_poll_context(job: Job) -> Tuple[Optional[int], Optional[int]]:
     return num_epochs, num_records
 
 
-def poll(job: Job, wait: int = WAIT_UNTIL_DONE, verbose: bool = True) -> None:
+def poll(
+    job: Job,
+    wait: int = WAIT_UNTIL_DONE,
+    verbose: bool = True,
+    poll_policy: Optional[PollPolicy] = None,
+) -> None:
     """
         Polls a ``Model`` or ``RecordHandler``.
 
@@ -179,12 +243,178 @@ def poll(job: Job, wait: int = WAIT_UNTIL_DONE, verbose: bool = True) -> None:
         job: The job to poll.
         wait: The time to wait for the job to complete.
         verbose: ``False`` uses new quiet polling, defaults to ``True``.
+        poll_policy: Controls the time between polls. Defaults to the
+            policy configured for the job's session.
     """
     if verbose:
-        _verbose_poll(job, wait)
+        _verbose_poll(job, wait, poll_policy)
     else:
         num_epochs, num_records = _get_quiet_poll_context(job)
-        _quiet_poll(job, wait, num_epochs, num_records)
+        _quiet_poll(job, wait, num_epochs, num_records, poll_policy)
+
+
+MAX_POLL_ERRORS = 5
+"""Number of polls of a job in a row that may fail before ``poll_many``
+stops polling the job."""
+
+
+class _JobPollState:
+    """Tracks the progress of one job polled by ``poll_many``."""
+
+    def __init__(self, job: Job, printer: Union[_VerbosePrinter, _QuietPrinter]):
+        self.job = job
+        self.printer = printer
+        self.status: Optional[Status] = None
+        self.done = False
+        self.error: Optional[Exception] = None
+        """The error of the last poll, if it failed."""
+        self.num_errors = 0
+        """Number of polls in a row that failed."""
+
+    @property
+    def failed(self) -> bool:
+        return self.num_errors >= MAX_POLL_ERRORS
+
+    def poll_safely(self) -> List[LogStatus]:
+        """Like ``poll``, but records an error instead of raising it."""
+        try:
+            updates = self.poll()
+        except Exception as ex:
+            self.error = ex
+            self.num_errors += 1
+            return []
+        self.error = None
+        self.num_errors = 0
+        return updates
+
+    def poll(self) -> List[LogStatus]:
+        """Refresh the job and return the updates since the previous poll.
+
+        Mirrors the updates produced by ``Job.poll_logs_status``.
+        """
+        job = self.job
+        job._poll_job_endpoint(incremental_logs=True)
+        logs = job._new_job_logs()
+        updates = []
+        if job.status in END_STATES:
+            self.done = True
+            if logs and self.status:
+                updates.append(LogStatus(status=self.status, logs=logs))
+            error = job.errors if job.status == Status.ERROR else None
+            updates.append(LogStatus(status=job.status, error=error))
+        elif job.status != self.status or logs:
+            transitioned = job.status != self.status
+            self.status = job.status
+            updates.append(
+                LogStatus(status=job.status, logs=logs, transitioned=transitioned)
+            )
+        return updates
+
+
+def poll_many(
+    jobs: Iterable[Job],
+    wait: int = WAIT_UNTIL_DONE,
+    verbose: bool = True,
+    callback: Optional[Callable[[], None]] = None,
+    max_concurrency: int = 8,
+    poll_policy: Optional[PollPolicy] = None,
+) -> Iterator[Job]:
+    """
+    Polls many ``Model`` or ``RecordHandler`` jobs at once.
+
+    Status checks for all jobs are driven by a single scheduler, with up to
+    ``max_concurrency`` checks in flight at a time. Updates of every job are
+    printed as they arrive, prefixed with the job id, and progress bars of
+    different jobs are printed on separate lines.
+
+    Jobs are yielded as they reach an end state, in the order they finish,
+    similar to ``concurrent.futures.as_completed``. No polling happens until
+    the iterator is consumed::
+
+        for job in poll_many(record_handlers, verbose=False):
+            print(job.id, job.status)
+
+    Args:
+        jobs: The jobs to poll.
+        wait: The time in seconds to wait for all jobs to complete. If the
+            wait time is exceeded, jobs that are still running are not
+            yielded. If wait is -1 (WAIT_UNTIL_DONE), polls until every job
+            has reached an end state.
+        verbose: ``False`` uses quiet polling, defaults to ``True``.
+        callback: This function will be executed on every polling loop.
+        max_concurrency: Maximum number of jobs refreshed concurrently.
+        poll_policy: Controls the time between polling loops. Defaults to the
+            policy configured for the session of the first job.
+
+    Raises:
+        ``ExceptionGroup`` once every other job is done, if any job could not
+        be refreshed ``MAX_POLL_ERRORS`` times in a row. Jobs are polled
+        independently, so one job failing to refresh doesn't stop the
+        others from being polled.
+    """
+    states = []
+    progress = _ProgressLine()
+    for job in jobs:
+        prefix = f"[{job.id}] "
+        if verbose:
+            printer = _VerbosePrinter(job, prefix)
+        else:
+            num_epochs, num_records = _get_quiet_poll_context(job)
+            printer = _QuietPrinter(num_epochs, num_records, prefix, progress)
+        states.append(_JobPollState(job, printer))
+    if not states:
+        return
+
+    if verbose:
+        _stderr_print(f"INFO: Starting poller for {len(states)} jobs")
+    poll_policy = poll_policy or resolve_poll_policy(
+        states[0].job.session, JOB_POLL_POLICY
+    )
+    poller = poll_policy.poller(wait)
+    failed: List[_JobPollState] = []
+
+    with ThreadPoolExecutor(max_workers=max_concurrency) as pool:
+        while states:
+            if callback:
+                callback()
+            # Refresh all jobs concurrently, but print and yield from the
+            # scheduler so output of different jobs doesn't interleave
+            # mid-line.
+            # Errors are recorded per job, so one job failing to refresh
+            # doesn't stop the others from being polled.
+            polls = pool.map(_JobPollState.poll_safely, states)
+            for state, updates in zip(states, polls):
+                for update in updates:
+                    if update.logs or update.transitioned:
+                        poller.record_activity()
+                    state.printer.print_update(update)
+                if state.error:
+                    progress.end()
+                    _stderr_print(
+                        f"{state.printer.prefix}WARN: Could not refresh the job "
+                        f"({state.num_errors}/{MAX_POLL_ERRORS}): {state.error}"
+                    )
+            failed.extend(state for state in states if state.failed)
+            finished = [state for state in states if state.done]
+            states = [state for state in states if not (state.done or state.failed)]
+            for state in finished:
+                progress.end()
+                yield state.job
+
+            if not states:
+                break
+            if poller.expired:
+                progress.end()
+                _print_wait_exceeded(wait, f"{len(states)} jobs haven't")
+                break
+            poller.sleep()
+
+    if failed:
+        raise ExceptionGroup(
+            f"Could not poll {len(failed)} jobs: "
+            f"{', '.join(state.job.id for state in failed)}",
+            [state.error for state in failed],
+        )
 
 
 def get_description_set(job: Job) -> Optional[dict]:
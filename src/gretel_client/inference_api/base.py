@@ -7,6 +7,7 @@ from enum import Enum
 from typing import Any, Dict, List, Optional
 
 from gretel_client.config import ClientConfig, configure_session, get_session_config
+from gretel_client.polling import resolve_poll_policy
 from gretel_client.rest.api_client import ApiClient
 
 MODELS_API_PATH = "/v1/inference/models"
@@ -168,6 +169,7 @@ class BaseInferenceAPI(ABC):
                 f"is configured to: {session.default_runner}"
             )
         self.endpoint = session.endpoint
+        self._poll_policy = resolve_poll_policy(session)
         self._api_client = session._get_api_client(verify_ssl=verify_ssl)
         self._available_backend_models = get_full_navigator_model_list(self._api_client)
         self._response_metadata = {}
@@ -13,6 +13,7 @@ from gretel_client.dataframe import _DataFrameT
 from gretel_client.gretel.artifact_fetching import PANDAS_IS_INSTALLED
 from gretel_client.gretel.config_setup import NavigatorDefaultParams
 from gretel_client.inference_api.base import BaseInferenceAPI, GretelInferenceAPIError
+from gretel_client.polling import AdaptivePollPolicy
 
 if PANDAS_IS_INSTALLED:
     import pandas as pd
@@ -22,7 +23,7 @@ logger.propagate = False
 logger.addHandler(logging.StreamHandler(sys.stdout))
 logger.setLevel(logging.INFO)
 
-STREAM_SLEEP_TIME = 0.5
+STREAM_POLL_POLICY = AdaptivePollPolicy(initial=0.5, maximum=5)
 MAX_ROWS_PER_STREAM = 100
 REQUEST_TIMEOUT_SEC = 60
 TABULAR_API_PATH = "/v1/inference/tabular/"
@@ -183,6 +184,7 @@ class TabularInferenceAPI(BaseInferenceAPI):
 
         attempt_count = 0
         response_metadata: dict = {}
+        poller = (self._poll_policy or STREAM_POLL_POLICY).poller()
 
         # Keep going until we've given the user all their records and the most recent
         # stream has been closed. We need to ensure the last stream is closed because
@@ -215,6 +217,8 @@ class TabularInferenceAPI(BaseInferenceAPI):
             if (data_list := resp.get("data")) is None:
                 logger.warning("No data returned from stream.")
                 continue
+            if data_list:
+                poller.record_activity()
 
             # Iterate over the records in the stream.
             for record in data_list:
@@ -277,7 +281,7 @@ class TabularInferenceAPI(BaseInferenceAPI):
                     )
                 self._curr_stream_id = None
 
-            time.sleep(STREAM_SLEEP_TIME)
+            poller.sleep()
 
     def _get_stream_results(
         self,
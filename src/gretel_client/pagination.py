@@ -0,0 +1,102 @@
+"""
+Iterators over offset paginated API endpoints.
+
+Listing endpoints of the Gretel API return results a page at a time and are
+paged with ``skip`` and ``limit`` query parameters. ``paginate`` turns such
+an endpoint into a flat iterator over its items, and fetches the next page
+in the background while the current page is consumed::
+
+    handlers = paginate(
+        lambda skip, limit: api.query_record_handlers(skip=skip, limit=limit)
+        .get("data")
+        .get("handlers"),
+        page_size=100,
+    )
+"""
+
+from __future__ import annotations
+
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Hashable, Iterator, Optional, Sequence, TypeVar
+
+T = TypeVar("T")
+
+DEFAULT_PAGE_SIZE = 100
+"""Number of items requested per page when no page size is given."""
+
+FetchPage = Callable[[int, int], Sequence[T]]
+"""Callable that takes ``(skip, limit)`` and returns the items of a page."""
+
+
+def paginate(
+    fetch_page: FetchPage[T],
+    *,
+    page_size: int = DEFAULT_PAGE_SIZE,
+    limit: Optional[int] = None,
+    skip: int = 0,
+    prefetch: bool = True,
+    key: Optional[Callable[[T], Hashable]] = None,
+) -> Iterator[T]:
+    """
+    Iterate over the items of an offset paginated endpoint.
+
+    Iteration stops once the endpoint returns a page with fewer items than
+    requested, or once ``limit`` items have been returned. The endpoint must
+    therefore return full pages of up to ``page_size`` items.
+
+    Args:
+        fetch_page: Callable that takes ``(skip, limit)`` and returns the
+            items of the page.
+        page_size: Number of items to request per page.
+        limit: Maximum number of items to return. ``None`` returns every item.
+        skip: Number of items to skip before the first page.
+        prefetch: If ``True``, the next page is requested on a background
+            thread while the items of the current page are consumed.
+        key: Optional callable returning a unique key of an item. When given,
+            iteration also stops on a page that only holds items that were
+            already returned. This guards against endpoints that ignore
+            ``skip`` and return the same page over and over.
+
+    Raises:
+        ``ValueError`` if ``page_size`` is not positive.
+    """
+    if page_size < 1:
+        raise ValueError("page_size must be at least 1.")
+
+    executor = ThreadPoolExecutor(max_workers=1) if prefetch else None
+    seen = set()
+
+    def schedule(offset: int) -> Optional[tuple[int, Callable[[], Sequence[T]]]]:
+        # Returns the number of requested items and a callable that waits for
+        # the page at ``offset``, or ``None`` once ``limit`` items have been
+        # requested.
+        remaining = None if limit is None else limit - (offset - skip)
+        if remaining is not None and remaining <= 0:
+            return None
+        count = page_size if remaining is None else min(page_size, remaining)
+        if executor:
+            return count, executor.submit(fetch_page, offset, count).result
+        return count, lambda: fetch_page(offset, count)
+
+    try:
+        offset = skip
+        next_page = schedule(offset)
+        while next_page is not None:
+            count, wait = next_page
+            page = list(wait() or [])
+            if not page:
+                return
+            offset += len(page)
+            # a short page is the last one, there is no need to request more
+            next_page = schedule(offset) if len(page) >= count else None
+
+            if key:
+                keys = [key(item) for item in page]
+                if seen.issuperset(keys):
+                    return
+                seen.update(keys)
+
+            yield from page
+    finally:
+        if executor:
+            executor.shutdown(wait=False, cancel_futures=True)
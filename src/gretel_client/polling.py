@@ -0,0 +1,258 @@
+"""
+Policies that control how often the client polls the Gretel API while
+waiting on long running work such as model training, report generation or
+workflow runs.
+
+A ``PollPolicy`` only decides how long to wait between two polls. The state
+of a single polling loop (number of polls, time of the last observed
+activity, deadline) is tracked by a ``Poller`` created from the policy::
+
+    poller = policy.poller(timeout=wait)
+    while not poller.expired:
+        if check_for_updates():
+            poller.record_activity()
+        poller.sleep()
+
+A policy can be configured for every polling loop of a session with
+``configure_session(poll_policy=...)``. When no policy is configured, each
+loop falls back to an ``AdaptivePollPolicy`` tuned for the endpoint it polls.
+"""
+
+from __future__ import annotations
+
+import random
+import time
+
+from abc import ABC, abstractmethod
+from typing import TYPE_CHECKING, Optional, Protocol
+
+if TYPE_CHECKING:
+    from gretel_client.config import ClientConfig
+
+
+class Clock(Protocol):
+    """Source of time used by a ``Poller``. Tests may substitute a fake clock."""
+
+    def monotonic(self) -> float: ...
+
+    def sleep(self, seconds: float) -> None: ...
+
+
+class SystemClock:
+    """A ``Clock`` backed by the ``time`` module."""
+
+    def monotonic(self) -> float:
+        return time.monotonic()
+
+    def sleep(self, seconds: float) -> None:
+        time.sleep(seconds)
+
+
+class PollPolicy(ABC):
+    """Determines the time to wait between two polls."""
+
+    @abstractmethod
+    def interval(self, attempt: int, idle_polls: int) -> float:
+        """
+        Return the number of seconds to wait before the next poll.
+
+        Args:
+            attempt: The number of polls made so far by the loop.
+            idle_polls: The number of consecutive polls since the loop last
+                observed activity, such as new log lines or a status change.
+        """
+        ...
+
+    def poller(
+        self, timeout: Optional[float] = None, clock: Optional[Clock] = None
+    ) -> Poller:
+        """
+        Create a ``Poller`` to drive a single polling loop with this policy.
+
+        Args:
+            timeout: Optional time in seconds after which the poller expires.
+                ``None`` or a negative value means the poller never expires.
+            clock: Clock used to measure and wait. Defaults to the system clock.
+        """
+        return Poller(self, timeout=timeout, clock=clock)
+
+
+class FixedPollPolicy(PollPolicy):
+    """
+    Polls at a constant interval.
+
+    Args:
+        seconds: Time to wait between two polls.
+    """
+
+    def __init__(self, seconds: float):
+        self.seconds = seconds
+
+    def interval(self, attempt: int, idle_polls: int) -> float:
+        return self.seconds
+
+    def __repr__(self) -> str:
+        return f"FixedPollPolicy(seconds={self.seconds})"
+
+
+class ExponentialPollPolicy(PollPolicy):
+    """
+    Grows the interval exponentially with every poll, up to a maximum.
+
+    Args:
+        initial: Interval before the second poll.
+        maximum: Upper bound of the interval.
+        multiplier: Factor applied to the interval after every poll.
+        jitter: Fraction of the interval that is randomized, to avoid many
+            clients polling in lockstep. ``0.1`` spreads intervals by +/-10%.
+        seed: Optional seed for the jitter, useful for deterministic tests.
+    """
+
+    def __init__(
+        self,
+        initial: float = 1.0,
+        maximum: float = 30.0,
+        multiplier: float = 2.0,
+        jitter: float = 0.1,
+        seed: Optional[int] = None,
+    ):
+        if initial <= 0 or maximum < initial:
+            raise ValueError("Expected 0 < initial <= maximum.")
+        if multiplier < 1:
+            raise ValueError("multiplier must be at least 1.")
+        if not 0 <= jitter < 1:
+            raise ValueError("jitter must be in [0, 1).")
+        self.initial = initial
+        self.maximum = maximum
+        self.multiplier = multiplier
+        self.jitter = jitter
+        self._random = random.Random(seed)
+
+    def _backoff(self, step: int) -> float:
+        # Bound the exponent so large step counts can't overflow.
+        interval = min(self.maximum, self.initial * self.multiplier ** min(step, 64))
+        if self.jitter:
+            interval *= self._random.uniform(1 - self.jitter, 1 + self.jitter)
+        return min(interval, self.maximum)
+
+    def interval(self, attempt: int, idle_polls: int) -> float:
+        return self._backoff(attempt)
+
+    def __repr__(self) -> str:
+        return (
+            f"{type(self).__name__}(initial={self.initial}, maximum={self.maximum}, "
+            f"multiplier={self.multiplier}, jitter={self.jitter})"
+        )
+
+
+class AdaptivePollPolicy(ExponentialPollPolicy):
+    """
+    Backs off exponentially while nothing happens, and drops back to the
+    initial interval as soon as the loop observes activity.
+
+    This keeps the request volume low while a job sits in a queue, and
+    reacts quickly once the job starts producing logs or changes state.
+    Accepts the same arguments as ``ExponentialPollPolicy``.
+    """
+
+    def interval(self, attempt: int, idle_polls: int) -> float:
+        return self._backoff(idle_polls)
+
+
+class DeadlinePollPolicy(PollPolicy):
+    """
+    Wraps another policy and expires its pollers after a fixed time.
+
+    Args:
+        policy: The policy used to compute intervals.
+        timeout: Time in seconds after which pollers expire. If a poller is
+            created with a shorter timeout, the shorter one wins.
+    """
+
+    def __init__(self, policy: PollPolicy, timeout: float):
+        self.policy = policy
+        self.timeout = timeout
+
+    def interval(self, attempt: int, idle_polls: int) -> float:
+        return self.policy.interval(attempt, idle_polls)
+
+    def poller(
+        self, timeout: Optional[float] = None, clock: Optional[Clock] = None
+    ) -> Poller:
+        if timeout is None or timeout < 0:
+            timeout = self.timeout
+        return Poller(self, timeout=min(timeout, self.timeout), clock=clock)
+
+    def __repr__(self) -> str:
+        return f"DeadlinePollPolicy(policy={self.policy!r}, timeout={self.timeout})"
+
+
+class Poller:
+    """
+    Tracks the state of a single polling loop.
+
+    Sleeps are always capped at the time remaining until the deadline, so
+    the last poll happens right at the deadline rather than after it.
+    """
+
+    def __init__(
+        self,
+        policy: PollPolicy,
+        timeout: Optional[float] = None,
+        clock: Optional[Clock] = None,
+    ):
+        self.policy = policy
+        self._clock = clock or SystemClock()
+        self._start = self._clock.monotonic()
+        self._deadline = (
+            None if timeout is None or timeout < 0 else self._start + timeout
+        )
+        self.attempt = 0
+        self.idle_polls = 0
+
+    @property
+    def elapsed(self) -> float:
+        """Seconds since the poller was created."""
+        return self._clock.monotonic() - self._start
+
+    @property
+    def remaining(self) -> Optional[float]:
+        """Seconds until the deadline, or ``None`` if there is no deadline."""
+        if self._deadline is None:
+            return None
+        return max(0.0, self._deadline - self._clock.monotonic())
+
+    @property
+    def expired(self) -> bool:
+        """``True`` once the deadline has passed."""
+        return self.remaining == 0
+
+    def record_activity(self) -> None:
+        """Signal that the last poll observed progress."""
+        self.idle_polls = 0
+
+    def next_interval(self) -> float:
+        """Return the time the next call to ``sleep`` will wait for."""
+        interval = max(0.0, self.policy.interval(self.attempt, self.idle_polls))
+        remaining = self.remaining
+        if remaining is not None:
+            interval = min(interval, remaining)
+        return interval
+
+    def sleep(self) -> None:
+        """Wait until the next poll is due."""
+        interval = self.next_interval()
+        self.attempt += 1
+        self.idle_polls += 1
+        self._clock.sleep(interval)
+
+
+def resolve_poll_policy(
+    session: Optional[ClientConfig], default: Optional[PollPolicy] = None
+) -> Optional[PollPolicy]:
+    """
+    Return the poll policy configured for the session, or ``default`` if the
+    session doesn't configure one.
+    """
+    policy = getattr(session, "poll_policy", None)
+    return policy if isinstance(policy, PollPolicy) else default
@@ -131,6 +131,7 @@ class f:
     MODEL_KEY = "model_key"
     WORKER_KEY = "worker_key"
     LOGS = "logs"
+    LOGS_OFFSET = "logs_offset"
     MODEL = "model"
     RUNNER_MODE = "runner_mode"
     CONTAINER_IMAGE = "container_image"
@@ -0,0 +1,527 @@
+"""
+Opt-in local index of project, model and record handler metadata.
+
+Scripts that resolve the same project or model names over and over pay a
+round trip to the Gretel API for every lookup. When the index is enabled,
+metadata fetched by ``get_project``, ``search_projects``,
+``Project.search_models`` and ``Model.get_record_handlers`` is recorded in a
+SQLite database in the Gretel cache directory, and lookups are answered
+locally while the recorded entries are fresher than the index TTL.
+
+The index is disabled by default. Enable it for a session with
+``configure_metadata_index(enabled=True)`` or by setting the
+``GRETEL_METADATA_INDEX`` environment variable to ``enabled``. The index can
+be brought up to date explicitly with ``MetadataIndex.sync`` or the
+``gretel index sync`` command, which only fetches models modified since the
+previous sync.
+
+Entries are scoped to the API endpoint and API key they were fetched with,
+so several accounts can share one index file.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+
+from contextlib import closing, contextmanager
+from dataclasses import dataclass, field
+from functools import partial
+from pathlib import Path
+from typing import Iterable, Iterator, List, Optional, Union
+
+from gretel_client.config import ClientConfig, get_cache_dir, get_logger
+from gretel_client.pagination import DEFAULT_PAGE_SIZE, paginate
+from gretel_client.projects.jobs import Status
+from gretel_client.rest.api.projects_api import ProjectsApi
+
+logger = get_logger(__name__)
+
+GRETEL_METADATA_INDEX = "GRETEL_METADATA_INDEX"
+"""Env variable name to enable the metadata index. Set to ``enabled`` to
+opt in."""
+
+DEFAULT_INDEX_TTL = 300.0
+"""Default time in seconds for which index entries are used for lookups."""
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS projects (
+    scope TEXT NOT NULL,
+    guid TEXT NOT NULL,
+    project_id TEXT,
+    name TEXT,
+    payload TEXT NOT NULL,
+    fetched_at REAL NOT NULL,
+    PRIMARY KEY (scope, guid)
+);
+CREATE INDEX IF NOT EXISTS projects_by_name ON projects (scope, name);
+CREATE INDEX IF NOT EXISTS projects_by_id ON projects (scope, project_id);
+
+CREATE TABLE IF NOT EXISTS models (
+    scope TEXT NOT NULL,
+    uid TEXT NOT NULL,
+    project_id TEXT NOT NULL,
+    name TEXT,
+    status TEXT,
+    last_modified TEXT,
+    payload TEXT NOT NULL,
+    fetched_at REAL NOT NULL,
+    PRIMARY KEY (scope, uid)
+);
+CREATE INDEX IF NOT EXISTS models_by_project
+    ON models (scope, project_id, last_modified);
+
+CREATE TABLE IF NOT EXISTS record_handlers (
+    scope TEXT NOT NULL,
+    uid TEXT NOT NULL,
+    project_id TEXT NOT NULL,
+    model_id TEXT NOT NULL,
+    status TEXT,
+    last_modified TEXT,
+    payload TEXT NOT NULL,
+    fetched_at REAL NOT NULL,
+    PRIMARY KEY (scope, uid)
+);
+CREATE INDEX IF NOT EXISTS record_handlers_by_model
+    ON record_handlers (scope, model_id, last_modified);
+
+CREATE TABLE IF NOT EXISTS model_syncs (
+    scope TEXT NOT NULL,
+    project_id TEXT NOT NULL,
+    watermark TEXT,
+    synced_at REAL NOT NULL,
+    PRIMARY KEY (scope, project_id)
+);
+"""
+
+
+def _scope(session: ClientConfig) -> str:
+    # Hash the credentials rather than storing the API key on disk.
+    key = f"{session.endpoint}\0{session.api_key}"
+    return hashlib.sha256(key.encode("utf-8")).hexdigest()[:32]
+
+
+def _model_name(model: dict) -> Optional[str]:
+    return model.get("name") or (model.get("config") or {}).get("name")
+
+
+def _projects_page(api: ProjectsApi, skip: int, limit: int) -> List[dict]:
+    return api.search_projects(skip=skip, limit=limit).get("data").get("projects")
+
+
+def _models_page(
+    api: ProjectsApi, project_id: str, skip: int, limit: int
+) -> List[dict]:
+    # Newest first, so an incremental sync can stop at the first model that
+    # was already indexed.
+    return (
+        api.get_models(
+            project_id=project_id,
+            sort_by="desc",
+            sort_field="last_modified",
+            skip=skip,
+            limit=limit,
+        )
+        .get("data")
+        .get("models")
+    )
+
+
+def _record_handlers_page(
+    api: ProjectsApi, project_id: str, model_id: str, skip: int, limit: int
+) -> List[dict]:
+    return (
+        api.query_record_handlers(
+            project_id=project_id,
+            model_id=model_id,
+            status=",".join(status.value for status in Status),
+            skip=skip,
+            limit=limit,
+        )
+        .get("data")
+        .get("handlers")
+    )
+
+
+@dataclass
+class SyncResult:
+    """Number of entries updated by ``MetadataIndex.sync``."""
+
+    projects: int = 0
+    models: int = 0
+    record_handlers: int = 0
+    synced_projects: List[str] = field(default_factory=list)
+
+
+class MetadataIndex:
+    """
+    A SQLite backed index of project, model and record handler metadata.
+
+    Args:
+        path: Path of the SQLite database.
+        ttl: Time in seconds for which entries are used to answer lookups.
+            Entries older than that are ignored until they're fetched again.
+    """
+
+    def __init__(self, path: Union[str, Path], ttl: float = DEFAULT_INDEX_TTL):
+        self.path = Path(path)
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._initialized = False
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        # Connections are opened per operation, so the index may be used from
+        # the background threads that prefetch pages.
+        with self._lock:
+            if not self._initialized:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                with closing(sqlite3.connect(self.path, timeout=30)) as conn:
+                    conn.execute("PRAGMA journal_mode=WAL")
+                    conn.executescript(_SCHEMA)
+                self._initialized = True
+        with closing(sqlite3.connect(self.path, timeout=30)) as conn:
+            conn.row_factory = sqlite3.Row
+            with conn:
+                yield conn
+
+    def _fresh_since(self) -> float:
+        return time.time() - self.ttl
+
+    def record_projects(self, session: ClientConfig, projects: Iterable[dict]) -> None:
+        """Record projects as returned by the projects API."""
+        now = time.time()
+        rows = [
+            (
+                _scope(session),
+                p.get("guid") or p.get("_id"),
+                p.get("_id"),
+                p.get("name"),
+                json.dumps(p, default=str),
+                now,
+            )
+            for p in projects
+            if p.get("guid") or p.get("_id")
+        ]
+        if not rows:
+            return
+        with self._connect() as conn:
+            conn.executemany(
+                "INSERT OR REPLACE INTO projects VALUES (?, ?, ?, ?, ?, ?)", rows
+            )
+
+    def record_models(
+        self, session: ClientConfig, project_id: str, models: Iterable[dict]
+    ) -> None:
+        """Record models of a project as returned by the models API."""
+        now = time.time()
+        rows = [
+            (
+                _scope(session),
+                m["uid"],
+                project_id,
+                _model_name(m),
+                m.get("status"),
+                m.get("last_modified"),
+                json.dumps(m, default=str),
+                now,
+            )
+            for m in models
+            if m.get("uid")
+        ]
+        if not rows:
+            return
+        with self._connect() as conn:
+            conn.executemany(
+                "INSERT OR REPLACE INTO models VALUES (?, ?, ?, ?, ?, ?, ?, ?)", rows
+            )
+
+    def record_record_handlers(
+        self,
+        session: ClientConfig,
+        project_id: str,
+        model_id: str,
+        handlers: Iterable[dict],
+    ) -> None:
+        """Record record handlers of a model as returned by the API."""
+        now = time.time()
+        rows = [
+            (
+                _scope(session),
+                h["uid"],
+                project_id,
+                model_id,
+                h.get("status"),
+                h.get("last_modified"),
+                json.dumps(h, default=str),
+                now,
+            )
+            for h in handlers
+            if h.get("uid")
+        ]
+        if not rows:
+            return
+        with self._connect() as conn:
+            conn.executemany(
+                "INSERT OR REPLACE INTO record_handlers "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                rows,
+            )
+
+    def get_project(self, session: ClientConfig, name: str) -> Optional[dict]:
+        """
+        Look up a project by name, id or guid.
+
+        Returns:
+            The recorded project payload, or ``None`` if there is no fresh
+            entry for the project.
+        """
+        with self._connect() as conn:
+            row = conn.execute(
+                "SELECT payload FROM projects WHERE scope = ? "
+                "AND (name = ? OR project_id = ? OR guid = ?) AND fetched_at >= ? "
+                "ORDER BY fetched_at DESC LIMIT 1",
+                (_scope(session), name, name, name, self._fresh_since()),
+            ).fetchone()
+        return json.loads(row["payload"]) if row else None
+
+    def remove_project(self, session: ClientConfig, name: str) -> None:
+        """Remove a project and its models and record handlers."""
+        scope = _scope(session)
+        with self._connect() as conn:
+            ids = [
+                row["project_id"]
+                for row in conn.execute(
+                    "SELECT project_id FROM projects WHERE scope = ? "
+                    "AND (name = ? OR project_id = ? OR guid = ?)",
+                    (scope, name, name, name),
+                )
+            ]
+            conn.execute(
+                "DELETE FROM projects WHERE scope = ? "
+                "AND (name = ? OR project_id = ? OR guid = ?)",
+                (scope, name, name, name),
+            )
+            for table in ("models", "record_handlers", "model_syncs"):
+                conn.executemany(
+                    f"DELETE FROM {table} WHERE scope = ? AND project_id = ?",
+                    [(scope, project_id) for project_id in ids + [name]],
+                )
+
+    def search_models(
+        self,
+        session: ClientConfig,
+        project_id: str,
+        *,
+        model_name: str = "",
+        status: Optional[str] = None,
+        sort_by: Optional[str] = None,
+        sort_field: Optional[str] = None,
+        skip: int = 0,
+        limit: Optional[int] = None,
+    ) -> Optional[List[dict]]:
+        """
+        Search the models of a project, with the same semantics as
+        ``Project.search_models``.
+
+        Returns:
+            The matching model payloads, or ``None`` if the models of the
+            project weren't synced within the TTL, or the search can't be
+            answered from the index.
+        """
+        if sort_field not in (None, "last_modified"):
+            return None
+        scope = _scope(session)
+        with self._connect() as conn:
+            synced = conn.execute(
+                "SELECT 1 FROM model_syncs WHERE scope = ? AND project_id = ? "
+                "AND synced_at >= ?",
+                (scope, project_id, self._fresh_since()),
+            ).fetchone()
+            if not synced:
+                return None
+
+            query = "SELECT payload FROM models WHERE scope = ? AND project_id = ?"
+            params: list = [scope, project_id]
+            if model_name:
+                query += " AND name LIKE ? ESCAPE '\\'"
+                escaped = (
+                    model_name.replace("\\", "\\\\")
+                    .replace("%", "\\%")
+                    .replace("_", "\\_")
+                )
+                params.append(f"%{escaped}%")
+            if status:
+                statuses = status.split(",")
+                query += f" AND status IN ({', '.join('?' * len(statuses))})"
+                params.extend(statuses)
+            direction = "DESC" if (sort_by or "").lower() == "desc" else "ASC"
+            query += f" ORDER BY last_modified {direction}, uid LIMIT ? OFFSET ?"
+            params.extend([-1 if limit is None else limit, skip])
+            rows = conn.execute(query, params).fetchall()
+        return [json.loads(row["payload"]) for row in rows]
+
+    def get_record_handlers(self, session: ClientConfig, model_id: str) -> List[dict]:
+        """Return the fresh record handler entries of a model."""
+        with self._connect() as conn:
+            rows = conn.execute(
+                "SELECT payload FROM record_handlers WHERE scope = ? "
+                "AND model_id = ? AND fetched_at >= ? ORDER BY last_modified",
+                (_scope(session), model_id, self._fresh_since()),
+            ).fetchall()
+        return [json.loads(row["payload"]) for row in rows]
+
+    def sync(
+        self,
+        session: ClientConfig,
+        projects: Optional[List[str]] = None,
+        *,
+        full: bool = False,
+        include_record_handlers: bool = False,
+        page_size: int = DEFAULT_PAGE_SIZE,
+    ) -> SyncResult:
+        """
+        Bring the index up to date with the Gretel API.
+
+        Projects are always fetched in full. Models are fetched newest first
+        and the sync of a project stops at the first model that was not
+        modified since the previous sync of that project.
+
+        Args:
+            session: Session used to call the API.
+            projects: Names or ids of the projects to sync models of. Syncs
+                the models of every project by default.
+            full: If ``True``, drop the recorded models of the synced
+                projects and fetch them all again. This also removes models
+                that were deleted since the last sync.
+            include_record_handlers: If ``True``, also fetch the record
+                handlers of every model modified since the previous sync.
+            page_size: Number of items to fetch per request.
+        """
+        api = session.get_api(ProjectsApi)
+        scope = _scope(session)
+        result = SyncResult()
+
+        all_projects = list(
+            paginate(
+                partial(_projects_page, api),
+                page_size=page_size,
+                key=lambda p: p.get("guid"),
+            )
+        )
+        self.record_projects(session, all_projects)
+        result.projects = len(all_projects)
+
+        selected = [
+            p
+            for p in all_projects
+            if projects is None
+            or {p.get("name"), p.get("_id"), p.get("guid")} & set(projects)
+        ]
+        for project in selected:
+            project_id = project["_id"]
+            with self._connect() as conn:
+                if full:
+                    conn.execute(
+                        "DELETE FROM models WHERE scope = ? AND project_id = ?",
+                        (scope, project_id),
+                    )
+                    watermark = None
+                else:
+                    row = conn.execute(
+                        "SELECT watermark FROM model_syncs "
+                        "WHERE scope = ? AND project_id = ?",
+                        (scope, project_id),
+                    ).fetchone()
+                    watermark = row["watermark"] if row else None
+
+            changed = []
+            for model in paginate(
+                partial(_models_page, api, project_id), page_size=page_size
+            ):
+                if watermark and (model.get("last_modified") or "") <= watermark:
+                    break
+                changed.append(model)
+            self.record_models(session, project_id, changed)
+            result.models += len(changed)
+
+            if include_record_handlers:
+                for model in changed:
+                    handlers = list(
+                        paginate(
+                            partial(
+                                _record_handlers_page, api, project_id, model["uid"]
+                            ),
+                            page_size=page_size,
+                        )
+                    )
+                    self.record_record_handlers(
+                        session, project_id, model["uid"], handlers
+                    )
+                    result.record_handlers += len(handlers)
+
+            new_watermark = max(
+                [m["last_modified"] for m in changed if m.get("last_modified")]
+                + ([watermark] if watermark else []),
+                default=None,
+            )
+            with self._connect() as conn:
+                conn.execute(
+                    "INSERT OR REPLACE INTO model_syncs VALUES (?, ?, ?, ?)",
+                    (scope, project_id, new_watermark, time.time()),
+                )
+            result.synced_projects.append(project.get("name") or project_id)
+
+        logger.debug(f"Synced the metadata index: {result}")
+        return result
+
+    def clear(self) -> None:
+        """Remove every entry from the index."""
+        with self._lock:
+            self._initialized = False
+            for suffix in ("", "-wal", "-shm"):
+                Path(f"{self.path}{suffix}").unlink(missing_ok=True)
+
+
+_metadata_index: Optional[MetadataIndex] = None
+_metadata_index_configured = False
+
+
+def configure_metadata_index(
+    *,
+    enabled: bool = True,
+    path: Optional[Union[str, Path]] = None,
+    ttl: float = DEFAULT_INDEX_TTL,
+) -> Optional[MetadataIndex]:
+    """
+    Configure the metadata index for the session.
+
+    Args:
+        enabled: Set to ``False`` to disable the index.
+        path: Path of the SQLite database. Defaults to ``metadata.db``
+            inside the Gretel cache directory.
+        ttl: Time in seconds for which entries are used to answer lookups.
+
+    Returns:
+        The configured index, or ``None`` if the index is disabled.
+    """
+    global _metadata_index, _metadata_index_configured
+    _metadata_index_configured = True
+    if not enabled:
+        _metadata_index = None
+    else:
+        _metadata_index = MetadataIndex(path or get_cache_dir() / "metadata.db", ttl)
+    return _metadata_index
+
+
+def get_metadata_index() -> Optional[MetadataIndex]:
+    """Return the session's metadata index, or ``None`` if disabled."""
+    if not _metadata_index_configured:
+        configure_metadata_index(
+            enabled=os.getenv(GRETEL_METADATA_INDEX, "").lower() == "enabled"
+        )
+    return _metadata_index
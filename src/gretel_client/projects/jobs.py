@@ -5,12 +5,14 @@ import json
 import time
 
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import contextmanager
 from dataclasses import dataclass, field
 from enum import Enum
 from pathlib import Path
 from typing import (
     TYPE_CHECKING,
+    Any,
     BinaryIO,
     Callable,
     Iterator,
@@ -29,6 +31,7 @@ from gretel_client.cli.utils.parser_utils import RefData
 from gretel_client.config import ClientConfig, RunnerMode, get_logger
 from gretel_client.dataframe import _DataFrameT
 from gretel_client.models.config import get_model_type_config
+from gretel_client.polling import AdaptivePollPolicy, PollPolicy, resolve_poll_policy
 from gretel_client.projects.artifact_handlers import (
     ArtifactsHandler,
     CloudArtifactsHandler,
@@ -43,6 +46,7 @@ from gretel_client.projects.exceptions import (
     MaxConcurrentJobsException,
     WaitTimeExceeded,
 )
+from gretel_client.projects.streaming import DEFAULT_BATCH_SIZE, iter_csv_batches
 from gretel_client.rest.api.projects_api import ProjectsApi
 from gretel_client.rest.exceptions import ApiException
 
@@ -73,6 +77,10 @@ class Status(str, Enum):
 ACTIVE_STATES = [Status.CREATED, Status.ACTIVE, Status.PENDING]
 END_STATES = [Status.COMPLETED, Status.CANCELLED, Status.ERROR, Status.LOST]
 
+JOB_POLL_POLICY = AdaptivePollPolicy(initial=3, maximum=30)
+"""Default policy for polling job status and logs, used unless the session
+configures a ``poll_policy``."""
+
 
 class Job(ABC):
     """Represents a unit of work that can be launched via
@@ -89,6 +97,10 @@ class Job(ABC):
 
     _data: Optional[dict] = None
 
+    _hydrated: bool = True
+    """``False`` while ``_data`` only holds a partial representation of the
+    job, such as a search result. Missing fields are fetched on first access."""
+
     _not_found_error: Type[GretelJobNotFound] = GretelJobNotFound
 
     def __init__(
@@ -124,13 +136,7 @@ class Job(ABC):
             dry_run: If set to True the model config will be submitted for
                 validation, but won't be run. Ignored for record handlers.
         """
-        if runner_mode is None:
-            runner_mode = self.project.runner_mode or self.session.default_runner
-        runner_mode = RunnerMode.parse(runner_mode)
-        if self.project.runner_mode and runner_mode != self.project.runner_mode:
-            raise ValueError(
-                f"Specified runner mode '{runner_mode.value}' is different from project runner mode '{self.project.runner_mode.value}'"
-            )
+        runner_mode = self._resolve_runner_mode(runner_mode)
 
         if runner_mode == RunnerMode.CLOUD:
             return self.submit_cloud(dry_run)
@@ -141,6 +147,18 @@ class Job(ABC):
         elif runner_mode == RunnerMode.LOCAL:
             return self.submit_local(dry_run)
 
+    def _resolve_runner_mode(
+        self, runner_mode: Optional[Union[str, RunnerMode]]
+    ) -> RunnerMode:
+        if runner_mode is None:
+            runner_mode = self.project.runner_mode or self.session.default_runner
+        runner_mode = RunnerMode.parse(runner_mode)
+        if self.project.runner_mode and runner_mode != self.project.runner_mode:
+            raise ValueError(
+                f"Specified runner mode '{runner_mode.value}' is different from project runner mode '{self.project.runner_mode.value}'"
+            )
+        return runner_mode
+
     def submit_manual(self, dry_run: bool = False) -> Job:
         """Submit this Job to the Gretel Cloud API, which will create
         the job metadata but no runner will be started. The ``Model`` instance
@@ -189,15 +207,24 @@ class Job(ABC):
         artifacts_handler: Union[CloudArtifactsHandler, HybridArtifactsHandler],
         dry_run: bool,
     ) -> Job:
-        if (
-            isinstance(self.data_source, _DataFrameT)
-            and not self.data_source.empty
-            or self.data_source
-        ):
-            self.upload_data_source(_artifacts_handler=artifacts_handler)
+        # Upload the data source and ref data concurrently, so submitting
+        # takes about as long as the largest upload. The workers only return
+        # the artifact keys, the config is updated once both are done.
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            data_source = pool.submit(
+                self._upload_data_source_artifact, _artifacts_handler=artifacts_handler
+            )
+            ref_data = pool.submit(
+                self._upload_ref_data_artifacts, _artifacts_handler=artifacts_handler
+            )
+            data_source_key = data_source.result()
+            new_ref_data = ref_data.result()
 
-        if not self.ref_data.is_empty:
-            self.upload_ref_data(_artifacts_handler=artifacts_handler)
+        # NOTE: These assignments re-write the gretel artifacts onto the config
+        if data_source_key is not None:
+            self.data_source = data_source_key
+        if new_ref_data is not None:
+            self.ref_data = new_ref_data
 
         return self._submit(runner_mode=runner_mode, dry_run=dry_run)
 
@@ -209,7 +236,11 @@ class Job(ABC):
     def model_type(self) -> str: ...
 
     @abstractmethod
-    def _do_get_job_details(self, extra_expand: Optional[list[str]] = None) -> dict: ...
+    def _do_get_job_details(
+        self,
+        extra_expand: Optional[list[str]] = None,
+        logs_offset: Optional[int] = None,
+    ) -> dict: ...
 
     @abstractmethod
     def _do_cancel_job(self): ...
@@ -234,30 +265,45 @@ class Job(ABC):
     def id(self) -> Optional[str]:
         return self._job_id
 
+    def _hydrate(self) -> None:
+        """Fetch the full job details if only a partial job was loaded."""
+        if not self._hydrated:
+            self._poll_job_endpoint()
+
+    def _get_job_field(self, field: str, default: Any = None) -> Any:
+        """
+        Return a field of the job, fetching the full job details first if the
+        field is missing from a partially loaded job.
+        """
+        if field not in self._data[self.job_type]:
+            self._hydrate()
+        return self._data[self.job_type].get(field, default)
+
     @property
     def logs(self):
         """Returns run logs for the job."""
+        self._hydrate()
         return self._data.get(f.LOGS)
 
     @property
     def status(self) -> Status:
         """The status of the job. Is one of ``gretel_client.projects.jobs.Status``."""
-        return Status(self._data[self.job_type][f.STATUS])
+        return Status(self._get_job_field(f.STATUS))
 
     @property
     def errors(self):
         """Return any errors associated with the model."""
-        return self._data[self.job_type][f.ERROR_MSG]
+        return self._get_job_field(f.ERROR_MSG)
 
     @property
     def runner_mode(self) -> str:
         """Returns the runner_mode of the job. May be one of ``hybrid``, ``manual`` or ``cloud``."""
-        return self._data[self.job_type][f.RUNNER_MODE]
+        return self._get_job_field(f.RUNNER_MODE)
 
     @property
     def traceback(self) -> Optional[str]:
         """Returns the traceback associated with any job errors."""
-        traceback = self._data.get(self.job_type).get(f.TRACEBACK)
+        traceback = self._get_job_field(f.TRACEBACK)
         if not traceback:
             return None
 
@@ -266,6 +312,7 @@ class Job(ABC):
     @property
     def print_obj(self) -> dict:
         """Returns a printable object representation of the job."""
+        self._hydrate()
         out = self._data[self.job_type]
         if out.get(f.MODEL_KEY):
             del out[f.MODEL_KEY]
@@ -306,17 +353,27 @@ class Job(ABC):
         Returns:
             A Gretel artifact key.
         """
+        artifact_key = self._upload_data_source_artifact(_validate, _artifacts_handler)
+        if artifact_key is not None:
+            # NOTE: This assignment re-writes the gretel artifact onto the config
+            self.data_source = artifact_key
+        return artifact_key
+
+    def _upload_data_source_artifact(
+        self,
+        _validate: bool = True,
+        _artifacts_handler: Union[CloudArtifactsHandler, HybridArtifactsHandler] = None,
+    ) -> Optional[str]:
+        # Uploads the data source without updating the config.
         if self.external_data_source and (
             (isinstance(self.data_source, _DataFrameT) and not self.data_source.empty)
             or self.data_source
         ):
-            # NOTE: This assignment re-writes the gretel artifact onto the config
-            self.data_source = self.project.upload_artifact(
-                artifact_path=self.data_source,
+            return self.project.upload_artifacts(
+                [self.data_source],
                 _validate=_validate,
                 _artifacts_handler=_artifacts_handler,
-            )
-            return self.data_source
+            )[0]
 
     def upload_ref_data(
         self,
@@ -326,33 +383,42 @@ class Job(ABC):
         """
         Resolves and uploads ref data sources specificed in the model config.
 
-        If the ref data are already Gretel artifacts, we'll return
-        the ref data as-is.
+        Ref data sources are uploaded concurrently, and sources that were
+        already uploaded to the project during the session are reused. If
+        the ref data are already Gretel artifacts, we'll return the ref data
+        as-is.
 
         Returns:
             A ``RefData`` instance that contains the new Gretel artifact values.
         """
-        curr_ref_data = self.ref_data
-        if curr_ref_data.is_cloud_data or curr_ref_data.is_empty:
-            return curr_ref_data
-
-        # Loop over each data source and try and upload to Gretel
-        ref_data_dict = curr_ref_data.ref_dict
-        for key, data_source in ref_data_dict.items():
-            gretel_key = self.project.upload_artifact(
-                artifact_path=data_source,
-                _validate=_validate,
-                _artifacts_handler=_artifacts_handler,
-            )
-            ref_data_dict[key] = gretel_key
-
-        new_ref_data = RefData(ref_data_dict)
+        new_ref_data = self._upload_ref_data_artifacts(_validate, _artifacts_handler)
+        if new_ref_data is None:
+            return self.ref_data
 
         # NOTE: This assignment re-writes the gretel artifact data onto the config
         self.ref_data = new_ref_data
 
         return new_ref_data
 
+    def _upload_ref_data_artifacts(
+        self,
+        _validate: bool = True,
+        _artifacts_handler: Optional[ArtifactsHandler] = None,
+    ) -> Optional[RefData]:
+        # Uploads the ref data without updating the config. Returns ``None``
+        # if there is nothing to upload.
+        curr_ref_data = self.ref_data
+        if curr_ref_data.is_cloud_data or curr_ref_data.is_empty:
+            return None
+
+        ref_data_dict = curr_ref_data.ref_dict
+        gretel_keys = self.project.upload_artifacts(
+            ref_data_dict.values(),
+            _validate=_validate,
+            _artifacts_handler=_artifacts_handler,
+        )
+        return RefData(dict(zip(ref_data_dict.keys(), gretel_keys)))
+
     def get_artifacts(self) -> Iterator[Tuple[str, str]]:
         """List artifact links for all known artifact types."""
         for artifact_type in self.artifact_types:
@@ -397,6 +463,43 @@ class Job(ABC):
         with smart_open.open(link, "rb", transport_params=transport_params) as handle:
             yield handle
 
+    def iter_artifact_batches(
+        self,
+        artifact_key: str,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        *,
+        as_arrow: bool = False,
+        **read_csv_kwargs,
+    ) -> Iterator[Union[_DataFrameT, Any]]:
+        """Streams a tabular artifact, such as ``data``, in batches of rows.
+
+        The artifact is downloaded, decompressed and parsed incrementally,
+        so only one batch is held in memory at a time. Column types are
+        inferred from the first batch and applied to all later batches,
+        unless a later batch needs a wider type, see
+        ``gretel_client.projects.streaming``.
+
+        >>> for batch in job.iter_artifact_batches("data", batch_size=50_000):
+        ...     batch.to_parquet(...)
+
+        This method requires the ``pandas`` package, and ``pyarrow`` if
+        ``as_arrow`` is set.
+
+        Args:
+            artifact_key: Artifact type to stream.
+            batch_size: Maximum number of rows per batch.
+            as_arrow: If ``True``, yields ``pyarrow.RecordBatch`` objects
+                instead of pandas DataFrames.
+            read_csv_kwargs: Extra arguments passed to ``pandas.read_csv``.
+
+        Returns:
+            an iterator of DataFrames or record batches
+        """
+        with self.get_artifact_handle(artifact_key) as handle:
+            yield from iter_csv_batches(
+                handle, batch_size, as_arrow=as_arrow, **read_csv_kwargs
+            )
+
     def download_artifacts(self, target_dir: Union[str, Path]):
         """Given a target directory, either as a string or a Path object, attempt to enumerate
         and download all artifacts associated with this Job
@@ -525,12 +628,24 @@ class Job(ABC):
         if self.status in ACTIVE_STATES:
             self._do_cancel_job()
 
-    def _poll_job_endpoint(self):
+    def _poll_job_endpoint(self, incremental_logs: bool = False):
+        logs_offset = None
+        if incremental_logs and self._data:
+            logs_offset = len(self._data.get(f.LOGS) or [])
         try:
-            resp = self._do_get_job_details()
+            resp = self._do_get_job_details(logs_offset=logs_offset)
         except gretel_client.rest.exceptions.NotFoundException as ex:
             raise self._not_found_error(self) from ex
-        self._data = resp.get(f.DATA)
+        data = resp.get(f.DATA)
+        if logs_offset and data.get(f.LOGS_OFFSET) is not None:
+            # The API honored the log cursor and only sent the lines after
+            # ``logs_offset``, stitch them onto the lines we already have.
+            # Older APIs ignore the cursor and return the full log instead.
+            data[f.LOGS] = (self._data.get(f.LOGS) or [])[: data[f.LOGS_OFFSET]] + (
+                data.get(f.LOGS) or []
+            )
+        self._data = data
+        self._hydrated = True
 
     def refresh(self):
         """
@@ -539,7 +654,7 @@ class Job(ABC):
         self._poll_job_endpoint()
 
     def _check_predicate(self, start: float, wait: int = WAIT_UNTIL_DONE) -> bool:
-        self._poll_job_endpoint()
+        self._poll_job_endpoint(incremental_logs=True)
         if self.status in END_STATES:
             return False
         if wait >= 0 and time.time() - start > wait:
@@ -554,7 +669,10 @@ class Job(ABC):
         return []
 
     def poll_logs_status(
-        self, wait: int = WAIT_UNTIL_DONE, callback: Callable = None
+        self,
+        wait: int = WAIT_UNTIL_DONE,
+        callback: Callable = None,
+        poll_policy: Optional[PollPolicy] = None,
     ) -> Iterator[LogStatus]:
         """Returns an iterator that may be used to tail the logs
         of a running Model.
@@ -566,20 +684,26 @@ class Job(ABC):
             callback: This function will be executed on every polling loop.
                 A callback is useful for checking some external state that
                 is working on a Job.
+            poll_policy: Controls the time between polls. Defaults to the
+                session's ``poll_policy``, or ``JOB_POLL_POLICY`` if the
+                session doesn't configure one.
         """
         start = time.time()
         current_status = None
+        poll_policy = poll_policy or resolve_poll_policy(self.session, JOB_POLL_POLICY)
+        poller = poll_policy.poller(wait)
         while self._check_predicate(start, wait):
             if callback:
                 callback()
             logs = self._new_job_logs()
             if self.status != current_status or len(logs) > 0:
+                poller.record_activity()
                 transitioned = self.status != current_status
                 current_status = self.status
                 yield LogStatus(
                     status=self.status, logs=logs, transitioned=transitioned
                 )
-            time.sleep(3)
+            poller.sleep()
 
         flushed_logs = self._new_job_logs()
         if len(flushed_logs) > 0 and current_status:
@@ -595,6 +719,7 @@ class Job(ABC):
     @property
     def billing_details(self) -> dict:
         """Get billing details for the current job."""
+        self._hydrate()
         return self._data.get("billing_data", {})
 
     @property
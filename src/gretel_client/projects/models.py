@@ -6,11 +6,12 @@ from __future__ import annotations
 
 import copy
 import json
+import os
 
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import TYPE_CHECKING, Iterator, List, Optional, Type, Union
+from typing import TYPE_CHECKING, Dict, Iterable, Iterator, List, Optional, Type, Union
 
-import requests.exceptions
 import yaml
 
 from smart_open import open
@@ -24,6 +25,8 @@ from gretel_client.cli.utils.parser_utils import (
 from gretel_client.config import RunnerMode, get_logger
 from gretel_client.dataframe import _DataFrameT
 from gretel_client.models.config import get_model_type_config
+from gretel_client.pagination import DEFAULT_PAGE_SIZE, paginate
+from gretel_client.projects.artifact_handlers import ArtifactsHandler
 from gretel_client.projects.common import NO, YES, ModelArtifact, f
 from gretel_client.projects.exceptions import (
     GretelJobNotFound,
@@ -31,8 +34,13 @@ from gretel_client.projects.exceptions import (
     ModelConfigError,
     ModelNotFoundError,
 )
+from gretel_client.projects.index import get_metadata_index
 from gretel_client.projects.jobs import Job, Status
-from gretel_client.projects.records import RecordHandler
+from gretel_client.projects.records import RecordHandler, RecordHandlerBatch
+from gretel_client.projects.templates import (
+    GRETEL_MODEL_CONFIG_DIR,
+    resolve_template,
+)
 from gretel_client.rest.exceptions import ApiException
 
 if TYPE_CHECKING:
@@ -46,37 +54,8 @@ BASE_BLUEPRINT_REPO = "https://raw.githubusercontent.com/gretelai/gretel-bluepri
 _ModelConfigPathT = Union[str, Path, dict]
 
 
-def _maybe_warn_deprecation(config: str) -> None:
-    if not config.startswith("# deprecated"):
-        return
-
-    # A generic message in the event parsing the message in the config fails
-    warn_msg = "This config will be deprecated soon. Please see the config itself for alternative options."
-    try:
-        warn_msg = config.split("\n")[0].split(":")[-1].strip()
-    except Exception:
-        pass
-
-    get_logger(__name__).warning(warn_msg)
-
-
-def _resolve_config_short_path(
-    config_path: str, *, base_url: str = BASE_BLUEPRINT_REPO
-) -> dict:
-    path = f"{base_url}/{config_path}.yml"
-    try:
-        with open(path) as tpl:  # type:ignore
-            tpl_str = tpl.read()
-            _maybe_warn_deprecation(tpl_str)
-            return yaml.safe_load(tpl_str)
-    except requests.exceptions.HTTPError as ex:
-        raise ModelConfigError(
-            f"Could not find or read the blueprint {config_path}"
-        ) from ex
-
-
 def read_model_config(
-    model_config: _ModelConfigPathT, *, base_url: str = BASE_BLUEPRINT_REPO
+    model_config: _ModelConfigPathT, *, base_url: Optional[str] = None
 ) -> dict:
     """
     Load a Gretel configuration into a dictionary.
@@ -87,11 +66,14 @@ def read_model_config(
             location on disk and attempt to read the file and parse it as YAML or JSON. If this is
             successful, a dict of the config is returned. If the provided `model_config` str is not
             a file on disk, the function will attempt to resolve the config as a shortcut-path
-            from URL provided by `base_url.`
+            from URL provided by `base_url.` Templates resolved from short paths are cached,
+            see ``gretel_client.projects.templates``.
 
         base_url: A base HTTP URL that should be use to construct a fully qualified path
             to a configuration template. This URL will be used to resolve a config shortcut string
-            to the fully qualified URL.
+            to the fully qualified URL. May also be a local directory of configuration templates.
+            Defaults to the ``GRETEL_MODEL_CONFIG_DIR`` env variable if set, or the Gretel
+            blueprints repository otherwise.
     """
 
     config = None
@@ -131,14 +113,22 @@ def read_model_config(
                 )
 
     # try and read a model config from a blueprint short path
+    template_error = None
     if not config and isinstance(model_config, str):
         try:
-            config = _resolve_config_short_path(model_config, base_url=base_url)
-        except ModelConfigError:
-            pass
+            config = resolve_template(
+                model_config,
+                base_url=base_url
+                or os.getenv(GRETEL_MODEL_CONFIG_DIR)
+                or BASE_BLUEPRINT_REPO,
+            )
+        except ModelConfigError as ex:
+            template_error = ex
 
     if not config:
-        raise ModelConfigError(f"Could not find model config '{model_config}'")
+        raise ModelConfigError(
+            f"Could not find model config '{model_config}'"
+        ) from template_error
 
     return config
 
@@ -171,6 +161,20 @@ class Model(Job):
         self.model_id = model_id
         super().__init__(project, JOB_TYPE, model_id)
 
+    @classmethod
+    def _from_search_result(cls, project: Project, model: dict) -> Model:
+        """
+        Build a ``Model`` from an entry of a model search result without
+        fetching the model details. Fields that are missing from the search
+        result are fetched on first access.
+        """
+        instance = cls(project=project)
+        instance.model_id = model[f.UID]
+        instance._job_id = model[f.UID]
+        instance._data = {f.MODEL: model}
+        instance._hydrated = False
+        return instance
+
     def _submit(
         self,
         runner_mode: RunnerMode,
@@ -228,7 +232,7 @@ class Model(Job):
 
     @property
     def container_image(self) -> str:
-        return self._data.get(f.MODEL).get(f.CONTAINER_IMAGE)
+        return self._get_job_field(f.CONTAINER_IMAGE)
 
     @property
     def artifact_types(self) -> List[str]:
@@ -239,7 +243,7 @@ class Model(Job):
     def is_cloud_model(self):
         """Returns ``True`` if the model was created to run in Gretel's
         Cloud. ``False`` otherwise."""
-        return self._data["model"]["runner_mode"] == "cloud"
+        return self.runner_mode == "cloud"
 
     @property
     def instance_type(self) -> str:
@@ -249,7 +253,7 @@ class Model(Job):
     @property
     def model_config(self) -> dict:
         """Returns the model config used to create the model."""
-        return self._data[f.MODEL]["config"] if self._data else self._local_model_config
+        return self._get_job_field("config") if self._data else self._local_model_config
 
     @property
     def model_type(self) -> str:
@@ -397,12 +401,22 @@ class Model(Job):
     def __repr__(self) -> str:
         return f"Model(id={self.model_id}, project={self.project.project_guid})"
 
-    def _do_get_job_details(self, extra_expand: Optional[list[str]] = None):
+    def _do_get_job_details(
+        self,
+        extra_expand: Optional[list[str]] = None,
+        logs_offset: Optional[int] = None,
+    ):
         expand = [f.LOGS]
         if extra_expand:
             expand.extend(extra_expand)
+        kwargs = {}
+        if logs_offset:
+            kwargs[f.LOGS_OFFSET] = logs_offset
         return self._projects_api.get_model(
-            project_id=self.project.project_guid, model_id=self.model_id, expand=expand
+            project_id=self.project.project_guid,
+            model_id=self.model_id,
+            expand=expand,
+            **kwargs,
         )
 
     def create_record_handler_obj(
@@ -422,6 +436,107 @@ class Model(Job):
             self, data_source=data_source, params=params, ref_data=ref_data
         )
 
+    def submit_record_handlers(
+        self,
+        handlers: Iterable[RecordHandler],
+        runner_mode: Optional[Union[str, RunnerMode]] = None,
+        max_workers: int = 8,
+    ) -> RecordHandlerBatch:
+        """Submits many record handlers of the model at once.
+
+        The data sources and ref data of all record handlers are uploaded
+        concurrently, and inputs with the same content are only uploaded
+        once. The record handlers are then submitted with up to
+        ``max_workers`` requests in flight.
+
+        Record handlers that fail to submit don't stop the rest of the batch,
+        they're reported in ``RecordHandlerBatch.errors`` instead.
+
+        >>> batch = model.submit_record_handlers(
+        ...     model.create_record_handler_obj(params=params) for params in runs
+        ... )
+        >>> for handler in batch.poll(verbose=False):
+        ...     print(handler.record_id, handler.status)
+
+        Args:
+            handlers: Record handlers created with ``create_record_handler_obj``.
+            runner_mode: Determines where to run the record handlers. If not
+                specified, the runner mode of the project (if configured) is
+                used, otherwise the default runner mode of the session is used.
+            max_workers: Maximum number of concurrent uploads and submissions.
+
+        Returns:
+            A ``RecordHandlerBatch`` tracking the submitted record handlers.
+        """
+        handlers = list(handlers)
+        if not handlers:
+            return RecordHandlerBatch([], max_workers=max_workers)
+        runner_mode = handlers[0]._resolve_runner_mode(runner_mode)
+
+        artifacts_handler = None
+        if runner_mode == RunnerMode.CLOUD:
+            artifacts_handler = self.project.cloud_artifacts_handler
+        elif runner_mode == RunnerMode.HYBRID:
+            artifacts_handler = self.project.hybrid_artifacts_handler
+        if artifacts_handler:
+            self._upload_record_handler_inputs(handlers, artifacts_handler, max_workers)
+
+        def submit(handler: RecordHandler) -> Optional[Exception]:
+            try:
+                handler._submit(runner_mode=runner_mode)
+            except Exception as ex:
+                return ex
+
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            results = list(pool.map(submit, handlers))
+        errors = {handler: error for handler, error in zip(handlers, results) if error}
+        for handler, error in errors.items():
+            get_logger(__name__).warning(f"Could not submit record handler: {error}")
+        return RecordHandlerBatch(
+            [handler for handler in handlers if handler not in errors],
+            errors,
+            max_workers=max_workers,
+        )
+
+    def _upload_record_handler_inputs(
+        self,
+        handlers: List[RecordHandler],
+        artifacts_handler: ArtifactsHandler,
+        max_workers: int,
+    ) -> None:
+        # Collect every input that needs an upload as (handler, ref key)
+        # pairs, where a ``None`` ref key stands for the data source.
+        targets = []
+        sources = []
+        for handler in handlers:
+            data_source = handler.data_source
+            if handler.external_data_source and (
+                (isinstance(data_source, _DataFrameT) and not data_source.empty)
+                or (not isinstance(data_source, _DataFrameT) and data_source)
+            ):
+                targets.append((handler, None))
+                sources.append(data_source)
+            ref_data = handler.ref_data
+            if not ref_data.is_cloud_data and not ref_data.is_empty:
+                for key, ref_source in ref_data.ref_dict.items():
+                    targets.append((handler, key))
+                    sources.append(ref_source)
+
+        artifact_keys = self.project.upload_artifacts(
+            sources, max_workers=max_workers, _artifacts_handler=artifacts_handler
+        )
+
+        uploaded_refs: Dict[RecordHandler, dict] = {}
+        for (handler, key), artifact_key in zip(targets, artifact_keys):
+            if key is None:
+                handler.data_source = artifact_key
+            else:
+                uploaded_refs.setdefault(handler, handler.ref_data.ref_dict)[
+                    key
+                ] = artifact_key
+        for handler, ref_dict in uploaded_refs.items():
+            handler.ref_data = RefData(ref_dict)
+
     def get_record_handler(self, record_id: str) -> RecordHandler:
         return RecordHandler(model=self, record_id=record_id)
 
@@ -432,27 +547,41 @@ class Model(Job):
             body={f.STATUS: Status.CANCELLED.value},
         )
 
-    def get_record_handlers(self) -> Iterator[RecordHandler]:
-        """Returns a list of record handlers associated with the model."""
-        # Setting the start value for offset in each query, limiting each result set to 10 records
-        offset = 0
-        limit = 10
-        while True:
+    def get_record_handlers(
+        self, page_size: int = DEFAULT_PAGE_SIZE, limit: Optional[int] = None
+    ) -> Iterator[RecordHandler]:
+        """Returns a list of record handlers associated with the model.
+
+        Args:
+            page_size: Number of record handlers to fetch per request. The
+                next page is fetched in the background while the current one
+                is consumed.
+            limit: Maximum number of record handlers to return. Returns every
+                record handler by default.
+        """
+
+        index = get_metadata_index()
+
+        def fetch_page(skip: int, limit: int) -> List[dict]:
             handlers = (
                 self._projects_api.query_record_handlers(
                     project_id=self.project.project_id,
                     model_id=self.model_id,
-                    skip=offset,
+                    skip=skip,
                     status=",".join(status.value for status in Status),
                     limit=limit,
                 )
                 .get("data")
                 .get("handlers")
             )
-            # will break once no more handlers remain in the result set in the last pagination
-            if len(handlers) > 0:
-                for handler in handlers:
-                    yield RecordHandler(self, record_id=handler["uid"])
-                offset += limit
-            else:
-                break
+            if index:
+                index.record_record_handlers(
+                    self.project.session,
+                    self.project.project_id,
+                    self.model_id,
+                    handlers,
+                )
+            return handlers
+
+        for handler in paginate(fetch_page, page_size=page_size, limit=limit):
+            yield RecordHandler(self, record_id=handler["uid"])
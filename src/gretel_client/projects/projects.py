@@ -4,12 +4,32 @@ High level API for interacting with a Gretel Project
 
 from __future__ import annotations
 
+import hashlib
+import os
 import re
+import threading
+import time
 
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import contextmanager
-from functools import cached_property, wraps
+from dataclasses import dataclass
+from functools import cached_property, lru_cache, wraps
 from pathlib import Path
-from typing import Any, BinaryIO, Dict, Iterator, List, Optional, Type, TypeVar, Union
+from typing import (
+    Any,
+    BinaryIO,
+    Callable,
+    Dict,
+    Hashable,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+)
 
 from gretel_client.cli.utils.parser_utils import (
     DataSourceTypes,
@@ -23,6 +43,7 @@ from gretel_client.config import (
     get_session_config,
 )
 from gretel_client.dataframe import _DataFrameT
+from gretel_client.pagination import DEFAULT_PAGE_SIZE, paginate
 from gretel_client.projects.artifact_handlers import (
     ArtifactsHandler,
     CloudArtifactsHandler,
@@ -32,6 +53,7 @@ from gretel_client.projects.artifact_handlers import (
 )
 from gretel_client.projects.common import f
 from gretel_client.projects.exceptions import GretelProjectError
+from gretel_client.projects.index import get_metadata_index
 from gretel_client.projects.models import Model
 from gretel_client.rest import models
 from gretel_client.rest.api.projects_api import ProjectsApi
@@ -175,6 +197,8 @@ class Project:
             )
         self.projects_api.delete_project(project_id=self.project_guid)
         self._deleted = True
+        if index := get_metadata_index():
+            index.remove_project(self.session, self.project_guid)
 
     @check_not_deleted
     def get_console_url(self) -> str:
@@ -205,12 +229,13 @@ class Project:
     def search_models(
         self,
         factory: Type[MT] = Model,
-        limit: int = 100,
+        limit: Optional[int] = 100,
         skip: Optional[int] = None,
         model_name: str = "",
         sort_by: Optional[str] = None,
         sort_field: Optional[str] = None,
         status: Optional[str] = None,
+        page_size: int = DEFAULT_PAGE_SIZE,
     ) -> Iterator[MT]:
         """Search for project models.
 
@@ -219,19 +244,20 @@ class Project:
                 If ``Model`` is passed, a ``Model`` will be returned. If ``dict``
                 is passed, a dictionary representation of the search results
                 will be returned.
-            limit: Limits the number of project models to return
+            limit: Limits the number of project models to return. Pass ``None``
+                to return every model of the project.
             skip: Number of models to skip before applying limit
             model_name: Name of the model to try and match on (partial match)
             sort_by: Direction to sort. Uses 'asc' if not provided
             sort_field: Field to sort on. Uses 'last_modified' if not provided
             status: Filter to models with specific status.
+            page_size: Number of models to fetch per request. The next page
+                is fetched in the background while the current one is consumed.
         """
         if factory not in (dict, Model):
             raise ValueError("factory must be one of ``dict`` or ``Model``.")
 
-        api_args = {"project_id": self.name, "limit": limit}
-        if skip is not None:
-            api_args["skip"] = skip
+        api_args = {"project_id": self.name}
         if model_name:
             api_args["model_name"] = model_name
         if sort_by:
@@ -241,12 +267,36 @@ class Project:
         if status:
             api_args["status"] = status
 
-        result = self.projects_api.get_models(**api_args)
-        searched_models = result.get(DATA).get(MODELS)
-
+        index = get_metadata_index()
+
+        def fetch_page(skip: int, limit: int) -> List[dict]:
+            result = self.projects_api.get_models(**api_args, skip=skip, limit=limit)
+            page = result.get(DATA).get(MODELS)
+            if index:
+                index.record_models(self.session, self.project_id, page)
+            return page
+
+        searched_models = None
+        if index:
+            searched_models = index.search_models(
+                self.session,
+                self.project_id,
+                model_name=model_name,
+                status=status,
+                sort_by=sort_by,
+                sort_field=sort_field,
+                skip=skip or 0,
+                limit=limit,
+            )
+        if searched_models is None:
+            searched_models = paginate(
+                fetch_page, page_size=page_size, limit=limit, skip=skip or 0
+            )
         for model in searched_models:
             if factory == Model:
-                model = self.get_model(model_id=model[f.UID])
+                # Build the model from the search result rather than fetching
+                # each model, details missing from the result load lazily.
+                model = Model._from_search_result(self, model)
             yield model
 
     @check_not_deleted
@@ -315,12 +365,114 @@ class Project:
             artifacts_handler.validate_data_source(artifact_path)
         return artifacts_handler.upload_project_artifact(artifact_path)
 
+    def upload_artifacts(
+        self,
+        artifact_paths: Iterable[Union[Path, str, _DataFrameT]],
+        max_workers: int = 8,
+        progress: Optional[Callable[[ArtifactUpload], None]] = None,
+        _validate: bool = True,
+        _artifacts_handler: Optional[ArtifactsHandler] = None,
+    ) -> List[str]:
+        """Uploads several artifacts concurrently.
+
+        Artifacts with the same content, such as the same local file passed
+        twice or two equal DataFrames, are only uploaded once. Local files
+        and DataFrames that were already uploaded to the project during this
+        session are not uploaded again, the existing artifact is reused as
+        long as it still exists.
+
+        Args:
+            artifact_paths: The artifacts to upload.
+            max_workers: Maximum number of concurrent uploads.
+            progress: Called with an ``ArtifactUpload`` every time an artifact
+                finished uploading or was reused. Defaults to logging each
+                upload.
+
+        Returns:
+            The Gretel artifact keys, in the order of ``artifact_paths``.
+        """
+        handler_name = type(_artifacts_handler).__name__ if _artifacts_handler else ""
+        progress = progress or _log_artifact_upload
+        artifact_paths = list(artifact_paths)
+
+        def upload(content_key: Hashable, artifact_path) -> str:
+            session_key = (
+                getattr(self.session, "endpoint", None),
+                self.project_guid,
+                handler_name,
+                content_key,
+            )
+            start = time.monotonic()
+            with _uploaded_artifacts_lock:
+                artifact_key = _uploaded_artifacts.get(session_key)
+            # The artifact may have expired or been deleted by another
+            # process since it was uploaded.
+            if artifact_key is not None and not self._artifact_exists(
+                artifact_key, _artifacts_handler
+            ):
+                logger.info(f"Artifact {artifact_key} no longer exists")
+                with _uploaded_artifacts_lock:
+                    _uploaded_artifacts.pop(session_key, None)
+                artifact_key = None
+            reused = artifact_key is not None
+            if not reused:
+                artifact_key = self.upload_artifact(
+                    artifact_path,
+                    _validate=_validate,
+                    _artifacts_handler=_artifacts_handler,
+                )
+                if content_key[0] in ("dataframe", "file"):
+                    with _uploaded_artifacts_lock:
+                        _uploaded_artifacts[session_key] = artifact_key
+            # Sources that already are Gretel artifacts aren't uploaded.
+            if isinstance(artifact_path, _DataFrameT) or (
+                artifact_key != str(artifact_path)
+            ):
+                progress(
+                    ArtifactUpload(
+                        source=_artifact_display_name(artifact_path),
+                        artifact_key=artifact_key,
+                        size=_artifact_size(artifact_path),
+                        seconds=time.monotonic() - start,
+                        reused=reused,
+                    )
+                )
+            return artifact_key
+
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            content_keys = list(pool.map(_artifact_content_key, artifact_paths))
+            distinct = {}
+            for content_key, artifact_path in zip(content_keys, artifact_paths):
+                distinct.setdefault(content_key, artifact_path)
+            uploads = {
+                content_key: pool.submit(upload, content_key, artifact_path)
+                for content_key, artifact_path in distinct.items()
+            }
+            artifact_keys = {key: upload.result() for key, upload in uploads.items()}
+        return [artifact_keys[content_key] for content_key in content_keys]
+
+    def _artifact_exists(
+        self, key: str, artifacts_handler: Optional[ArtifactsHandler] = None
+    ) -> bool:
+        # Links of hybrid artifacts are built locally, so only cloud
+        # artifacts are actually checked.
+        artifacts_handler = artifacts_handler or self.default_artifacts_handler
+        try:
+            artifacts_handler.get_project_artifact_link(key)
+        except NotFoundException:
+            return False
+        return True
+
     def delete_artifact(self, key: str):
         """Deletes a project artifact.
 
         Args:
             key: Artifact key to delete.
         """
+        with _uploaded_artifacts_lock:
+            for session_key, artifact_key in list(_uploaded_artifacts.items()):
+                if artifact_key == key:
+                    del _uploaded_artifacts[session_key]
         return self.default_artifacts_handler.delete_project_artifact(key)
 
     def get_artifact_link(self, key: str) -> str:
@@ -359,16 +511,22 @@ class Project:
 
 
 def search_projects(
-    limit: int = 200,
+    limit: Optional[int] = 200,
     query: Optional[str] = None,
     *,
+    page_size: Optional[int] = None,
     session: Optional[ClientConfig] = None,
 ) -> List[Project]:
     """Searches for project.
 
     Args:
-        limit: The max number of projects to return.
+        limit: The max number of projects to return. Pass ``None`` to return
+            every matching project.
         query: String filter applied to project names.
+        page_size: Number of projects to fetch per request. The next page is
+            fetched in the background while the current one is processed.
+            Defaults to ``limit``, so that up to ``limit`` projects are also
+            returned by deployments that don't support paging this endpoint.
         session: Can be used to override local Gretel config.
 
     Returns:
@@ -377,10 +535,27 @@ def search_projects(
     if session is None:
         session = get_session_config()
     api = session.get_api(ProjectsApi)
-    params: Dict[str, Any] = {"limit": limit}
+    params: Dict[str, Any] = {}
     if query:
         params["query"] = query
-    projects = api.search_projects(**params)
+
+    index = get_metadata_index()
+
+    def fetch_page(skip: int, limit: int) -> List[dict]:
+        result = api.search_projects(**params, skip=skip, limit=limit)
+        page = result.get(DATA).get(PROJECTS)
+        if index:
+            index.record_projects(session, page)
+        return page
+
+    # Deployments that predate ``skip`` on this endpoint return the first
+    # page over and over, ``key`` stops the iteration on a repeated page.
+    projects = paginate(
+        fetch_page,
+        page_size=page_size or limit or DEFAULT_PAGE_SIZE,
+        limit=limit,
+        key=lambda p: p.get("guid"),
+    )
     return [
         Project(
             name=p.get("name"),
@@ -391,7 +566,7 @@ def search_projects(
             runner_mode=p.get("runner_mode"),
             session=session,
         )
-        for p in projects.get(DATA).get(PROJECTS)
+        for p in projects
     ]
 
 
@@ -497,6 +672,8 @@ def get_project(
 
     api = session.get_api(ProjectsApi)
     project = None
+    from_index = False
+    index = get_metadata_index()
 
     project_args = {}
     if create:
@@ -517,7 +694,10 @@ def get_project(
         resp = api.create_project(project=models.Project(**project_args))
         project = api.get_project(project_id=resp.get(DATA).get("id"))
 
-    if name:
+    if name and index and (cached := index.get_project(session, name)):
+        project = {DATA: {PROJECT: cached}}
+        from_index = True
+    elif name:
         try:
             project = api.get_project(project_id=name)
         except (UnauthorizedException, ForbiddenException, NotFoundException):
@@ -533,6 +713,10 @@ def get_project(
         raise GretelProjectError(f"Could not get or create project using '{name}'.")
 
     p = project.get(DATA).get(PROJECT)
+    # Only refresh the index with projects fetched from the API, re-recording
+    # a cached project would keep it from ever expiring.
+    if index and not from_index:
+        index.record_projects(session, [p])
 
     proj_runner_mode = RunnerMode.parse_optional(p.get("runner_mode"))
     if runner_mode and runner_mode != proj_runner_mode:
@@ -552,6 +736,99 @@ def get_project(
     )
 
 
+@dataclass
+class ArtifactUpload:
+    """Describes an artifact uploaded by ``Project.upload_artifacts``."""
+
+    source: str
+    """The uploaded file, or a description of the uploaded DataFrame."""
+
+    artifact_key: str
+    """The Gretel artifact key of the upload."""
+
+    size: Optional[int]
+    """Size of the uploaded file in bytes, if known."""
+
+    seconds: float
+    """Time it took to upload the artifact."""
+
+    reused: bool
+    """``True`` if an earlier upload of the same content was reused."""
+
+
+_uploaded_artifacts: Dict[Tuple[Optional[str], Optional[str], str, Hashable], str] = {}
+"""Artifact keys of local files and DataFrames uploaded during the session,
+keyed by API endpoint, project, artifacts handler and content."""
+
+_uploaded_artifacts_lock = threading.Lock()
+
+
+def _artifact_display_name(artifact_path: Union[Path, str, _DataFrameT]) -> str:
+    if isinstance(artifact_path, _DataFrameT):
+        return f"DataFrame with {len(artifact_path)} rows"
+    return str(artifact_path)
+
+
+def _artifact_size(artifact_path: Union[Path, str, _DataFrameT]) -> Optional[int]:
+    if isinstance(artifact_path, _DataFrameT) or not os.path.isfile(artifact_path):
+        return None
+    return os.path.getsize(artifact_path)
+
+
+def _log_artifact_upload(upload: ArtifactUpload) -> None:
+    if upload.reused:
+        logger.info(f"Reusing artifact {upload.artifact_key} for {upload.source}")
+        return
+    size = f" ({upload.size / 1024**2:.1f} MiB)" if upload.size is not None else ""
+    logger.info(f"Uploaded {upload.source}{size} in {upload.seconds:.1f}s")
+
+
+def _artifact_content_key(artifact_path: Union[Path, str, _DataFrameT]) -> Hashable:
+    """
+    Returns a key identifying the content of an artifact.
+
+    DataFrames are keyed by a digest of their row hashes, which is much
+    cheaper than serializing them. Local files are keyed by a digest of their
+    content, which is computed once per version of the file. Any other
+    source is keyed by its location.
+    """
+    if isinstance(artifact_path, _DataFrameT):
+        # pandas is an optional dependency, it's installed if we got a DataFrame
+        from pandas.util import hash_pandas_object
+
+        digest = hashlib.sha256()
+        digest.update(repr(list(artifact_path.columns)).encode("utf-8"))
+        digest.update(repr(list(artifact_path.dtypes)).encode("utf-8"))
+        try:
+            row_hashes = hash_pandas_object(artifact_path, index=False)
+        except TypeError:
+            # Columns with unhashable values, e.g. lists, can't be hashed.
+            # The DataFrame is then only deduplicated within a single call.
+            return "unhashable", id(artifact_path)
+        digest.update(row_hashes.to_numpy().tobytes())
+        return "dataframe", digest.hexdigest()
+    if os.path.isfile(str(artifact_path)):
+        stat = os.stat(artifact_path)
+        return "file", _file_digest(
+            os.path.realpath(artifact_path), stat.st_size, stat.st_mtime_ns
+        )
+    return "path", str(artifact_path)
+
+
+_DIGEST_CHUNK_SIZE = 1024 * 1024
+
+
+@lru_cache(maxsize=256)
+def _file_digest(path: str, size: int, mtime_ns: int) -> str:
+    # size and mtime are only part of the cache key, so a file is hashed
+    # again once it changes.
+    digest = hashlib.sha256()
+    with open(path, "rb") as fh:
+        for chunk in iter(lambda: fh.read(_DIGEST_CHUNK_SIZE), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
 def _validate_project_name(name: str) -> None:
     PROJECT_PATTERN = r"^(?![0-9]+$)(?!-)[a-zA-Z0-9-]{5,63}(?<!-)$"
     if not re.match(PROJECT_PATTERN, name):
@@ -1,6 +1,17 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any, List, Optional, Type
+from concurrent.futures import ThreadPoolExecutor
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Type,
+    Union,
+)
 
 from gretel_client.cli.utils.parser_utils import (
     DataSourceTypes,
@@ -9,14 +20,16 @@ from gretel_client.cli.utils.parser_utils import (
     ref_data_factory,
 )
 from gretel_client.config import RunnerMode
+from gretel_client.dataframe import _DataFrameT
 from gretel_client.models.config import get_model_type_config
-from gretel_client.projects.common import ModelRunArtifact, f
+from gretel_client.projects.common import WAIT_UNTIL_DONE, ModelRunArtifact, f
 from gretel_client.projects.exceptions import (
     MaxConcurrentJobsException,
     RecordHandlerError,
     RecordHandlerNotFound,
 )
-from gretel_client.projects.jobs import GretelJobNotFound, Job, Status
+from gretel_client.projects.jobs import END_STATES, GretelJobNotFound, Job, Status
+from gretel_client.projects.streaming import DEFAULT_BATCH_SIZE
 from gretel_client.rest.exceptions import ApiException
 
 if TYPE_CHECKING:
@@ -82,14 +95,11 @@ class RecordHandler(Job):
         return self
 
     def _upload_data_source(self, data_source: DataSourceTypes) -> str:
-        return self.project.upload_artifact(data_source)
+        return self.project.upload_artifacts([data_source])[0]
 
     def _upload_ref_data(self, ref_data: RefData) -> RefData:
-        uploaded_refs = {}
-        for key, data_source in ref_data.ref_dict.items():
-            artifact_key = self.project.upload_artifact(data_source)
-            uploaded_refs[key] = artifact_key
-        return RefData(uploaded_refs)
+        artifact_keys = self.project.upload_artifacts(ref_data.ref_dict.values())
+        return RefData(dict(zip(ref_data.ref_dict.keys(), artifact_keys)))
 
     @property
     def container_image(self) -> str:
@@ -152,7 +162,11 @@ class RecordHandler(Job):
     def _get_config_field_from_data(self, field: str) -> Optional[Any]:
         return self._data.get(f.HANDLER, {}).get("config", {}).get(field)
 
-    def _do_get_job_details(self, extra_expand: Optional[list[str]] = None):
+    def _do_get_job_details(
+        self,
+        extra_expand: Optional[list[str]] = None,
+        logs_offset: Optional[int] = None,
+    ):
         if not self.record_id:
             raise RecordHandlerError(
                 "Record handler does not exist. Try calling create first."
@@ -160,11 +174,15 @@ class RecordHandler(Job):
         expand = [f.LOGS]
         if extra_expand:
             expand.extend(extra_expand)
+        kwargs = {}
+        if logs_offset:
+            kwargs[f.LOGS_OFFSET] = logs_offset
         return self._projects_api.get_record_handler(
             project_id=self.project.project_guid,
             model_id=self.model.model_id,
             record_handler_id=self.record_id,
             expand=expand,
+            **kwargs,
         )
 
     def _do_cancel_job(self):
@@ -182,6 +200,31 @@ class RecordHandler(Job):
             artifact_type=artifact_key,
         )
 
+    def iter_data(
+        self,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        *,
+        as_arrow: bool = False,
+        **read_csv_kwargs,
+    ) -> Iterator[Union[_DataFrameT, Any]]:
+        """Streams the records generated by the record handler in batches.
+
+        Shortcut for ``iter_artifact_batches("data", ...)``, see there for
+        details.
+
+        Args:
+            batch_size: Maximum number of rows per batch.
+            as_arrow: If ``True``, yields ``pyarrow.RecordBatch`` objects
+                instead of pandas DataFrames.
+            read_csv_kwargs: Extra arguments passed to ``pandas.read_csv``.
+        """
+        return self.iter_artifact_batches(
+            ModelRunArtifact.DATA.value,
+            batch_size,
+            as_arrow=as_arrow,
+            **read_csv_kwargs,
+        )
+
     def delete(self):
         """Deletes the record handler."""
         self._projects_api.delete_record_handler(
@@ -189,3 +232,90 @@ class RecordHandler(Job):
             model_id=self.model.model_id,
             record_handler_id=self.record_id,
         )
+
+
+class RecordHandlerBatch:
+    """Tracks record handlers that were submitted together with
+    ``Model.submit_record_handlers``.
+
+    Args:
+        handlers: The record handlers that were submitted.
+        errors: Record handlers that failed to submit, mapped to the
+            exception raised while submitting them.
+        max_workers: Maximum number of concurrent API calls made by the
+            batch.
+    """
+
+    def __init__(
+        self,
+        handlers: List[RecordHandler],
+        errors: Optional[Dict[RecordHandler, Exception]] = None,
+        max_workers: int = 8,
+    ):
+        self.handlers = handlers
+        self.errors = errors or {}
+        self.max_workers = max_workers
+
+    def __iter__(self) -> Iterator[RecordHandler]:
+        return iter(self.handlers)
+
+    def __len__(self) -> int:
+        return len(self.handlers)
+
+    @property
+    def record_ids(self) -> List[str]:
+        """Returns the ids of the submitted record handlers."""
+        return [handler.record_id for handler in self.handlers]
+
+    @property
+    def statuses(self) -> Dict[str, Status]:
+        """Returns the last known status of every submitted record handler."""
+        return {handler.record_id: handler.status for handler in self.handlers}
+
+    @property
+    def is_done(self) -> bool:
+        """``True`` once every submitted record handler reached an end state."""
+        return all(handler.status in END_STATES for handler in self.handlers)
+
+    def _map(self, fn: Callable[[RecordHandler], Any]) -> None:
+        with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+            list(pool.map(fn, self.handlers))
+
+    def refresh(self) -> None:
+        """Concurrently update the state of every record handler."""
+        self._map(RecordHandler.refresh)
+
+    def cancel(self) -> None:
+        """Cancel every record handler of the batch that is still active."""
+        self._map(RecordHandler.cancel)
+
+    def poll(
+        self,
+        wait: int = WAIT_UNTIL_DONE,
+        verbose: bool = True,
+        callback: Optional[Callable[[], None]] = None,
+    ) -> Iterator[RecordHandler]:
+        """
+        Poll every record handler of the batch, yielding them as they reach
+        an end state. See ``gretel_client.helpers.poll_many``.
+
+        Args:
+            wait: The time in seconds to wait for all record handlers to
+                complete. If -1 (WAIT_UNTIL_DONE), waits until every record
+                handler has reached an end state.
+            verbose: ``False`` uses quiet polling, defaults to ``True``.
+            callback: This function will be executed on every polling loop.
+
+        Raises:
+            ``ExceptionGroup`` once the other record handlers are done, if
+            some record handlers repeatedly could not be refreshed.
+        """
+        from gretel_client.helpers import poll_many
+
+        return poll_many(
+            self.handlers,
+            wait=wait,
+            verbose=verbose,
+            callback=callback,
+            max_concurrency=self.max_workers,
+        )
@@ -0,0 +1,172 @@
+"""
+Incremental reading of tabular job artifacts.
+
+Artifacts such as the ``data`` output of a record handler are gzip
+compressed CSV files that may be several GB in size. ``iter_csv_batches``
+decompresses and parses such a stream incrementally and yields it as a
+sequence of DataFrames, so only a single batch has to be held in memory::
+
+    with record_handler.get_artifact_handle("data") as handle:
+        for batch in iter_csv_batches(handle, batch_size=50_000):
+            process(batch)
+
+Column types are inferred from the first batch and applied to every
+following batch, so batches share the same schema. Integer and boolean
+columns with missing values in a later batch use the nullable ``Int64`` and
+``boolean`` types for that batch. If a column of a later batch can't be
+converted, for example a column that only has missing values in the first
+batch and text in a later batch, the type of the column is widened to a type
+that holds the values of both batches, ``object`` for text, and the widened
+type is used from that batch on. To get the same types in every batch, pass
+the column types explicitly with the ``dtype`` argument of
+``pandas.read_csv``.
+
+This module requires the ``pandas`` package. Arrow batches additionally
+require ``pyarrow``.
+"""
+
+from __future__ import annotations
+
+import gzip
+import io
+
+from typing import TYPE_CHECKING, BinaryIO, Iterator, Optional, Union
+
+from gretel_client.config import get_logger
+
+if TYPE_CHECKING:
+    import pandas as pd
+    import pyarrow as pa
+
+logger = get_logger(__name__)
+
+DEFAULT_BATCH_SIZE = 10_000
+"""Number of rows per batch when no batch size is given."""
+
+_GZIP_MAGIC = b"\x1f\x8b"
+
+
+def _decompressed(handle: BinaryIO) -> BinaryIO:
+    # Depending on the artifact URL, the handle may already be decompressed,
+    # so detect gzip from the stream itself rather than from the file name.
+    buffered = handle if isinstance(handle, io.BufferedReader) else None
+    if buffered is None:
+        buffered = io.BufferedReader(handle)  # type:ignore
+    if buffered.peek(len(_GZIP_MAGIC))[: len(_GZIP_MAGIC)] == _GZIP_MAGIC:
+        return gzip.GzipFile(fileobj=buffered)  # type:ignore
+    return buffered
+
+
+def _nullable_dtype(dtype) -> Optional[str]:
+    # numpy integer and boolean types can't hold missing values, their
+    # nullable extension types can.
+    import pandas as pd
+
+    if pd.api.types.is_bool_dtype(dtype):
+        return "boolean"
+    if pd.api.types.is_signed_integer_dtype(dtype):
+        return f"Int{dtype.itemsize * 8}"
+    if pd.api.types.is_unsigned_integer_dtype(dtype):
+        return f"UInt{dtype.itemsize * 8}"
+    return None
+
+
+def _widened_dtype(dtype, other):
+    # The smallest type both types convert to, e.g. ``float64`` for an integer
+    # column with decimals in a later batch, or ``object`` for a column that
+    # only has missing values in the first batch and text in a later batch.
+    import numpy as np
+
+    try:
+        return np.result_type(dtype, other)
+    except TypeError:
+        return np.dtype(object)
+
+
+def _apply_schema(batch: pd.DataFrame, schema: pd.Series) -> bool:
+    """
+    Convert the columns of ``batch`` to the types of ``schema``, in place.
+
+    Columns that can't be converted widen the type of the column in
+    ``schema``, which is then used for every following batch.
+
+    Returns:
+        ``True`` if the type of a column was widened.
+    """
+    widened = False
+    for column, dtype in schema.items():
+        if column not in batch.columns or batch[column].dtype == dtype:
+            continue
+        # e.g. an integer column that has missing values in a later batch.
+        # Casting to the nullable type also fails instead of truncating
+        # values that aren't integers.
+        target = _nullable_dtype(dtype) or dtype
+        try:
+            batch[column] = batch[column].astype(target)
+            continue
+        except (TypeError, ValueError):
+            pass
+
+        widened_dtype = _widened_dtype(dtype, batch[column].dtype)
+        logger.debug(
+            f"Column {column!r} can't be converted to {dtype}, the type of the "
+            f"previous batches, using {widened_dtype} instead."
+        )
+        batch[column] = batch[column].astype(widened_dtype)
+        schema[column] = widened_dtype
+        widened = True
+    return widened
+
+
+def iter_csv_batches(
+    handle: BinaryIO,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    *,
+    as_arrow: bool = False,
+    **read_csv_kwargs,
+) -> Iterator[Union[pd.DataFrame, pa.RecordBatch]]:
+    """
+    Iterate over a, possibly gzip compressed, CSV stream in batches of rows.
+
+    Args:
+        handle: Binary file like object of the CSV data.
+        batch_size: Maximum number of rows per batch.
+        as_arrow: If ``True``, yield ``pyarrow.RecordBatch`` objects instead
+            of pandas DataFrames.
+        read_csv_kwargs: Extra arguments passed to ``pandas.read_csv``.
+
+    Raises:
+        ``ValueError`` if ``batch_size`` is not positive.
+        ``ImportError`` if ``pandas``, or ``pyarrow`` for arrow batches, is
+        not installed.
+    """
+    if batch_size < 1:
+        raise ValueError("batch_size must be at least 1.")
+
+    import pandas as pd
+
+    if as_arrow:
+        import pyarrow as pa
+
+    schema: Optional[pd.Series] = None
+    arrow_schema: Optional[pa.Schema] = None
+    with pd.read_csv(
+        _decompressed(handle), chunksize=batch_size, **read_csv_kwargs
+    ) as reader:
+        for batch in reader:
+            if schema is None:
+                schema = batch.dtypes.copy()
+            elif _apply_schema(batch, schema):
+                # infer the arrow types of widened columns from this batch
+                arrow_schema = None
+
+            if not as_arrow:
+                yield batch
+                continue
+
+            record_batch = pa.RecordBatch.from_pandas(
+                batch, schema=arrow_schema, preserve_index=False
+            )
+            if arrow_schema is None:
+                arrow_schema = record_batch.schema
+            yield record_batch
@@ -0,0 +1,284 @@
+"""
+Resolution and caching of Gretel configuration templates.
+
+Short config paths such as ``synthetics/default`` passed to
+``read_model_config`` name templates in the Gretel blueprints repository.
+Resolved templates are cached in memory for the lifetime of the process and
+on local disk for ``DEFAULT_TEMPLATE_TTL`` seconds, so resolving the same
+template repeatedly doesn't hit the network. When a template can't be
+fetched, for example while offline, an expired copy from the disk cache is
+used instead. Configs passed to ``read_model_config`` as a full URL are
+always fetched directly and never cached.
+
+Templates can also be resolved from a local directory of configs, either
+by passing the directory as ``base_url`` to ``read_model_config`` or by
+setting the ``GRETEL_MODEL_CONFIG_DIR`` environment variable. The cache can
+be configured with ``configure_template_cache``, or disabled by setting the
+``GRETEL_TEMPLATE_CACHE`` environment variable to ``disabled``.
+"""
+
+from __future__ import annotations
+
+import copy
+import hashlib
+import os
+import tempfile
+import threading
+import time
+
+from contextlib import suppress
+from pathlib import Path
+from typing import Callable, Dict, Optional, Tuple, Union
+from urllib.parse import urlparse
+
+import requests
+import yaml
+
+from smart_open import open
+
+from gretel_client.config import get_cache_dir, get_logger
+from gretel_client.projects.exceptions import ModelConfigError
+
+logger = get_logger(__name__)
+
+GRETEL_MODEL_CONFIG_DIR = "GRETEL_MODEL_CONFIG_DIR"
+"""Env variable name of a local directory to resolve config templates from,
+instead of the Gretel blueprints repository."""
+
+GRETEL_TEMPLATE_CACHE = "GRETEL_TEMPLATE_CACHE"
+"""Env variable name to disable the template cache. Set to ``disabled`` to
+opt out."""
+
+DEFAULT_TEMPLATE_TTL = 24 * 60 * 60
+"""Default time in seconds for which cached templates are used (1 day)."""
+
+_CACHE_VERSION = "v1"
+"""Version of the on-disk cache layout. Bump it to invalidate existing
+entries when the layout changes."""
+
+
+def _maybe_warn_deprecation(config: str) -> None:
+    if not config.startswith("# deprecated"):
+        return
+
+    # A generic message in the event parsing the message in the config fails
+    warn_msg = "This config will be deprecated soon. Please see the config itself for alternative options."
+    try:
+        warn_msg = config.split("\n")[0].split(":")[-1].strip()
+    except Exception:
+        pass
+
+    logger.warning(warn_msg)
+
+
+def _parse(template: str) -> dict:
+    _maybe_warn_deprecation(template)
+    return yaml.safe_load(template)
+
+
+def _fetch(url: str) -> str:
+    with open(url) as tpl:  # type:ignore
+        return tpl.read()
+
+
+class TemplateCache:
+    """
+    Caches parsed config templates in memory and their source on disk.
+
+    Args:
+        cache_dir: Directory to store templates in. ``None`` only caches
+            templates in memory.
+        ttl: Time in seconds after which a cached template is fetched again.
+        fetch: Callable that fetches the source of a template from its URL.
+            Defaults to reading the URL with ``smart_open``.
+    """
+
+    def __init__(
+        self,
+        cache_dir: Optional[Union[str, Path]],
+        ttl: float = DEFAULT_TEMPLATE_TTL,
+        fetch: Optional[Callable[[str], str]] = None,
+    ):
+        self.cache_dir = Path(cache_dir) if cache_dir else None
+        self.ttl = ttl
+        self._fetch = fetch
+        self._memory: Dict[str, Tuple[float, dict]] = {}
+        self._lock = threading.Lock()
+
+    def _path_for(self, url: str) -> Optional[Path]:
+        if not self.cache_dir:
+            return None
+        digest = hashlib.sha256(url.encode("utf-8")).hexdigest()
+        return self.cache_dir / _CACHE_VERSION / f"{digest}.yml"
+
+    def _read_disk(self, url: str) -> Optional[Tuple[float, str]]:
+        path = self._path_for(url)
+        if not path:
+            return None
+        try:
+            return path.stat().st_mtime, path.read_text()
+        except FileNotFoundError:
+            return None
+
+    def _write_disk(self, url: str, template: str) -> None:
+        # The disk cache is best effort, a read-only home directory shouldn't
+        # break config resolution.
+        path = self._path_for(url)
+        if not path:
+            return
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        except OSError as ex:
+            logger.debug(f"Could not cache template {url}: {ex}")
+            return
+        try:
+            with os.fdopen(fd, "w") as f:
+                f.write(template)
+            os.replace(tmp_path, path)
+        except OSError as ex:
+            logger.debug(f"Could not cache template {url}: {ex}")
+            with suppress(OSError):
+                os.remove(tmp_path)
+
+    def get(self, url: str) -> dict:
+        """
+        Return the parsed template at ``url``.
+
+        Returns a copy, so callers may modify the returned config.
+        """
+        now = time.time()
+        with self._lock:
+            cached = self._memory.get(url)
+        if cached and now - cached[0] < self.ttl:
+            return copy.deepcopy(cached[1])
+
+        fetched = False
+        on_disk = self._read_disk(url)
+        if on_disk and now - on_disk[0] < self.ttl:
+            fetched_at, template = on_disk
+        else:
+            try:
+                template = (self._fetch or _fetch)(url)
+                fetched_at, fetched = now, True
+            except Exception as ex:
+                if not on_disk:
+                    raise
+                logger.warning(
+                    f"Could not fetch {url} ({ex}), using a cached copy instead."
+                )
+                fetched_at, template = now, on_disk[1]
+
+        config = _parse(template)
+        # only templates that parse are written to disk
+        if fetched:
+            self._write_disk(url, template)
+        with self._lock:
+            self._memory[url] = (fetched_at, config)
+        return copy.deepcopy(config)
+
+    def clear(self) -> None:
+        """Remove every template from the cache."""
+        with self._lock:
+            self._memory.clear()
+            if self.cache_dir and self.cache_dir.exists():
+                for path in self.cache_dir.glob("*/*"):
+                    with suppress(FileNotFoundError):
+                        path.unlink()
+
+
+_template_cache: Optional[TemplateCache] = None
+_template_cache_configured = False
+
+
+def configure_template_cache(
+    *,
+    enabled: bool = True,
+    cache_dir: Optional[Union[str, Path]] = None,
+    ttl: float = DEFAULT_TEMPLATE_TTL,
+) -> Optional[TemplateCache]:
+    """
+    Configure the config template cache for the session.
+
+    Args:
+        enabled: Set to ``False`` to disable the cache.
+        cache_dir: Directory to store templates in. Defaults to
+            ``config_templates`` inside the Gretel cache directory.
+        ttl: Time in seconds after which a cached template is fetched again.
+
+    Returns:
+        The configured cache, or ``None`` if the cache is disabled.
+    """
+    global _template_cache, _template_cache_configured
+    _template_cache_configured = True
+    if not enabled:
+        _template_cache = None
+    else:
+        _template_cache = TemplateCache(
+            cache_dir or get_cache_dir() / "config_templates", ttl
+        )
+    return _template_cache
+
+
+def get_template_cache() -> Optional[TemplateCache]:
+    """Return the session's template cache, or ``None`` if disabled."""
+    if not _template_cache_configured:
+        configure_template_cache(
+            enabled=os.getenv(GRETEL_TEMPLATE_CACHE, "").lower() != "disabled"
+        )
+    return _template_cache
+
+
+def _local_dir(base_url: str) -> Optional[Path]:
+    parsed = urlparse(base_url)
+    if parsed.scheme == "file":
+        return Path(parsed.path)
+    if not parsed.scheme and os.path.isdir(base_url):
+        return Path(base_url)
+    return None
+
+
+def resolve_template(config_path: str, base_url: str) -> dict:
+    """
+    Resolve a short config path, such as ``synthetics/default``, relative to
+    ``base_url``, which may be a URL or a local directory.
+
+    Raises:
+        ``ModelConfigError`` if the template doesn't exist.
+    """
+    local_dir = _local_dir(base_url)
+    if local_dir:
+        for suffix in (".yml", ".yaml"):
+            path = local_dir / f"{config_path}{suffix}"
+            if path.is_file():
+                try:
+                    return _parse(path.read_text())
+                except Exception as ex:
+                    raise ModelConfigError(
+                        f"Could not read the blueprint {config_path} from {path}"
+                    ) from ex
+        raise ModelConfigError(
+            f"Could not find the blueprint {config_path} in {local_dir}"
+        )
+
+    return load_template(f"{base_url}/{config_path}.yml")
+
+
+def load_template(url: str) -> dict:
+    """
+    Load the template at ``url``, through the template cache if enabled.
+
+    Raises:
+        ``ModelConfigError`` if the template doesn't exist or can't be parsed.
+        Other errors fetching the template, such as connection errors, are
+        raised as is.
+    """
+    try:
+        cache = get_template_cache()
+        if cache:
+            return cache.get(url)
+        return _parse(_fetch(url))
+    except requests.exceptions.HTTPError as ex:
+        raise ModelConfigError(f"Could not find or read the blueprint {url}") from ex
+    except yaml.YAMLError as ex:
+        raise ModelConfigError(f"Could not parse the blueprint {url}") from ex
@@ -1,14 +1,20 @@
 from __future__ import annotations
 
+import hashlib
 import json
 import logging
+import queue
 import random
 import string
+import threading
 
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime
+from functools import cached_property
 from pathlib import Path
-from typing import Any, Callable, Iterator, Optional
+from typing import Any, Callable, Iterable, Iterator, Optional
 
 import pandas as pd
 import requests
@@ -41,6 +47,12 @@ from gretel_client.workflows.workflow import WorkflowRun
 
 logger = logging.getLogger(__name__)
 
+DEFAULT_VALIDATION_WORKERS = 8
+"""Default number of steps validated concurrently by ``validate_steps``."""
+
+PREVIEW_QUEUE_SIZE = 256
+"""Maximum number of decoded preview messages buffered ahead of the consumer."""
+
 
 class WorkflowTaskError(Exception):
     """
@@ -185,8 +197,12 @@ class Message:
     def has_dataset(self) -> bool:
         return self.has_output and "dataset" in self.payload
 
-    @property
+    @cached_property
     def dataset(self) -> pd.DataFrame:
+        """
+        The dataset payload as a DataFrame. The DataFrame is only built the
+        first time it is accessed.
+        """
         records = []
         if self.has_dataset:
             records = self.payload["dataset"]
@@ -216,6 +232,88 @@ def _default_preview_printer(log: Message | WorkflowInterruption):
         logger.error(f"{log.message}")
 
 
+class _ValidationCache:
+    """
+    Thread safe LRU cache of successful task validations keyed by a hash of
+    the task name, task config and workflow globals. The key is scoped to
+    the API endpoint and project the validation was requested for.
+    """
+
+    def __init__(self, max_size: int = 1024) -> None:
+        self._max_size = max_size
+        self._entries: OrderedDict[str, str] = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def key(task: str, config: Any, globals: dict, scope: str = "") -> str:
+        payload = json.dumps(
+            {"task": task, "config": config, "globals": globals, "scope": scope},
+            sort_keys=True,
+            default=str,
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> str | None:
+        with self._lock:
+            if key not in self._entries:
+                return None
+            self._entries.move_to_end(key)
+            return self._entries[key]
+
+    def put(self, key: str, message: str) -> None:
+        with self._lock:
+            self._entries[key] = message
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_size:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+_validation_cache = _ValidationCache()
+
+
+def clear_validation_cache() -> None:
+    """Clear the local cache of successful step validations."""
+    _validation_cache.clear()
+
+
+def validate_workflows(
+    builders: Iterable[WorkflowBuilder],
+    max_workers: int = DEFAULT_VALIDATION_WORKERS,
+) -> None:
+    """
+    Validate the steps of several workflow builders concurrently.
+
+    Builders created from variations of the same configuration share most of
+    their steps. Every distinct combination of task, config and globals is
+    validated only once, no matter how many builders contain it.
+
+    Args:
+        builders: The workflow builders to validate.
+        max_workers: Maximum number of concurrent validation requests.
+
+    Raises:
+        WorkflowValidationError: If any step fails validation.
+    """
+    unique_steps: dict[str, tuple[WorkflowBuilder, Step]] = {}
+    for builder in builders:
+        globals = builder._globals.model_dump()
+        for step in builder.get_steps():
+            key = builder._validation_cache_key(step, globals)
+            unique_steps.setdefault(key, (builder, step))
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = [
+            executor.submit(builder.validate_step, step)
+            for builder, step in unique_steps.values()
+        ]
+        for future in futures:
+            future.result()
+
+
 class WorkflowSessionManager:
     def __init__(self):
         self._workflow_id = None
@@ -469,11 +567,16 @@ class WorkflowBuilder:
                 property.
             ApiException: If there is an issue with the API call not related to validation.
         """
+        globals = self._globals.model_dump()
+        cache_key = self._validation_cache_key(step, globals)
+        if (message := _validation_cache.get(cache_key)) is not None:
+            return message
+
         try:
             resp = self._data_api.validate_workflow_task(
                 TaskEnvelopeForValidation(
                     name=step.task,
-                    globals=self._globals.model_dump(),
+                    globals=globals,
                     config=step.config,
                 )
             )
@@ -503,12 +606,63 @@ class WorkflowBuilder:
                 step_name=step.name,
             )
 
-        return resp.message if resp.message else ""
+        message = resp.message if resp.message else ""
+        _validation_cache.put(cache_key, message)
+        return message
+
+    def _validation_cache_key(self, step: Step, globals: dict) -> str:
+        # a validation is only reused for the same endpoint and project
+        host = self._data_api.api_client.configuration.host
+        return _ValidationCache.key(
+            step.task, step.config, globals, scope=f"{host}|{self._project_id}"
+        )
+
+    def validate_steps(
+        self,
+        steps: list[Step] | None = None,
+        max_workers: int = DEFAULT_VALIDATION_WORKERS,
+    ) -> list[str]:
+        """
+        Validate several workflow steps concurrently using the Gretel API.
+
+        Each step is validated with the same request as ``validate_step``,
+        but the requests are issued in parallel. Steps that were already
+        validated successfully with the same task, config and globals are
+        not sent to the API again.
+
+        Args:
+            steps: The workflow steps to validate. Defaults to every step
+                currently in the builder.
+            max_workers: Maximum number of concurrent validation requests.
+
+        Returns:
+            list[str]: The validation message for each step, in order.
+
+        Raises:
+            WorkflowValidationError: If any step fails validation. When
+                several steps are invalid, the error for the first invalid
+                step in order is raised, with the step's name and field
+                violations attached.
+        """
+        steps = self._steps if steps is None else steps
+        if len(steps) <= 1:
+            return [self.validate_step(step) for step in steps]
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [executor.submit(self.validate_step, step) for step in steps]
+            # surface errors in step order, regardless of completion order.
+            return [future.result() for future in futures]
 
     def add_steps(self, steps: list[TaskConfig | Step], validate: bool = True) -> Self:
         """
         Add multiple steps to the workflow.
 
+        If ``validate`` is set, all the new steps are validated concurrently
+        once they have been added. If a step fails validation, it and every
+        step after it are removed from the builder before the error is raised.
+        If validation fails for any other reason, all the new steps are
+        removed.
+
         Args:
             steps: A list of workflow steps to add.
             validate: Whether to validate the steps. Defaults to True.
@@ -516,10 +670,35 @@ class WorkflowBuilder:
         Returns:
             Self: The builder instance for method chaining.
         """
+        num_existing_steps = len(self._steps)
         for step in steps:
-            self.add_step(step, validate=validate)
+            self.add_step(step, validate=False)
+
+        if validate:
+            new_steps = self._steps[num_existing_steps:]
+            try:
+                self.validate_steps(new_steps)
+            except WorkflowValidationError as ex:
+                invalid_index = self.step_names.index(ex.step_name)
+                self._remove_steps_from(max(invalid_index, num_existing_steps))
+                raise ex
+            except Exception:
+                # the steps can't be known to be valid, e.g. because the API
+                # couldn't be reached, so none of them are kept.
+                self._remove_steps_from(num_existing_steps)
+                raise
+
         return self
 
+    def _remove_steps_from(self, index: int) -> None:
+        removed_names = set(self.step_names[index:])
+        del self._steps[index:]
+        self._step_hash_to_name_map = {
+            step_hash: name
+            for step_hash, name in self._step_hash_to_name_map.items()
+            if name not in removed_names
+        }
+
     def get_steps(self) -> list[Step]:
         """Return the list of steps in the workflow."""
         return self._steps
@@ -529,6 +708,33 @@ class WorkflowBuilder:
             if step.name == step_name:
                 return step
 
+    def step_fingerprints(self) -> dict[str, str]:
+        """
+        Return a fingerprint of the output of each step, keyed by step name.
+
+        The fingerprint of a step is a hash of its task, its config, the
+        workflow globals and the fingerprints of its inputs. It changes
+        whenever the step or any step upstream of it changes.
+        """
+        globals = self._globals.model_dump()
+        fingerprints: dict[str, str] = {}
+        for step in self._steps:
+            inputs = [fingerprints.get(name, name) for name in step.inputs or []]
+            payload = json.dumps(
+                {
+                    "task": step.task,
+                    "config": step.config,
+                    "inputs": inputs,
+                    "globals": globals,
+                },
+                sort_keys=True,
+                default=str,
+            )
+            fingerprints[step.name] = hashlib.sha256(
+                payload.encode("utf-8")
+            ).hexdigest()
+        return fingerprints
+
     def to_workflow(self) -> Workflow:
         """
         Convert the builder to a Workflow object.
@@ -592,6 +798,11 @@ class WorkflowBuilder:
         execution. This allows for real-time monitoring of workflow execution
         before you submit your workflow for batch execution.
 
+        Messages are read and decoded on a background thread, so decoding
+        overlaps with the consumer's own processing. At most
+        ``PREVIEW_QUEUE_SIZE`` decoded messages are buffered ahead of the
+        consumer.
+
         Returns:
             Iterator[Union[Message, WorkflowInterruption]]: An iterator that yields:
                 - Message objects containing logs, outputs, and state changes from the workflow
@@ -603,18 +814,21 @@ class WorkflowBuilder:
             stream=True,
         ) as response:
             check_for_error_response(response)
+            messages = queue.Queue(maxsize=PREVIEW_QUEUE_SIZE)
+            stop = threading.Event()
+            reader = threading.Thread(
+                target=_read_preview_stream,
+                args=(response.iter_lines(), messages, stop),
+                daemon=True,
+            )
+            reader.start()
             try:
-                for output in response.iter_lines():
-                    try:
-                        if isinstance(output, bytes):
-                            output = output.decode("utf-8")
-                        yield Message.from_dict(json.loads(output), raise_on_error=True)
-                    except json.JSONDecodeError as e:
-                        logger.error(f"Could not deserialize message: {output}", e)
-            except ChunkedEncodingError:
-                yield WorkflowInterruption(BROKEN_RESPONSE_STREAM_ERROR_MESSAGE)
-            except WorkflowTaskError as exc:
-                yield WorkflowInterruption(str(exc))
+                while (item := messages.get()) is not _END_OF_STREAM:
+                    if isinstance(item, Exception):
+                        raise item
+                    yield item
+            finally:
+                stop.set()
 
     def preview(
         self,
@@ -725,6 +939,49 @@ class WorkflowBuilder:
         return disambiguated_step_input_names
 
 
+_END_OF_STREAM = object()
+
+
+def _read_preview_stream(
+    lines: Iterable[bytes | str], messages: queue.Queue, stop: threading.Event
+) -> None:
+    """
+    Decode NDJSON preview messages into ``messages`` until the stream ends
+    or the consumer sets ``stop``. Stream interruptions are forwarded as
+    ``WorkflowInterruption`` and unexpected errors are forwarded to be
+    re-raised on the consumer thread.
+    """
+
+    def put(item: Any) -> bool:
+        while not stop.is_set():
+            try:
+                messages.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    try:
+        for output in lines:
+            try:
+                if isinstance(output, bytes):
+                    output = output.decode("utf-8")
+                message = Message.from_dict(json.loads(output), raise_on_error=True)
+            except json.JSONDecodeError as e:
+                logger.error(f"Could not deserialize message: {output}: {e}")
+                continue
+            if not put(message):
+                return
+    except ChunkedEncodingError:
+        put(WorkflowInterruption(BROKEN_RESPONSE_STREAM_ERROR_MESSAGE))
+    except WorkflowTaskError as exc:
+        put(WorkflowInterruption(str(exc)))
+    except Exception as exc:
+        put(exc)
+    finally:
+        put(_END_OF_STREAM)
+
+
 def _generate_workflow_name(steps: list[Step] | None = None) -> str:
     """Try and generate a default workflow name.
 
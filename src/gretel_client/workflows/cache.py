@@ -0,0 +1,215 @@
+"""
+Local on-disk cache for the outputs of completed workflow runs.
+
+Outputs of a completed workflow run never change, so they can safely be
+reused across ``WorkflowRun`` instances and sessions. Entries are keyed by
+``(workflow_run_id, step, format)`` and evicted least-recently-used once the
+cache grows past its size limit.
+
+The cache is enabled by default. It can be disabled for a session with
+``configure_output_cache(enabled=False)`` or by setting the
+``GRETEL_OUTPUT_CACHE`` environment variable to ``disabled``.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import os
+import shutil
+import tempfile
+import threading
+import uuid
+
+from contextlib import contextmanager, suppress
+from pathlib import Path
+from typing import IO, Iterator, Optional, Union
+
+from gretel_client.config import get_cache_dir
+
+logger = logging.getLogger(__name__)
+
+GRETEL_OUTPUT_CACHE = "GRETEL_OUTPUT_CACHE"
+"""Env variable name to disable the workflow output cache. Set to
+``disabled`` to opt out."""
+
+DEFAULT_MAX_CACHE_BYTES = 2 * 1024**3
+"""Default size limit of the workflow output cache (2 GiB)."""
+
+CacheKey = tuple[str, str, str]
+"""A ``(workflow_run_id, step, format)`` tuple identifying a cached output."""
+
+
+class OutputCache:
+    """
+    A size bounded, least-recently-used cache of workflow outputs stored as
+    files on local disk.
+
+    Recency is tracked with the modification time of each entry, which is
+    bumped every time the entry is read, so the cache state survives across
+    processes without a separate index.
+
+    Args:
+        cache_dir: Directory to store cached outputs in.
+        max_bytes: Maximum total size of the cache. Once exceeded, the least
+            recently used entries are evicted.
+    """
+
+    def __init__(
+        self, cache_dir: Union[str, Path], max_bytes: int = DEFAULT_MAX_CACHE_BYTES
+    ) -> None:
+        self.cache_dir = Path(cache_dir)
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+
+    def path_for(self, key: CacheKey) -> Path:
+        digest = hashlib.sha256("\0".join(key).encode("utf-8")).hexdigest()
+        return self.cache_dir / digest
+
+    def get(self, key: CacheKey) -> Optional[Path]:
+        """
+        Look up a cached output.
+
+        Returns:
+            The path of the cached file, or ``None`` if there is no entry
+            for the key.
+        """
+        path = self.path_for(key)
+        try:
+            os.utime(path)
+        except FileNotFoundError:
+            return None
+        return path
+
+    def checkout(self, key: CacheKey) -> Optional[Path]:
+        """
+        Link a cached output to a new file outside of the cache directory.
+
+        Evicting the entry doesn't remove the returned file, so it can safely
+        back long lived readers. The caller owns the file and is responsible
+        for removing it. The file is copied if it can't be hard linked, e.g.
+        because the temp directory is on a different file system.
+
+        Returns:
+            The path of the new file, or ``None`` if there is no entry for
+            the key.
+        """
+        dest = Path(tempfile.gettempdir()) / f"gretel_output_{uuid.uuid4().hex}"
+        with self._lock:
+            path = self.get(key)
+            if path is None:
+                return None
+            try:
+                _link_or_copy(path, dest)
+            except FileNotFoundError:
+                return None
+        return dest
+
+    @contextmanager
+    def writer(self, key: CacheKey) -> Iterator[IO[bytes]]:
+        """
+        Open a file to write a new cache entry to.
+
+        The entry only becomes visible once the block exits without an
+        error, so readers never observe partially written outputs.
+        """
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                yield f
+            os.replace(tmp_path, self.path_for(key))
+        except BaseException:
+            with suppress(OSError):
+                os.remove(tmp_path)
+            raise
+        self.evict(keep=key)
+
+    def evict(self, keep: Optional[CacheKey] = None) -> None:
+        """
+        Remove least recently used entries until the cache fits its limit.
+
+        Args:
+            keep: Optional key of an entry that must not be evicted, even if
+                it alone exceeds the limit.
+        """
+        keep_path = self.path_for(keep) if keep else None
+        with self._lock:
+            entries = []
+            for path in self.cache_dir.iterdir():
+                if path.suffix == ".tmp":
+                    continue
+                with suppress(FileNotFoundError):
+                    stat = path.stat()
+                    entries.append((stat.st_mtime, stat.st_size, path))
+
+            total = sum(size for _, size, _ in entries)
+            for _, size, path in sorted(entries):
+                if total <= self.max_bytes:
+                    break
+                if path == keep_path:
+                    continue
+                logger.debug(f"Evicting {path} from the workflow output cache")
+                with suppress(FileNotFoundError):
+                    path.unlink()
+                total -= size
+
+    def clear(self) -> None:
+        """Remove every entry from the cache."""
+        with self._lock:
+            if not self.cache_dir.exists():
+                return
+            for path in self.cache_dir.iterdir():
+                with suppress(FileNotFoundError):
+                    path.unlink()
+
+
+def _link_or_copy(src: Path, dest: Path) -> None:
+    try:
+        os.link(src, dest)
+    except FileNotFoundError:
+        raise
+    except OSError:
+        shutil.copyfile(src, dest)
+
+
+_output_cache: Optional[OutputCache] = None
+_output_cache_configured = False
+
+
+def configure_output_cache(
+    *,
+    enabled: bool = True,
+    cache_dir: Optional[Union[str, Path]] = None,
+    max_bytes: int = DEFAULT_MAX_CACHE_BYTES,
+) -> Optional[OutputCache]:
+    """
+    Configure the workflow output cache for the session.
+
+    Args:
+        enabled: Set to ``False`` to disable the cache.
+        cache_dir: Directory to store cached outputs in. Defaults to
+            ``workflow_outputs`` inside the Gretel cache directory.
+        max_bytes: Maximum total size of the cache in bytes.
+
+    Returns:
+        The configured cache, or ``None`` if the cache is disabled.
+    """
+    global _output_cache, _output_cache_configured
+    _output_cache_configured = True
+    if not enabled:
+        _output_cache = None
+    else:
+        _output_cache = OutputCache(
+            cache_dir or get_cache_dir() / "workflow_outputs", max_bytes
+        )
+    return _output_cache
+
+
+def get_output_cache() -> Optional[OutputCache]:
+    """Return the session's workflow output cache, or ``None`` if disabled."""
+    if not _output_cache_configured:
+        configure_output_cache(
+            enabled=os.getenv(GRETEL_OUTPUT_CACHE, "").lower() != "disabled"
+        )
+    return _output_cache
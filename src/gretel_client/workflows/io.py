@@ -8,6 +8,8 @@ from pathlib import Path
 from typing import IO, Callable, Literal, Optional, Union
 
 import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
 
 from rich.table import Table
 from typing_extensions import Self
@@ -31,8 +33,13 @@ class Dataset:
 
     """
 
-    def __init__(self, df: pd.DataFrame) -> None:
+    def __init__(
+        self, df: Optional[pd.DataFrame] = None, *, path: Optional[Path] = None
+    ) -> None:
+        if df is None and path is None:
+            raise ValueError("A Dataset requires either a DataFrame or a path.")
         self._df = df
+        self._path = path
 
     @classmethod
     def from_bytes(cls, parquet_bytes: IO) -> Self:
@@ -42,11 +49,37 @@ class Dataset:
     def from_records(cls, records: list[dict]) -> Self:
         return cls(pd.DataFrame.from_records(records))
 
+    @classmethod
+    def from_file(cls, path: Union[str, Path]) -> Self:
+        """
+        Create a Dataset backed by a parquet file on local disk. The file
+        is only read when the data is first accessed.
+        """
+        return cls(path=Path(path))
+
+    @property
+    def path(self) -> Optional[Path]:
+        """Get the local parquet file backing the Dataset, if any"""
+        return self._path
+
     @property
     def df(self) -> pd.DataFrame:
         """Get the Datasets as a pandas DataFrame"""
+        if self._df is None:
+            self._df = self.to_arrow().to_pandas()
         return self._df
 
+    def to_arrow(self) -> pa.Table:
+        """
+        Get the Dataset as a pyarrow Table.
+
+        If the Dataset is backed by a local parquet file, the file is memory
+        mapped rather than read into memory.
+        """
+        if self._path is not None:
+            return pq.read_table(self._path, memory_map=True)
+        return pa.Table.from_pandas(self._df, preserve_index=False)
+
     def download(
         self, file: Union[str, Path, IO], format: Literal["csv", "parquet"] = "parquet"
     ) -> None:
@@ -65,9 +98,9 @@ class Dataset:
             file.parent.mkdir(parents=True, exist_ok=True)
 
         if format == "csv":
-            self._df.to_csv(file, index=False)
+            self.df.to_csv(file, index=False)
         else:
-            self._df.to_parquet(file, index=False)
+            self.df.to_parquet(file, index=False)
 
 
 class Report:
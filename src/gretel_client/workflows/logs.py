@@ -14,12 +14,14 @@ from time import sleep
 from typing import Callable, Iterator, List, Optional, Protocol, TextIO
 
 from gretel_client.config import ClientConfig
+from gretel_client.polling import AdaptivePollPolicy, PollPolicy
 from gretel_client.rest_v1.api.logs_api import LogsApi
 from gretel_client.rest_v1.api.workflows_api import WorkflowsApi
 from gretel_client.rest_v1.models import (
     GetLogResponse,
     LogEnvelope,
     SearchWorkflowTasksResponse,
+    WorkflowRun,
     WorkflowTask,
 )
 from gretel_client.workflows.status import TERMINAL_STATES
@@ -163,8 +165,15 @@ class TaskManager:
     """An instance of a log printer. Each workflow task worker will push log
     to this printer."""
 
-    _poll_frequency_seconds: int = 5
-    """The frequency between workflow run status checks"""
+    _poll_policy: PollPolicy = AdaptivePollPolicy(initial=5, maximum=30)
+    """Controls the time between workflow run status checks"""
+
+    _task_poll_policy: Optional[PollPolicy] = None
+    """Poll policy handed to each task log worker. If ``None`` the worker
+    default is used."""
+
+    workflow_run: Optional[WorkflowRun] = None
+    """The workflow run as of the last status check."""
 
     def __init__(
         self,
@@ -172,12 +181,16 @@ class TaskManager:
         workflows_api: WorkflowsApi,
         logs_api: LogsApi,
         log_printer: LogPrinter,
+        poll_policy: Optional[PollPolicy] = None,
     ):
         self._workflow_run_id = workflow_run_id
         self._workflows_api = workflows_api
         self._logs_api = logs_api
         self._log_printer = log_printer
         self._tasks = {}
+        if poll_policy is not None:
+            self._poll_policy = poll_policy
+            self._task_poll_policy = poll_policy
 
     @classmethod
     def for_workflow_run(
@@ -186,9 +199,10 @@ class TaskManager:
         workflow_api: WorkflowsApi,
         logs_api: LogsApi,
         log_printer: LogPrinter,
+        poll_policy: Optional[PollPolicy] = None,
     ):
         """Create a ``TaskManager`` from a workflow run"""
-        return cls(workflow_run_id, workflow_api, logs_api, log_printer)
+        return cls(workflow_run_id, workflow_api, logs_api, log_printer, poll_policy)
 
     def start(self, wait: int = -1):
         """Starts polling the workflow run for state changes and task logs.
@@ -200,20 +214,25 @@ class TaskManager:
                 wait is ``-1`` this method will block until the workflow run
                 reaches a terminal state.
         """
-        wait_time_seconds = 0
+        poller = self._poll_policy.poller(wait)
         self._log_printer.info(
             f"Fetching task logs for workflow run {self._workflow_run_id}"
         )
         run_status = None
-        while wait < 0 or wait_time_seconds < wait:
+        while not poller.expired:
             for task in self._fetch_tasks():
                 if task.id not in self._tasks:
                     self._log_printer.info(f"Got task {task.id}")
                     task_worker = LogWorker.for_workflow_task(
-                        task, self._workflows_api, self._logs_api, self._log_printer
+                        task,
+                        self._workflows_api,
+                        self._logs_api,
+                        self._log_printer,
+                        self._task_poll_policy,
                     )
                     self._tasks[task.id] = task_worker
                     task_worker.start()
+                    poller.record_activity()
 
             new_run_status = self.check_run_status()
             if run_status != new_run_status:
@@ -221,14 +240,14 @@ class TaskManager:
                     f"Workflow run is now in status: {new_run_status}"
                 )
                 run_status = new_run_status
+                poller.record_activity()
 
             if run_status in TERMINAL_STATES:
                 break
 
-            wait_time_seconds += self._poll_frequency_seconds
-            sleep(self._poll_frequency_seconds)
+            poller.sleep()
 
-        if wait > 0 and wait_time_seconds >= wait:
+        if wait > 0 and run_status not in TERMINAL_STATES:
             raise WaitTimeExceeded()
 
         # if wait is set, and we hit this branch, we've surpassed the allotted
@@ -238,10 +257,10 @@ class TaskManager:
             self._wait_for_log_workers()
 
     def check_run_status(self) -> str:
-        workflow_run = self._workflows_api.get_workflow_run(
+        self.workflow_run = self._workflows_api.get_workflow_run(
             workflow_run_id=self._workflow_run_id
         )
-        return workflow_run.status
+        return self.workflow_run.status
 
     def _fetch_tasks(self) -> List[WorkflowTask]:
         tasks: SearchWorkflowTasksResponse = self._workflows_api.search_workflow_tasks(
@@ -279,7 +298,7 @@ class LogWorker:
     _workflows_api: WorkflowsApi
     """Used to check the status of the task"""
 
-    _poll_frequency_seconds: int = 3
+    _poll_policy: PollPolicy = AdaptivePollPolicy(initial=3, maximum=30)
     """Configures the time between state syncs with the Gretel api"""
 
     _log_printer: LogPrinter
@@ -294,11 +313,14 @@ class LogWorker:
         workflows_api: WorkflowsApi,
         logs_api: LogsApi,
         log_printer: LogPrinter,
+        poll_policy: Optional[PollPolicy] = None,
     ):
         self.task = task
         self._workflows_api = workflows_api
         self._logs_api = logs_api
         self._log_printer = log_printer
+        if poll_policy is not None:
+            self._poll_policy = poll_policy
         self._control = threading.Event()
         self._thread = threading.Thread(target=self._poll, daemon=True)
         self._log_checkpoint = None
@@ -310,9 +332,12 @@ class LogWorker:
         workflows_api: WorkflowsApi,
         logs_api: LogsApi,
         log_printer: LogPrinter,
+        poll_policy: Optional[PollPolicy] = None,
     ) -> LogWorker:
         """Configures a log worker for a given workflow task"""
-        return cls(Task.from_api(task), workflows_api, logs_api, log_printer)
+        return cls(
+            Task.from_api(task), workflows_api, logs_api, log_printer, poll_policy
+        )
 
     def running(self) -> bool:
         """Returns ``True`` if the worker is continuing to poll for logs."""
@@ -373,9 +398,11 @@ class LogWorker:
 
     def _poll(self):
         consecutive_sync_failures = 0
+        poller = self._poll_policy.poller()
         while self._control.is_set():
             for line in self._fetch_log_lines():
                 self._log_printer.log(line)
+                poller.record_activity()
 
             try:
                 self._sync_task()
@@ -393,6 +420,7 @@ class LogWorker:
 
             if self.task.did_transition:
                 self._log_printer.transition(self.task)
+                poller.record_activity()
 
             if not self.task.active:
                 if self.task.error != "":
@@ -401,7 +429,7 @@ class LogWorker:
                     )
                 self._control.clear()
             else:
-                sleep(self._poll_frequency_seconds)
+                poller.sleep()
 
     def _sync_task(self):
         """Syncs tasks state with the API."""
@@ -438,7 +466,7 @@ def print_logs_for_workflow_run(
     logs_api = config.get_v1_api(LogsApi)
 
     task_manager = TaskManager.for_workflow_run(
-        id, workflows_api, logs_api, log_printer_factory()
+        id, workflows_api, logs_api, log_printer_factory(), config.poll_policy
     )
 
     task_manager.start(wait)
@@ -1,23 +1,69 @@
 import io
 import logging
-
-from typing import IO, Literal, Optional, Union
-
-from requests import HTTPError
+import os
+import shutil
+import tempfile
+import time
+import weakref
+
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import contextmanager, suppress
+from dataclasses import dataclass
+from pathlib import Path
+from typing import IO, Iterator, Literal, Optional, Union
+
+import pandas as pd
+import pyarrow.parquet as pq
+
+from requests import HTTPError, Response
 from typing_extensions import Self
 
+from gretel_client.config import ClientConfig
 from gretel_client.navigator_client_protocols import (
     GretelApiProviderProtocol,
     GretelResourceProviderProtocol,
 )
+from gretel_client.polling import resolve_poll_policy
 from gretel_client.rest_v1.api.logs_api import LogsApi
 from gretel_client.rest_v1.api.workflows_api import WorkflowsApi
 from gretel_client.rest_v1.models import WorkflowRun as WorkflowRunApiResponse
+from gretel_client.workflows.cache import CacheKey, get_output_cache
 from gretel_client.workflows.configs.workflows import Step, Workflow
-from gretel_client.workflows.io import Dataset, PydanticModel, Report
+from gretel_client.workflows.io import (
+    Dataset,
+    OutputDownloaderT,
+    PydanticModel,
+    Report,
+)
 from gretel_client.workflows.logs import LogLine, LogPrinter, Task, TaskManager
 from gretel_client.workflows.status import Status
 
+logger = logging.getLogger(__name__)
+
+# todo: this needs to be more flexible. we should lookup
+# tasks that emit some sort of report base class from
+# the registry.
+REPORT_OUTPUT_TYPES = ("evaluate_safe_synthetics_dataset", "evaluate_dataset")
+
+DOWNLOAD_CHUNK_SIZE = 1024 * 1024
+"""Number of bytes read from the response body per write when streaming
+workflow outputs to disk."""
+
+
+@dataclass
+class StepOutput:
+    """
+    The decoded output of a single workflow step, as returned from
+    :meth:`WorkflowRun.fetch_outputs`.
+    """
+
+    step_name: str
+    output: Union[PydanticModel, Dataset, Report]
+    elapsed: float
+    """Wall time in seconds spent downloading and decoding the output."""
+    path: Optional[Path] = None
+    """Local file the raw output was written to, if a destination was given."""
+
 
 class WorkflowRun:
     """
@@ -73,9 +119,19 @@ class WorkflowRun:
             log_printer = LoggingPrinter(verbose)
 
         task_manager = TaskManager(
-            self._api_response.id, self._workflow_api, self._logs_api, log_printer
+            self._api_response.id,
+            self._workflow_api,
+            self._logs_api,
+            log_printer,
+            poll_policy=resolve_poll_policy(self.session),
         )
-        task_manager.start(wait)
+        try:
+            task_manager.start(wait)
+        finally:
+            # keep the last known status current, so outputs of a run that
+            # completed while waiting can be cached.
+            if task_manager.workflow_run is not None:
+                self._api_response = task_manager.workflow_run
 
     def get_step_output(
         self, step_name: str, format: Optional[str] = None
@@ -93,57 +149,237 @@ class WorkflowRun:
         Raises:
             Exception: If the step cannot be found or output type cannot be determined
         """
-        output_type = None
-        endpoint = f"/v2/workflows/runs/{self.id}/{step_name}/outputs"
         params = {}
+        output_type = None
         if format:
             params["format"] = format
         else:
-            # First find the task type for the step name
-            step_type = None
-            if self.workflow.steps:
-                for step in self.workflow.steps:
-                    if step_name == step.name:
-                        step_type = step.task
+            output_type = self._get_step_output_type(step_name)
 
-            if not step_type:
-                raise Exception(f"Could not find step {step_name!r} in workflow")
+        return self._get_step_output(
+            step_name, output_type, params, self._download_report
+        )
 
-            # Next use the registry to lookup the output type
-            # for the task.
-            tasks: list[dict] = self._resource_provider.workflows.registry()["tasks"]
-            for task in tasks:
-                if task["name"] == step_type:
-                    output_type = task["output"]
+    def _get_step_output(
+        self,
+        step_name: str,
+        output_type: Optional[str],
+        params: dict,
+        report_downloader: OutputDownloaderT,
+    ) -> Union[PydanticModel, Dataset, Report, IO]:
+        endpoint = self._step_output_endpoint(step_name)
+        cache_key = (self.id, step_name, params.get("format", ""))
+        is_dataset = output_type == "dataset"
+        if cached := self._cached_output(
+            cache_key, endpoint, params, checkout=is_dataset
+        ):
+            if is_dataset:
+                return _temporary_dataset(cached)
+            return _decode_output(
+                output_type, io.BytesIO(cached.read_bytes()), report_downloader
+            )
+
+        with self._get_output(endpoint, params) as response:
+            # datasets can be large, so they are streamed to disk instead
+            # of being buffered in memory.
+            if output_type == "dataset":
+                return _dataset_from_response(response)
+            return _decode_output(
+                output_type, io.BytesIO(response.content), report_downloader
+            )
 
-            if not output_type:
-                raise Exception(
-                    f"Could not determine output type for step {step_type!r}"
-                )
+    def download_step_output(
+        self,
+        step_name: str,
+        path: Union[str, Path],
+        format: Optional[str] = None,
+    ) -> Path:
+        """
+        Stream the output from a specific workflow step directly to a file
+        on disk, without buffering the whole output in memory.
 
-        with self._api_provider.requests().get(
-            endpoint, params=params, stream=True
-        ) as response:
-            response.raise_for_status()
-            response_bytes = io.BytesIO(response.content)
+        Args:
+            step_name: Name of the workflow step
+            path: The target file path. Any necessary parent directories
+                will be created automatically.
+            format: Optional output format specification
+
+        Returns:
+            The path the output was written to.
+        """
+        params = {"format": format} if format else {}
+        endpoint = self._step_output_endpoint(step_name)
+        path = Path(path)
+        if cached := self._cached_output(
+            (self.id, step_name, format or ""), endpoint, params
+        ):
+            path.parent.mkdir(parents=True, exist_ok=True)
+            shutil.copyfile(cached, path)
+            return path
+
+        with self._get_output(endpoint, params) as response:
+            _write_response_to_file(response, path)
+        return path
+
+    def iter_step_output_batches(
+        self, step_name: str, batch_size: int = 10_000
+    ) -> Iterator[pd.DataFrame]:
+        """
+        Iterate over a dataset producing step's output in batches of rows.
+
+        The parquet output is streamed to a temporary file and then read
+        incrementally, one batch at a time, so that only a single batch
+        needs to be held in memory.
+
+        Args:
+            step_name: Name of the workflow step
+            batch_size: Maximum number of rows in each batch
+
+        Returns:
+            An iterator of pandas DataFrames.
 
-            # if a format is specified, we assume the caller know what
-            # format it wants, and should return the raw bytes
-            if not output_type and format:
-                return response_bytes
+        Raises:
+            Exception: If the step does not produce a dataset.
+        """
+        output_type = self._get_step_output_type(step_name)
+        if output_type != "dataset":
+            raise Exception(
+                f"Step {step_name!r} does not produce a dataset "
+                f"(output type is {output_type!r})"
+            )
+
+        endpoint = self._step_output_endpoint(step_name)
+        if cached := self._cached_output((self.id, step_name, ""), endpoint):
+            yield from _iter_parquet_batches(cached, batch_size)
+            return
+
+        with tempfile.TemporaryDirectory(prefix="gretel_step_output_") as tmp_dir:
+            path = self.download_step_output(
+                step_name, Path(tmp_dir) / f"{step_name}.parquet"
+            )
+            yield from _iter_parquet_batches(path, batch_size)
+
+    def _step_output_endpoint(self, step_name: str) -> str:
+        return f"/v2/workflows/runs/{self.id}/{step_name}/outputs"
+
+    def fetch_outputs(
+        self,
+        steps: Optional[list[str]] = None,
+        max_workers: int = 4,
+        dest: Optional[Union[str, Path]] = None,
+    ) -> dict[str, StepOutput]:
+        """
+        Concurrently download and decode the outputs of several workflow
+        steps.
 
-            # otherwise, if there is an output_type found, try and
-            # serialize the output to that type
+        Args:
+            steps: Names of the steps to fetch outputs for. If ``None``, the
+                outputs of every step in the workflow are fetched.
+            max_workers: Maximum number of concurrent downloads.
+            dest: Optional directory to write the raw outputs to. Datasets
+                are written as ``<step>.parquet``, other outputs as
+                ``<step>.json`` and the HTML report as ``report.html``.
+                If not set, outputs are kept in temporary storage.
+
+        Returns:
+            A dictionary mapping each step name to its :class:`StepOutput`,
+            in the order the steps were requested.
+        """
+        step_names = steps if steps is not None else [s.name for s in self.steps]
+        output_types = self._get_step_output_types(step_names)
+        dest = Path(dest) if dest is not None else None
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            report_html = None
+            if any(t in REPORT_OUTPUT_TYPES for t in output_types.values()):
+                report_html = executor.submit(self._fetch_report_html, dest)
+
+            futures = {
+                step_name: executor.submit(
+                    self._fetch_step_output,
+                    step_name,
+                    output_types[step_name],
+                    dest,
+                    report_html,
+                )
+                for step_name in step_names
+            }
+            return {step_name: future.result() for step_name, future in futures.items()}
+
+    def _fetch_step_output(
+        self,
+        step_name: str,
+        output_type: str,
+        dest: Optional[Path],
+        report_html: Optional[Future[bytes]],
+    ) -> StepOutput:
+        start = time.perf_counter()
+        report_downloader = self._report_downloader(report_html)
+        path = None
+        if dest:
+            suffix = "parquet" if output_type == "dataset" else "json"
+            path = self.download_step_output(step_name, dest / f"{step_name}.{suffix}")
             if output_type == "dataset":
-                return Dataset.from_bytes(response_bytes)
+                output = Dataset.from_file(path)
+            else:
+                output = _decode_output(
+                    output_type, io.BytesIO(path.read_bytes()), report_downloader
+                )
+        else:
+            output = self._get_step_output(
+                step_name, output_type, {}, report_downloader
+            )
+
+        elapsed = time.perf_counter() - start
+        logger.info(f"Fetched output for step {step_name!r} in {elapsed:.2f}s")
+        return StepOutput(step_name, output, elapsed, path)
+
+    def _fetch_report_html(self, dest: Optional[Path]) -> bytes:
+        html = self._download_report(format="html").read()
+        if dest:
+            dest.mkdir(parents=True, exist_ok=True)
+            (dest / "report.html").write_bytes(html)
+        return html
+
+    def _report_downloader(
+        self, report_html: Optional[Future[bytes]]
+    ) -> OutputDownloaderT:
+        if report_html is None:
+            return self._download_report
+
+        def download(format: Optional[Literal["json", "html"]] = "json") -> IO:
+            if format == "html":
+                return io.BytesIO(report_html.result())
+            return self._download_report(format)
+
+        return download
+
+    def _get_step_output_type(self, step_name: str) -> str:
+        return self._get_step_output_types([step_name])[step_name]
+
+    def _get_step_output_types(self, step_names: list[str]) -> dict[str, str]:
+        # First find the task type for each step name
+        step_types = {step.name: step.task for step in self.steps}
+
+        # Next use the registry to lookup the output type
+        # for the task.
+        tasks: list[dict] = self._resource_provider.workflows.registry()["tasks"]
+        task_outputs = {task["name"]: task["output"] for task in tasks}
+
+        output_types = {}
+        for step_name in step_names:
+            step_type = step_types.get(step_name)
+            if not step_type:
+                raise Exception(f"Could not find step {step_name!r} in workflow")
 
-            # todo: this needs to be more flexible. we should lookup
-            # tasks that emit some sort of report base class from
-            # the registry.
-            if output_type in ("evaluate_safe_synthetics_dataset", "evaluate_dataset"):
-                return Report.from_bytes(response_bytes, self._download_report)
+            output_type = task_outputs.get(step_type)
+            if not output_type:
+                raise Exception(
+                    f"Could not determine output type for step {step_type!r}"
+                )
+            output_types[step_name] = output_type
 
-            return PydanticModel.from_bytes(response_bytes)
+        return output_types
 
     @property
     def name(self) -> str:
@@ -165,6 +401,11 @@ class WorkflowRun:
         """Get the ID of the parent Workflow"""
         return self._api_response.workflow_id
 
+    @property
+    def session(self) -> Optional[ClientConfig]:
+        """The client config of the session the Workflow Run belongs to, if known"""
+        return getattr(self._api_provider, "client_config", None)
+
     @property
     def steps(self) -> list[Step]:
         """Return a list of steps in the Workflow"""
@@ -197,42 +438,97 @@ class WorkflowRun:
         )
         return self._api_response
 
-    def _download_report(
-        self, format: Optional[Literal["json", "html"]] = "json"
-    ) -> IO:
+    @contextmanager
+    def _get_output(
+        self, url: str, params: Optional[dict] = None, not_found: Optional[str] = None
+    ) -> Iterator[Response]:
         with self._api_provider.requests().get(
-            f"/v2/workflows/runs/{self.id}/outputs?type=report_{format}",
-            stream=True,
+            url, params=params or {}, stream=True
         ) as response:
             try:
                 response.raise_for_status()
             except HTTPError as ex:
-                if ex.response.status_code == 404:
-                    raise Exception(
-                        "Could not fetch a report for the task. "
-                        "Please check that the workflow has a report task"
-                    )
+                if not_found and ex.response.status_code == 404:
+                    raise Exception(not_found)
                 raise ex
+            yield response
+
+    def _cached_output(
+        self,
+        key: CacheKey,
+        url: str,
+        params: Optional[dict] = None,
+        not_found: Optional[str] = None,
+        checkout: bool = False,
+    ) -> Optional[Path]:
+        """
+        Return the path of an output in the local output cache, downloading
+        it into the cache first if needed. Returns ``None`` if the cache is
+        disabled or the run's outputs may still change.
+
+        With ``checkout``, the returned path is a file owned by the caller
+        that isn't affected by cache eviction, see ``OutputCache.checkout``.
+        """
+        cache = get_output_cache()
+        if cache is None or not self._outputs_are_final():
+            return None
+
+        if checkout and (cached := cache.checkout(key)):
+            return cached
+        if not checkout and (cached := cache.get(key)):
+            return cached
+
+        with self._get_output(url, params, not_found) as response:
+            with cache.writer(key) as f:
+                for chunk in response.iter_content(chunk_size=DOWNLOAD_CHUNK_SIZE):
+                    f.write(chunk)
+        return cache.checkout(key) if checkout else cache.path_for(key)
+
+    def _outputs_are_final(self) -> bool:
+        # outputs of a completed run never change, so they are safe to cache.
+        # The last known status is used, fetch_status refreshes it.
+        return self._api_response.status == Status.RUN_STATUS_COMPLETED.value
+
+    def _download_report(
+        self, format: Optional[Literal["json", "html"]] = "json"
+    ) -> IO:
+        url = f"/v2/workflows/runs/{self.id}/outputs?type=report_{format}"
+        not_found = (
+            "Could not fetch a report for the task. "
+            "Please check that the workflow has a report task"
+        )
+        cache_key = (self.id, "", f"report_{format}")
+        if cached := self._cached_output(cache_key, url, not_found=not_found):
+            return io.BytesIO(cached.read_bytes())
+
+        with self._get_output(url, not_found=not_found) as response:
             return io.BytesIO(response.content)
 
     @property
     def dataset(self) -> Dataset:
-        """Get the final output Dataset of the Workflow if one exists"""
-        with self._api_provider.requests().get(
-            f"/v2/workflows/runs/{self.id}/outputs?type=dataset_parquet",
-            stream=True,
-        ) as response:
-            try:
-                response.raise_for_status()
-            except HTTPError as ex:
-                if ex.response.status_code == 404:
-                    raise Exception(
-                        "Could not fetch a dataset for the task. "
-                        "Please check that the workflow has a dataset "
-                        "producing task."
-                    )
-                raise ex
-            return Dataset.from_bytes(io.BytesIO(response.content))
+        """
+        Get the final output Dataset of the Workflow if one exists.
+
+        The dataset is streamed to a parquet file on local disk, so
+        ``dataset.to_arrow()`` can memory map it instead of loading it into
+        memory. The file is a temporary file that lives as long as the
+        returned Dataset. For completed runs it is linked from the local
+        output cache, so the dataset is only downloaded once.
+        """
+        url = f"/v2/workflows/runs/{self.id}/outputs?type=dataset_parquet"
+        not_found = (
+            "Could not fetch a dataset for the task. "
+            "Please check that the workflow has a dataset "
+            "producing task."
+        )
+        cache_key = (self.id, "", "dataset_parquet")
+        if cached := self._cached_output(
+            cache_key, url, not_found=not_found, checkout=True
+        ):
+            return _temporary_dataset(cached)
+
+        with self._get_output(url, not_found=not_found) as response:
+            return _dataset_from_response(response)
 
     @property
     def console_url(self) -> str:
@@ -245,6 +541,71 @@ class WorkflowRun:
         )
 
 
+def _write_response_to_file(response: Response, path: Path) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "wb") as f:
+        for chunk in response.iter_content(chunk_size=DOWNLOAD_CHUNK_SIZE):
+            f.write(chunk)
+
+
+def _decode_output(
+    output_type: Optional[str],
+    output_bytes: IO,
+    report_downloader: OutputDownloaderT,
+) -> Union[PydanticModel, Dataset, Report, IO]:
+    # if a format is specified, we assume the caller know what
+    # format it wants, and should return the raw bytes
+    if not output_type:
+        return output_bytes
+
+    # otherwise, if there is an output_type found, try and
+    # serialize the output to that type
+    if output_type == "dataset":
+        return Dataset.from_bytes(output_bytes)
+
+    if output_type in REPORT_OUTPUT_TYPES:
+        return Report.from_bytes(output_bytes, report_downloader)
+
+    return PydanticModel.from_bytes(output_bytes)
+
+
+def _iter_parquet_batches(path: Path, batch_size: int) -> Iterator[pd.DataFrame]:
+    parquet_file = pq.ParquetFile(path, memory_map=True)
+    for batch in parquet_file.iter_batches(batch_size=batch_size):
+        yield batch.to_pandas()
+
+
+def _dataset_from_response(response: Response) -> Dataset:
+    """
+    Stream a parquet response body to a temporary file and return a Dataset
+    backed by it. The file is removed once the Dataset is garbage collected.
+    """
+    fd, tmp_path = tempfile.mkstemp(prefix="gretel_dataset_", suffix=".parquet")
+    os.close(fd)
+    try:
+        _write_response_to_file(response, Path(tmp_path))
+    except Exception:
+        _remove_file(tmp_path)
+        raise
+
+    return _temporary_dataset(tmp_path)
+
+
+def _temporary_dataset(path: Union[str, Path]) -> Dataset:
+    """
+    Return a Dataset backed by the file at ``path``, which is removed once
+    the Dataset is garbage collected.
+    """
+    dataset = Dataset.from_file(path)
+    weakref.finalize(dataset, _remove_file, path)
+    return dataset
+
+
+def _remove_file(path: Union[str, Path]) -> None:
+    with suppress(OSError):
+        os.remove(path)
+
+
 class LoggingPrinter:
     def __init__(self, verbose: bool = True):
         self.logger = logging.getLogger(__name__)
@@ -9,6 +9,8 @@ from gretel_client.config import (
     configure_session,
 )
 from gretel_client.test_utils import TestGretelApiFactory, TestGretelResourceProvider
+from gretel_client.workflows.builder import clear_validation_cache
+from gretel_client.workflows.cache import configure_output_cache
 
 FIXTURES = Path(__file__).parent / "fixtures"
 
@@ -33,6 +35,21 @@ def configure_session_client():
     )
 
 
+@pytest.fixture(scope="function", autouse=True)
+def disable_output_cache():
+    # keep tests from reading or writing the user's workflow output cache.
+    configure_output_cache(enabled=False)
+    yield
+    configure_output_cache(enabled=False)
+
+
+@pytest.fixture(scope="function", autouse=True)
+def reset_validation_cache():
+    clear_validation_cache()
+    yield
+    clear_validation_cache()
+
+
 @pytest.fixture
 def dev_ep() -> str:
     return "https://api.dev.gretel.ai"
@@ -0,0 +1,218 @@
+from unittest.mock import MagicMock
+
+import pandas as pd
+import pytest
+
+from gretel_client.data_designer import BatchVariant, DataDesigner
+from gretel_client.data_designer.batch import (
+    MAX_BATCH_POLL_ERRORS,
+    BatchRun,
+    BatchRuns,
+)
+from gretel_client.data_designer.types import ModelSuite, SamplerColumn
+from gretel_client.files.interface import File
+from gretel_client.polling import FixedPollPolicy
+from gretel_client.workflows.builder import clear_validation_cache
+from gretel_client.workflows.logs import WaitTimeExceeded
+from gretel_client.workflows.manager import WorkflowManager
+from gretel_client.workflows.status import Status
+
+
+@pytest.fixture(autouse=True)
+def clean_validation_cache():
+    clear_validation_cache()
+    yield
+    clear_validation_cache()
+
+
+@pytest.fixture
+def api_provider() -> MagicMock:
+    api_provider = MagicMock()
+    api = api_provider.get_api.return_value
+    api.validate_workflow_task.return_value = MagicMock(valid=True, message="")
+    api.exec_workflow_batch.side_effect = lambda request: MagicMock(
+        workflow_id="w_1",
+        workflow_run_id=f"wr_{request.workflow_run_name}",
+    )
+    api.get_workflow_run.side_effect = lambda workflow_run_id: MagicMock(
+        id=workflow_run_id,
+        workflow_id="w_1",
+        config={"name": "batch"},
+        status=Status.RUN_STATUS_COMPLETED.value,
+    )
+    return api_provider
+
+
+@pytest.fixture
+def designer(api_provider: MagicMock) -> DataDesigner:
+    resource_provider = MagicMock(project_id="proj_1")
+    resource_provider.workflows = WorkflowManager(api_provider, resource_provider)
+    resource_provider.files.upload.side_effect = lambda df, purpose: File(
+        id=f"file_{len(df)}",
+        object="file",
+        bytes=1,
+        created_at=0,
+        filename="seed.parquet",
+        purpose=purpose,
+    )
+
+    designer = DataDesigner(gretel_resource_provider=resource_provider)
+    designer.add_column(
+        SamplerColumn(name="age", type="uniform", params={"low": 1, "high": 99})
+    )
+    return designer
+
+
+def test_create_batch(designer: DataDesigner, api_provider: MagicMock):
+    seed_a = pd.DataFrame({"name": ["a", "b"]})
+    seed_b = pd.DataFrame({"name": ["c", "d", "e"], "city": ["x", "y", "z"]})
+    variants = [
+        BatchVariant(num_records=10, seed_dataset=seed_a, run_name="1"),
+        BatchVariant(num_records=10, seed_dataset=seed_a, run_name="2"),
+        BatchVariant(
+            num_records=10,
+            seed_dataset=seed_b,
+            model_suite=ModelSuite.LLAMA_3_x,
+            run_name="3",
+        ),
+    ]
+
+    runs = designer.create_batch(variants, name="batch")
+
+    assert [run.workflow_run.id for run in runs] == ["wr_1", "wr_2", "wr_3"]
+    assert designer._files.upload.call_count == 2
+
+    api = api_provider.get_api.return_value
+    configs = [
+        call.args[0].workflow_config for call in api.exec_workflow_batch.call_args_list
+    ]
+    configs = {config["steps"][0]["inputs"][0]: config for config in configs}
+    assert set(configs) == {"file_2", "file_3"}
+    assert configs["file_3"]["globals"]["model_suite"] == "llama-3.x"
+
+    # the first two variants share all of their steps, the third one has
+    # different globals
+    assert api.validate_workflow_task.call_count == 2 * 3
+
+    # the designer itself is left untouched
+    assert designer._seed_dataset is None
+    assert designer.seed_columns == []
+
+
+def test_create_batch_wait_until_done(designer: DataDesigner, api_provider: MagicMock):
+    runs = designer.create_batch(
+        [BatchVariant(num_records=5, run_name=str(i)) for i in range(3)],
+        wait_until_done=True,
+    )
+
+    assert runs.done
+    assert all(run.succeeded for run in runs)
+    assert len(runs.workflow_runs) == 3
+
+
+def test_create_batch_records_submission_errors(
+    designer: DataDesigner, api_provider: MagicMock
+):
+    api = api_provider.get_api.return_value
+    submit = api.exec_workflow_batch.side_effect
+
+    def fail_second_run(request):
+        if request.workflow_run_name == "2":
+            raise RuntimeError("quota exceeded")
+        return submit(request)
+
+    api.exec_workflow_batch.side_effect = fail_second_run
+
+    runs = designer.create_batch(
+        [BatchVariant(num_records=5, run_name=str(i)) for i in range(1, 4)]
+    )
+
+    assert [run.error is None for run in runs] == [True, False, True]
+    assert runs.workflow_runs == [runs[0].workflow_run, runs[2].workflow_run]
+    assert runs[1].done
+
+
+def test_create_batch_without_variants(designer: DataDesigner):
+    with pytest.raises(ValueError):
+        designer.create_batch([])
+
+
+def test_batch_runs_share_one_poller():
+    statuses = {
+        "wr_1": iter(["RUN_STATUS_ACTIVE", "RUN_STATUS_COMPLETED"]),
+        "wr_2": iter(["RUN_STATUS_ACTIVE", "RUN_STATUS_ACTIVE", "RUN_STATUS_ERROR"]),
+    }
+    runs = []
+    for run_id, run_statuses in statuses.items():
+        workflow_run = MagicMock(id=run_id)
+        workflow_run.fetch_status.side_effect = lambda s=run_statuses: Status[next(s)]
+        runs.append(
+            BatchRun(variant=BatchVariant(num_records=1), workflow_run=workflow_run)
+        )
+    clock = MagicMock()
+    clock.monotonic.return_value = 0
+
+    batch_runs = BatchRuns(runs).wait_until_done(
+        poll_policy=FixedPollPolicy(10), clock=clock
+    )
+
+    assert [run.status for run in batch_runs] == [
+        "RUN_STATUS_COMPLETED",
+        "RUN_STATUS_ERROR",
+    ]
+    assert [run.succeeded for run in batch_runs] == [True, False]
+    assert clock.sleep.call_count == 2
+    assert runs[0].workflow_run.fetch_status.call_count == 2
+    assert runs[1].workflow_run.fetch_status.call_count == 3
+
+
+def _batch_runs(*statuses) -> BatchRuns:
+    runs = []
+    for i, run_statuses in enumerate(statuses):
+        workflow_run = MagicMock(id=f"wr_{i}")
+        workflow_run.fetch_status.side_effect = [
+            status if isinstance(status, Exception) else Status[status]
+            for status in run_statuses
+        ]
+        runs.append(
+            BatchRun(variant=BatchVariant(num_records=1), workflow_run=workflow_run)
+        )
+    return BatchRuns(runs)
+
+
+def test_batch_runs_use_session_poll_policy():
+    batch_runs = _batch_runs(["RUN_STATUS_ACTIVE", "RUN_STATUS_COMPLETED"])
+    batch_runs[0].workflow_run.session.poll_policy = FixedPollPolicy(7)
+    clock = MagicMock()
+    clock.monotonic.return_value = 0
+
+    batch_runs.wait_until_done(clock=clock)
+
+    clock.sleep.assert_called_once_with(7)
+
+
+def test_batch_runs_wait_time_exceeded():
+    batch_runs = _batch_runs(["RUN_STATUS_ACTIVE"] * 3)
+    clock = MagicMock()
+    clock.monotonic.side_effect = [0, 5, 10, 15]
+
+    with pytest.raises(WaitTimeExceeded):
+        batch_runs.wait_until_done(wait=10, poll_policy=FixedPollPolicy(5), clock=clock)
+
+
+def test_batch_runs_keep_polling_after_errors():
+    batch_runs = _batch_runs(
+        ["RUN_STATUS_ACTIVE", ConnectionError("reset"), "RUN_STATUS_COMPLETED"],
+        [ConnectionError("reset")] * MAX_BATCH_POLL_ERRORS,
+        ["RUN_STATUS_ACTIVE"] * MAX_BATCH_POLL_ERRORS + ["RUN_STATUS_COMPLETED"],
+    )
+    clock = MagicMock()
+    clock.monotonic.return_value = 0
+
+    batch_runs.wait_until_done(poll_policy=FixedPollPolicy(1), clock=clock)
+
+    assert [run.succeeded for run in batch_runs] == [True, False, True]
+    assert batch_runs.done
+    assert batch_runs[0].poll_error is None
+    assert isinstance(batch_runs[1].poll_error, ConnectionError)
+    assert batch_runs[1].workflow_run.fetch_status.call_count == MAX_BATCH_POLL_ERRORS
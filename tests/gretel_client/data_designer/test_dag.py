@@ -1,8 +1,12 @@
-from unittest.mock import MagicMock
+from contextlib import ExitStack
+from unittest.mock import MagicMock, patch
 
 import pytest
 
-from gretel_client.data_designer.dag import topologically_sort_columns
+from gretel_client.data_designer.dag import (
+    plan_column_levels,
+    topologically_sort_columns,
+)
 from gretel_client.data_designer.data_designer import DataDesigner
 from gretel_client.data_designer.types import (
     CodeValidationColumn,
@@ -85,3 +89,99 @@ def test_circular_dependencies():
     )
     with pytest.raises(ValueError, match="cyclic dependencies"):
         topologically_sort_columns(dd._dag_columns)
+
+
+def test_plan_column_levels():
+    dd = DataDesigner(gretel_resource_provider=MagicMock())
+    dd.add_column(SamplerColumn(name="topic", type=SamplerType.UUID, params={}))
+    for i in range(4):
+        dd.add_column(LLMTextColumn(name=f"text_{i}", prompt="About {{ topic }}"))
+    dd.add_column(
+        LLMCodeColumn(
+            name="code",
+            prompt="Implement {{ text_0 }}",
+            output_format=CodeLang.PYTHON,
+        )
+    )
+    dd.add_column(
+        CodeValidationColumn(
+            name="validation", code_lang=CodeLang.PYTHON, target_column="code"
+        )
+    )
+    dd.add_column(
+        ExpressionColumn(
+            name="summary", expr="{{ code_python_linter_score }} {{ text_3 }}"
+        )
+    )
+
+    plan = plan_column_levels(dd._dag_columns)
+
+    assert plan.levels == [
+        ["text_0", "text_1", "text_2", "text_3"],
+        ["code"],
+        ["validation"],
+        ["summary"],
+    ]
+    assert plan.critical_path == ["text_0", "code", "validation", "summary"]
+    assert plan.num_columns == 7
+    assert plan.depth == 4
+    assert plan.expected_speedup == 7 / 4
+
+
+def _synthetic_dag_columns(num_columns: int) -> list:
+    columns = []
+    for i in range(num_columns):
+        if i % 3 == 2:
+            columns.append(
+                CodeValidationColumn(
+                    name=f"validation_{i}",
+                    code_lang=CodeLang.PYTHON,
+                    target_column=f"code_{i - 1}",
+                )
+            )
+        else:
+            # depends on the previous column and on a side effect column of
+            # the previous validation column
+            expr = (
+                f"{{{{ code_{i - 1} }}}} {{{{ code_{i - 2}_python_linter_score }}}}"
+                if i > 2
+                else "start"
+            )
+            # skip template validation, only the sorting is benchmarked
+            columns.append(
+                ExpressionColumn.model_construct(name=f"code_{i}", expr=expr)
+            )
+    return columns
+
+
+class _CountedName(str):
+    """Column name that counts how often it is compared to other names."""
+
+    num_comparisons = 0
+
+    def __eq__(self, other):
+        _CountedName.num_comparisons += 1
+        return str.__eq__(self, other)
+
+    __hash__ = str.__hash__
+
+
+def test_sorting_scales_linearly():
+    def counted(cls: type, name: str) -> property:
+        prop = getattr(cls, name)
+        return property(lambda self: [_CountedName(c) for c in prop.fget(self)])
+
+    num_columns = 1_000
+    columns = _synthetic_dag_columns(num_columns)
+    _CountedName.num_comparisons = 0
+    with ExitStack() as stack:
+        for cls in (CodeValidationColumn, ExpressionColumn):
+            for name in ("required_columns", "side_effect_columns"):
+                stack.enter_context(patch.object(cls, name, counted(cls, name)))
+        sorted_column_names = topologically_sort_columns(columns)
+
+    assert len(sorted_column_names) == num_columns
+    # Resolving a dependency should take a constant number of comparisons.
+    # Scanning all column names, or all side effect columns, for every
+    # dependency would take about num_columns comparisons per dependency.
+    assert _CountedName.num_comparisons < 10 * num_columns
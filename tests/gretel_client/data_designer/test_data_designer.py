@@ -1,6 +1,7 @@
 import json
 import tempfile
 
+from datetime import datetime
 from unittest.mock import MagicMock
 
 import pandas as pd
@@ -9,7 +10,12 @@ import yaml
 
 from pydantic import BaseModel
 
-from gretel_client.data_designer.aidd_config import AIDDConfig
+from gretel_client.data_designer.aidd_config import (
+    AIDDConfig,
+    _validate_aidd_config,
+    clear_config_cache,
+    load_aidd_config,
+)
 from gretel_client.data_designer.data_designer import (
     DataDesigner,
     DataDesignerValidationError,
@@ -26,7 +32,12 @@ from gretel_client.data_designer.types import (
     ProviderType,
     SamplerColumn,
 )
-from gretel_client.workflows.builder import FieldViolation, WorkflowValidationError
+from gretel_client.workflows.builder import (
+    FieldViolation,
+    Message,
+    WorkflowBuilder,
+    WorkflowValidationError,
+)
 from gretel_client.workflows.configs.tasks import (
     CodeLang,
     ConcatDatasets,
@@ -40,6 +51,7 @@ from gretel_client.workflows.configs.tasks import (
     SamplerType,
     ValidateCode,
 )
+from gretel_client.workflows.manager import WorkflowManager
 
 
 class DummyStructuredModel(BaseModel):
@@ -227,6 +239,29 @@ def test_evaluation_operations():
         )
 
 
+def test_load_aidd_config_is_memoized(stub_aidd_config_str, tmp_path):
+    clear_config_cache()
+    config = load_aidd_config(stub_aidd_config_str)
+    assert _validate_aidd_config.cache_info().misses == 1
+
+    config_path = tmp_path / "config.yaml"
+    config_path.write_text(stub_aidd_config_str)
+    for source in [stub_aidd_config_str, config_path, str(config_path)]:
+        assert load_aidd_config(source) == config
+    assert _validate_aidd_config.cache_info().misses == 1
+
+    # every load returns a copy that is safe to modify
+    config.columns.pop()
+    assert load_aidd_config(stub_aidd_config_str) != config
+
+    assert load_aidd_config(yaml.safe_load(stub_aidd_config_str)) == load_aidd_config(
+        stub_aidd_config_str
+    )
+
+    clear_config_cache()
+    assert _validate_aidd_config.cache_info().currsize == 0
+
+
 def test_config_operations(stub_aidd_config_str):
     dd = DataDesigner.from_config(
         gretel_resource_provider=MagicMock(), config=stub_aidd_config_str
@@ -568,6 +603,85 @@ def test_drop_flag_false_retains_column(mock_low_level_sdk_resources):
     assert next((s for s in steps if isinstance(s, DropColumns)), None) is None
 
 
+def test_parallel_workflow_fans_out_independent_columns(mock_low_level_sdk_resources):
+    dd = _minimal_designer(mock_low_level_sdk_resources.mock_resource_provider)
+    for i in range(3):
+        dd.add_column(name=f"text_{i}", prompt="Write about {{ uid }}")
+    dd.add_column(
+        ExpressionColumn(name="joined", expr="{{ text_0 }} {{ text_1 }} {{ text_2 }}")
+    )
+
+    dd.preview(parallel=True)
+
+    calls = mock_low_level_sdk_resources.mock_workflow_builder.add_step.mock_calls
+    steps = [c[2]["step"] for c in calls]
+    inputs = [c[2]["step_inputs"] for c in calls]
+    samplers_step = steps[0]
+    generate_steps = [s for s in steps if isinstance(s, GenerateColumnFromTemplateV2)]
+
+    assert len(generate_steps) == 3
+    for step in generate_steps:
+        assert inputs[steps.index(step)] == [samplers_step]
+
+    # every branch but the first drops the columns it received
+    drop_steps = [s for s in steps if isinstance(s, DropColumns)]
+    assert [s.columns for s in drop_steps] == [["uid"], ["uid"]]
+    assert [
+        c[2]["step_name"] for c in calls if isinstance(c[2]["step"], DropColumns)
+    ] == [
+        "isolating-column-text-1",
+        "isolating-column-text-2",
+    ]
+
+    concat_index = next(i for i, s in enumerate(steps) if isinstance(s, ConcatDatasets))
+    assert inputs[concat_index] == [generate_steps[0]] + drop_steps
+    assert inputs[concat_index + 1] == [steps[concat_index]]
+
+
+@pytest.mark.parametrize(
+    "num_samples_to_judge,num_concat_steps", [(None, 1), (1, 0)], ids=["all", "sample"]
+)
+def test_parallel_workflow_only_fans_out_row_preserving_columns(
+    mock_low_level_sdk_resources, num_samples_to_judge, num_concat_steps
+):
+    dd = _minimal_designer(mock_low_level_sdk_resources.mock_resource_provider)
+    dd.add_column(name="text", prompt="Write about {{ uid }}")
+    dd.add_column(
+        LLMJudgeColumn(
+            name="judge",
+            prompt="Judge {{ uid }}",
+            rubrics=[
+                Rubric(
+                    name="test_rubric",
+                    description="test",
+                    scoring={"0": "Not Good", "1": "Good"},
+                )
+            ],
+            num_samples_to_judge=num_samples_to_judge,
+        )
+    )
+
+    dd.preview(parallel=True)
+
+    calls = mock_low_level_sdk_resources.mock_workflow_builder.add_step.mock_calls
+    steps = [c[2]["step"] for c in calls]
+    assert sum(isinstance(s, ConcatDatasets) for s in steps[1:]) == num_concat_steps
+    assert sum(isinstance(s, JudgeWithLlm) for s in steps) == 1
+
+
+def test_dry_run():
+    dd = _minimal_designer(MagicMock())
+    for i in range(3):
+        dd.add_column(name=f"text_{i}", prompt="Write about {{ uid }}")
+    dd.add_column(ExpressionColumn(name="joined", expr="{{ text_0 }} {{ text_2 }}"))
+
+    plan = dd.dry_run()
+
+    assert plan.levels == [["text_0", "text_1", "text_2"], ["joined"]]
+    assert plan.expected_speedup == 2
+    dd.workflow_manager.builder.assert_not_called()
+
+
 @pytest.mark.parametrize("from_analytics", [True, False])
 def test_error_blocks_preview_success(mock_low_level_sdk_resources, from_analytics):
     dd = _minimal_designer(mock_low_level_sdk_resources.mock_resource_provider)
@@ -623,3 +737,54 @@ def test_error_blocks_preview_success(mock_low_level_sdk_resources, from_analyti
         assert preview_result.dataset is not None
     else:
         assert preview_result.success is False
+
+
+def test_incremental_preview(monkeypatch):
+    executed_steps = []
+
+    def iter_preview(builder):
+        executed_steps.append(builder.step_names)
+        for step in builder.get_steps():
+            yield Message(
+                step=step.name,
+                stream="step_outputs",
+                payload={"dataset": [{"step": step.name}]},
+                type="",
+                ts=datetime.now(),
+            )
+
+    monkeypatch.setattr(WorkflowBuilder, "iter_preview", iter_preview)
+    resource_provider = MagicMock(project_id="proj_1")
+    resource_provider.workflows = WorkflowManager(MagicMock(), resource_provider)
+    resource_provider.files.upload.return_value.id = "file_cached"
+
+    dd = DataDesigner(gretel_resource_provider=resource_provider)
+    dd.add_column(
+        SamplerColumn(
+            name="age", type=SamplerType.UNIFORM, params={"low": 1, "high": 9}
+        )
+    )
+    dd.add_column(LLMTextColumn(name="bio", prompt="Bio for {{ age }}"))
+    dd.add_column(LLMTextColumn(name="quote", prompt="Quote for {{ age }}"))
+
+    dd.preview(validate=False)
+    sampler_step, bio_step, quote_step = executed_steps[0]
+
+    # only the edited column is generated again, from the cached bio output
+    dd.add_column(LLMTextColumn(name="quote", prompt="A quote for {{ bio }}"))
+    preview = dd.preview(validate=False, incremental=True)
+    assert executed_steps[1] == [f"resuming-from-{bio_step}", quote_step]
+    uploaded = resource_provider.files.upload.call_args.args[0]
+    assert uploaded.to_dict("records") == [{"step": bio_step}]
+    assert preview.output.to_dict("records") == [{"step": quote_step}]
+
+    # nothing changed, the cached output is returned without a workflow
+    preview = dd.preview(validate=False, incremental=True)
+    assert len(executed_steps) == 2
+    assert preview.output.to_dict("records") == [{"step": quote_step}]
+
+    dd.preview(validate=False)
+    assert executed_steps[2] == [sampler_step, bio_step, quote_step]
+
+    dd.clear_preview_cache().preview(validate=False, incremental=True)
+    assert executed_steps[3] == [sampler_step, bio_step, quote_step]
@@ -0,0 +1,122 @@
+import threading
+import time
+
+from unittest.mock import MagicMock
+
+import pandas as pd
+import pytest
+
+from gretel_client.data_designer import magic_data_designer
+from gretel_client.data_designer.data_designer import DataDesigner
+from gretel_client.data_designer.magic_data_designer import (
+    ColumnInstruction,
+    MagicError,
+)
+from gretel_client.data_designer.types import LLMTextColumn, SamplerColumn
+from gretel_client.workflows.configs.tasks import SamplerType
+
+
+@pytest.fixture
+def designer() -> DataDesigner:
+    designer = DataDesigner(gretel_resource_provider=MagicMock())
+    designer.add_column(
+        SamplerColumn(
+            name="product", type=SamplerType.CATEGORY, params={"values": ["a"]}
+        )
+    )
+    return designer
+
+
+@pytest.fixture
+def executed_tasks(monkeypatch) -> list:
+    executed_tasks = []
+    # every instruction has to be in flight at the same time to pass the barrier
+    barrier = threading.Barrier(3, timeout=5)
+
+    def execute_stateless_task(task, workflow_manager, output_type_name, globals):
+        position = len(executed_tasks)
+        executed_tasks.append(task)
+        barrier.wait()
+        if task.name == "fail":
+            raise magic_data_designer.RemoteExecutionError("stream halted")
+        # finish in the reverse order of submission
+        time.sleep(0.05 * (3 - position))
+        if output_type_name == "serializable_conditional_data_column":
+            return SamplerColumn(
+                name=task.name, type=SamplerType.CATEGORY, params={"values": ["x"]}
+            ).pack()
+        return {"name": task.name, "prompt": f"{task.instruction} {{{{ product }}}}"}
+
+    monkeypatch.setattr(
+        magic_data_designer, "execute_stateless_task", execute_stateless_task
+    )
+    return executed_tasks
+
+
+def test_add_columns(designer: DataDesigner, executed_tasks: list):
+    designer.magic.add_columns(
+        [
+            ColumnInstruction(name="review", instruction="Review"),
+            ColumnInstruction(name="title", instruction="Title"),
+            ColumnInstruction(name="rating", instruction="Rating", sampler=True),
+        ]
+    )
+
+    assert list(designer._columns) == ["product", "review", "title", "rating"]
+    assert designer.get_column("review").prompt == "Review {{ product }}"
+    assert isinstance(designer.get_column("title"), LLMTextColumn)
+    assert isinstance(designer.get_column("rating"), SamplerColumn)
+
+    # all instructions only see the columns from before the batch
+    for task in executed_tasks:
+        if hasattr(task, "existing_columns"):
+            assert [c.name for c in task.existing_columns.columns] == ["product"]
+
+
+def test_add_columns_with_preview(designer: DataDesigner, executed_tasks: list):
+    outputs = {"review": ["r"], "title": ["t"], "product": ["a"], "slogan": ["s"]}
+    preview = MagicMock()
+    preview.dataset.df = pd.DataFrame(outputs)
+    designer.preview = MagicMock(return_value=preview)
+
+    designer.magic.add_columns(
+        {"review": "Review", "title": "Title", "slogan": "Slogan"},
+        preview=True,
+        save=False,
+    )
+
+    designer.preview.assert_called_once()
+    # the columns are buffered until saved
+    assert list(designer._columns) == ["product"]
+    designer.magic.save()
+    assert list(designer._columns) == ["product", "review", "title", "slogan"]
+
+
+def test_add_columns_partial_failure(designer: DataDesigner, executed_tasks: list):
+    with pytest.raises(MagicError, match="1 of 3 columns: fail"):
+        designer.magic.add_columns(
+            {"review": "Review", "fail": "Fail", "title": "Title"}
+        )
+
+    assert list(designer._columns) == ["product", "review", "title"]
+
+
+def test_add_columns_duplicate_names(designer: DataDesigner):
+    with pytest.raises(ValueError):
+        designer.magic.add_columns(
+            [
+                ColumnInstruction(name="review", instruction="Review"),
+                ColumnInstruction(name="review", instruction="Another review"),
+            ]
+        )
+
+
+def test_add_columns_unknown_dependency(designer: DataDesigner):
+    with pytest.raises(KeyError):
+        designer.magic.add_columns(
+            [
+                ColumnInstruction(
+                    name="review", instruction="Review", must_depend_on=["price"]
+                )
+            ]
+        )
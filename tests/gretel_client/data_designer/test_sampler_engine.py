@@ -0,0 +1,216 @@
+import uuid
+
+from unittest.mock import MagicMock, patch
+
+import pandas as pd
+import pytest
+
+from gretel_client.data_designer.data_designer import DataDesigner
+from gretel_client.data_designer.exceptions import DataDesignerValidationError
+from gretel_client.data_designer.sampler_engine import (
+    PARAMS_BY_SAMPLER_TYPE,
+    SamplerEngine,
+    sample_columns,
+)
+from gretel_client.data_designer.types import LLMTextColumn, SamplerColumn
+from gretel_client.workflows.configs.tasks import ColumnConstraint, SamplerType
+
+
+@pytest.fixture
+def columns() -> list[SamplerColumn]:
+    return [
+        SamplerColumn(name="id", type=SamplerType.UUID, params={}),
+        SamplerColumn(
+            name="age",
+            type=SamplerType.GAUSSIAN,
+            params={"mean": 40, "stddev": 10},
+            convert_to="int",
+        ),
+        SamplerColumn(
+            name="pet",
+            type=SamplerType.CATEGORY,
+            params={"values": ["dog", "cat"], "weights": [3, 1]},
+            conditional_params={"age < 30": {"values": ["fish"]}},
+        ),
+        SamplerColumn(
+            name="breed",
+            type=SamplerType.SUBCATEGORY,
+            params={
+                "category": "pet",
+                "values": {"dog": ["lab", "pug"], "cat": ["siamese"], "fish": ["gold"]},
+            },
+        ),
+        SamplerColumn(
+            name="joined",
+            type=SamplerType.DATETIME,
+            params={"start": "2020-01-01", "end": "2020-12-31"},
+        ),
+        SamplerColumn(
+            name="renewed",
+            type=SamplerType.TIMEDELTA,
+            params={"dt_min": 1, "dt_max": 30, "reference_column_name": "joined"},
+        ),
+        SamplerColumn(name="kids", type=SamplerType.POISSON, params={"mean": 2}),
+        SamplerColumn(name="vip", type=SamplerType.BERNOULLI, params={"p": 0.3}),
+        SamplerColumn(
+            name="visits", type=SamplerType.BINOMIAL, params={"n": 10, "p": 0.5}
+        ),
+        SamplerColumn(
+            name="score", type=SamplerType.UNIFORM, params={"low": 0, "high": 1}
+        ),
+    ]
+
+
+def test_sample_columns(columns: list[SamplerColumn]):
+    df = sample_columns(columns, 1000, seed=42)
+
+    assert len(df) == 1000
+    assert list(df.columns) == [c.name for c in columns]
+    assert df["id"].map(lambda u: uuid.UUID(u).version).eq(4).all()
+    assert df["age"].dtype == "int64"
+    assert set(df["breed"]) == {"lab", "pug", "siamese", "gold"}
+    assert df["score"].between(0, 1).all()
+    assert df["vip"].isin([0, 1]).all()
+    assert df["visits"].between(0, 10).all()
+
+    joined = df["joined"]
+    assert joined.between("2020-01-01", "2020-12-31").all()
+    delta = (df["renewed"] - joined).dt.days
+    assert delta.between(1, 29).all()
+
+
+def test_unsupported_sampler_type(columns: list[SamplerColumn]):
+    with patch.dict(PARAMS_BY_SAMPLER_TYPE):
+        del PARAMS_BY_SAMPLER_TYPE[SamplerType.POISSON]
+        with pytest.raises(ValueError, match="`poisson` can't be sampled locally"):
+            SamplerEngine(columns)
+
+
+def test_sample_columns_is_reproducible(columns: list[SamplerColumn]):
+    pd.testing.assert_frame_equal(
+        sample_columns(columns, 100, seed=1), sample_columns(columns, 100, seed=1)
+    )
+
+
+def test_conditional_params(columns: list[SamplerColumn]):
+    df = sample_columns(columns, 1000, seed=42)
+
+    young = df["age"] < 30
+    assert young.any()
+    assert (df.loc[young, "pet"] == "fish").all()
+    assert df.loc[~young, "pet"].isin(["dog", "cat"]).all()
+    assert (df.loc[df["pet"] == "cat", "breed"] == "siamese").all()
+
+
+def test_constraints(columns: list[SamplerColumn]):
+    constraints = [
+        ColumnConstraint(
+            target_column="age",
+            type="scalar_inequality",
+            params={"operator": "ge", "rhs": 35},
+        ),
+        ColumnConstraint(
+            target_column="visits",
+            type="column_inequality",
+            params={"operator": "gt", "rhs": "kids"},
+        ),
+    ]
+
+    df = sample_columns(columns, 500, constraints=constraints, seed=42)
+
+    assert len(df) == 500
+    assert (df["age"] >= 35).all()
+    assert (df["visits"] > df["kids"]).all()
+
+
+def test_unsatisfiable_constraints(columns: list[SamplerColumn]):
+    constraint = ColumnConstraint(
+        target_column="score",
+        type="scalar_inequality",
+        params={"operator": "gt", "rhs": 2},
+    )
+    with pytest.raises(DataDesignerValidationError):
+        sample_columns(columns, 10, constraints=[constraint])
+
+
+def test_convert_to():
+    df = sample_columns(
+        [
+            SamplerColumn(
+                name="day",
+                type=SamplerType.DATETIME,
+                params={"start": "2024-01-01", "end": "2024-01-31"},
+                convert_to="%Y/%m/%d",
+            ),
+            SamplerColumn(
+                name="id",
+                type=SamplerType.UUID,
+                params={"prefix": "user_", "short_form": True, "uppercase": True},
+            ),
+        ],
+        100,
+    )
+
+    assert df["day"].str.match(r"2024/01/\d\d").all()
+    assert df["id"].str.fullmatch(r"user_[0-9A-F]{8}").all()
+
+
+def test_circular_dependencies():
+    columns = [
+        SamplerColumn(
+            name="a",
+            type=SamplerType.CATEGORY,
+            params={"values": [1, 2]},
+            conditional_params={"b == 1": {"values": [3]}},
+        ),
+        SamplerColumn(
+            name="b",
+            type=SamplerType.CATEGORY,
+            params={"values": [1, 2]},
+            conditional_params={"a == 1": {"values": [3]}},
+        ),
+    ]
+    with pytest.raises(DataDesignerValidationError, match="circular"):
+        SamplerEngine(columns)
+
+
+def test_person_sampler():
+    pytest.importorskip("faker")
+    df = sample_columns(
+        [
+            SamplerColumn(
+                name="customer",
+                type=SamplerType.PERSON,
+                params={"sex": "Female", "age_range": [20, 30], "state": ["NY"]},
+            )
+        ],
+        20,
+        seed=42,
+    )
+
+    people = df["customer"].tolist()
+    assert all(p["sex"] == "Female" for p in people)
+    assert all(20 <= p["age"] <= 30 for p in people)
+    assert all(p["region"] == "NY" for p in people)
+
+
+def test_preview_samplers(columns: list[SamplerColumn]):
+    dd = DataDesigner(gretel_resource_provider=MagicMock())
+    for column in columns:
+        dd.add_column(column)
+    dd.add_column(LLMTextColumn(name="bio", prompt="Write a bio for {{ age }}"))
+    dd.add_column(
+        SamplerColumn(
+            name="tmp",
+            type=SamplerType.UNIFORM,
+            params={"low": 0, "high": 1},
+            drop=True,
+        )
+    )
+
+    preview = dd.preview_samplers(num_records=50, seed=0)
+
+    assert preview.success
+    assert len(preview.dataset.df) == 50
+    assert list(preview.dataset.df.columns) == [c.name for c in columns]
+    dd.workflow_manager.builder.assert_not_called()
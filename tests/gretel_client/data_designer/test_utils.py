@@ -3,11 +3,19 @@ import json
 from datetime import date
 from unittest.mock import Mock, patch
 
+import pytest
+
 from gretel_client.data_designer.utils import (
     CallbackOnMutateDict,
+    UserJinjaTemplateSyntaxError,
+    assert_valid_jinja2_template,
     camel_to_kebab,
     camel_to_snake,
+    clear_remote_config_cache,
+    clear_template_cache,
     fetch_config_if_remote,
+    find_template_references,
+    get_prompt_template_keywords,
     get_task_log_emoji,
     make_date_obj_serializable,
 )
@@ -61,6 +69,29 @@ def test_fetch_config_if_remote():
         assert fetch_config_if_remote(local_config) == local_config
 
 
+def test_fetch_config_if_remote_caches_remote_configs():
+    remote_url = "https://gretel.ai/configs/cached.yaml"
+    clear_remote_config_cache()
+    with patch("requests.get") as mock_get:
+        mock_get.return_value.content = b"model_suite: apache-2.0"
+        assert fetch_config_if_remote(remote_url) == "model_suite: apache-2.0"
+        assert fetch_config_if_remote(remote_url) == "model_suite: apache-2.0"
+        assert mock_get.call_count == 1
+
+        fetch_config_if_remote(remote_url, use_cache=False)
+        assert mock_get.call_count == 2
+
+        clear_remote_config_cache()
+        fetch_config_if_remote(remote_url)
+        assert mock_get.call_count == 3
+
+        mock_get.return_value.ok = False
+        clear_remote_config_cache()
+        fetch_config_if_remote(remote_url)
+        fetch_config_if_remote(remote_url)
+        assert mock_get.call_count == 5
+
+
 def test_callback_on_mutate_dict():
     mock_fn = Mock()
     mock_fn.return_value = None
@@ -110,3 +141,27 @@ def test_callback_on_mutate_dict():
     assert mock_fn.call_count == 2
     assert test_dict == {"hi": "hello", "foo": "baz"}
     mock_fn.reset_mock()
+
+
+def test_template_references_are_cached():
+    clear_template_cache()
+    template = "Write about {{ topic }} in {{ language }}"
+
+    keywords = get_prompt_template_keywords(template)
+    keywords.add("not_a_reference")
+    assert_valid_jinja2_template(template)
+
+    assert get_prompt_template_keywords(template) == {"topic", "language"}
+    info = find_template_references.cache_info()
+    assert info.misses == 1
+    assert info.hits == 2
+
+
+def test_invalid_templates_are_not_cached():
+    clear_template_cache()
+
+    for _ in range(2):
+        with pytest.raises(UserJinjaTemplateSyntaxError):
+            assert_valid_jinja2_template("{{ unclosed")
+
+    assert find_template_references.cache_info().currsize == 0
@@ -0,0 +1,91 @@
+import io
+import json
+
+from unittest.mock import patch
+
+import pandas as pd
+import pytest
+
+from rich.console import Console
+
+from gretel_client.data_designer import viz_tools
+from gretel_client.data_designer.preview import PreviewResults
+from gretel_client.data_designer.viz_tools import AIDDMetadata, RecordRenderPlan
+
+
+@pytest.fixture
+def output() -> io.StringIO:
+    output = io.StringIO()
+    with patch.object(viz_tools, "console", Console(file=output, width=200)):
+        yield output
+
+
+@pytest.fixture
+def aidd_metadata() -> AIDDMetadata:
+    return AIDDMetadata(
+        seed_columns=["topic"],
+        sampler_columns=["age", "tmp"],
+        llm_text_columns=["summary"],
+        llm_structured_columns=["details"],
+        llm_code_columns=["solution"],
+        code_langs=["python"],
+        drop_columns=["tmp"],
+    )
+
+
+@pytest.fixture
+def df() -> pd.DataFrame:
+    return pd.DataFrame(
+        {
+            "topic": ["math", "art"],
+            "age": [30, 40],
+            "tmp": [1, 2],
+            "summary": ["[draft] " + "x" * 100, "short"],
+            "details": [json.dumps({"level": 1}), json.dumps({"level": 2})],
+            "solution": ["print(1)", "print(2)"],
+        }
+    )
+
+
+def test_render_plan(aidd_metadata: AIDDMetadata, df: pd.DataFrame):
+    plan = RecordRenderPlan.from_metadata(aidd_metadata, dataset=df)
+
+    assert plan.seed_columns == ("topic",)
+    assert plan.generated_columns == ("age", "summary", "details")
+    assert plan.code_columns == (("solution", "python"),)
+    assert plan.json_columns == {"summary", "details"}
+
+    plan = RecordRenderPlan.from_metadata(aidd_metadata, hide_seed_columns=True)
+    assert plan.seed_columns == ()
+    assert plan.json_columns is None
+
+
+def test_display_sample_record_truncates_long_cells(
+    aidd_metadata: AIDDMetadata, df: pd.DataFrame, output: io.StringIO
+):
+    viz_tools.display_sample_record(
+        df.iloc[0].to_dict(), aidd_metadata, max_cell_length=20
+    )
+
+    rendered = output.getvalue()
+    assert "[draft] xxxxxxxxxxxx… [88 more characters]" in rendered
+    assert "'level': 1" in rendered
+    assert "print(1)" in rendered
+    assert "tmp" not in rendered
+
+
+def test_preview_results_reuse_render_plan(
+    aidd_metadata: AIDDMetadata, df: pd.DataFrame, output: io.StringIO
+):
+    preview = PreviewResults(aidd_metadata=aidd_metadata, output=df)
+
+    with patch.object(
+        RecordRenderPlan, "from_metadata", wraps=RecordRenderPlan.from_metadata
+    ) as from_metadata:
+        preview.display_sample_record()
+        preview.display_sample_record()
+        preview.display_sample_record(index=0)
+
+    from_metadata.assert_called_once()
+    assert output.getvalue().count("[index: 0]") == 2
+    assert output.getvalue().count("[index: 1]") == 1
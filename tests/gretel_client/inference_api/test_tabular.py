@@ -10,8 +10,9 @@ import gretel_client.inference_api.base as api_base
 import gretel_client.inference_api.tabular as tabular
 
 from gretel_client.inference_api.tabular import GretelInferenceAPIError
+from gretel_client.polling import FixedPollPolicy
 
-tabular.STREAM_SLEEP_TIME = 0
+tabular.STREAM_POLL_POLICY = FixedPollPolicy(0)
 
 # two data points to cap off the end of the stream
 ENDING_STREAM_DATA = [
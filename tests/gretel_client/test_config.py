@@ -90,6 +90,32 @@ def test_can_get_api_bindings():
     assert isinstance(client.get_api(ProjectsApi), ProjectsApi)
 
 
+@patch.dict(os.environ, {"GRETEL_API_KEY": "grtutest"})
+@pytest.mark.parametrize("endpoint", ["get_model", "get_record_handler"])
+def test_get_api_sends_logs_offset(endpoint: str):
+    api = ClientConfig.from_env().get_api(ProjectsApi)
+    api.api_client.call_api = MagicMock()
+    ids = {"project_id": "proj", "model_id": "model"}
+    if endpoint == "get_record_handler":
+        ids["record_handler_id"] = "rh"
+
+    getattr(api, endpoint)(**ids, logs_offset=10)
+
+    assert ("logs_offset", 10) in api.api_client.call_api.call_args.args[3]
+
+
+@patch.dict(os.environ, {"GRETEL_API_KEY": "grtutest"})
+def test_get_api_sends_search_projects_skip():
+    api = ClientConfig.from_env().get_api(ProjectsApi)
+    api.api_client.call_api = MagicMock()
+
+    api.search_projects(skip=100, limit=50)
+
+    query_params = api.api_client.call_api.call_args.args[3]
+    assert ("skip", 100) in query_params
+    assert ("limit", 50) in query_params
+
+
 @patch.dict(
     os.environ, {"GRETEL_API_KEY": "grtutest", "http_proxy": "http://localhost:8080"}
 )
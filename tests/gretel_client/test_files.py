@@ -1,5 +1,11 @@
+import io
+import threading
+
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from unittest.mock import MagicMock, patch
 
+import numpy as np
+import pandas as pd
 import pytest
 
 from gretel_client.files.interface import File, FileClient
@@ -44,3 +50,84 @@ def test_file_not_exists():
         client.upload("non_existent_file.txt", "test")
 
     assert "No such file or directory" in str(ex)
+
+
+class _ParquetHandler(BaseHTTPRequestHandler):
+    body: bytes = b""
+    support_ranges = True
+    requested_bytes: list[int] = []
+
+    def do_GET(self):
+        body = self.body
+        byte_range = self.headers.get("Range")
+        if self.support_ranges and byte_range:
+            start, end = byte_range.removeprefix("bytes=").split("-")
+            if not start:
+                start, end = max(0, len(body) - int(end)), len(body) - 1
+            start, end = int(start), min(int(end), len(body) - 1)
+            self.send_response(206)
+            self.send_header("Content-Range", f"bytes {start}-{end}/{len(body)}")
+            body = body[start : end + 1]
+        else:
+            self.send_response(200)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+        type(self).requested_bytes.append(len(body))
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def parquet_server():
+    df = pd.DataFrame(
+        {
+            "name": [f"name-{i}" for i in range(100_000)],
+            "value": np.random.default_rng(0).random(100_000),
+        },
+        index=pd.Index(np.arange(100_000) * 2, name="idx"),
+    )
+    buffer = io.BytesIO()
+    df.to_parquet(buffer)
+    _ParquetHandler.body = buffer.getvalue()
+    _ParquetHandler.requested_bytes = []
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _ParquetHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield server
+    finally:
+        server.shutdown()
+        server.server_close()
+        _ParquetHandler.support_ranges = True
+
+
+def _client(server) -> FileClient:
+    host, port = server.server_address
+    return FileClient(
+        session=MagicMock(api_key="key"), api_endpoint=f"http://{host}:{port}"
+    )
+
+
+def test_get_dataset_columns_reads_footer_only(parquet_server):
+    client = _client(parquet_server)
+
+    assert client.get_dataset_columns("file_1") == ["name", "value"]
+    assert client.get_dataset_schema("file_1").names == ["name", "value", "idx"]
+    assert _ParquetHandler.requested_bytes
+    assert max(_ParquetHandler.requested_bytes) < len(_ParquetHandler.body) / 10
+
+
+def test_get_dataset_columns_without_range_support(parquet_server):
+    _ParquetHandler.support_ranges = False
+
+    assert _client(parquet_server).get_dataset_columns("file_1") == ["name", "value"]
+
+
+def test_get_dataset_schema_not_parquet(parquet_server):
+    _ParquetHandler.body = b"id,name\n1,a\n"
+
+    with pytest.raises(ValueError):
+        _client(parquet_server).get_dataset_schema("file_1")
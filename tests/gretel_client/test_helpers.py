@@ -0,0 +1,143 @@
+import copy
+import json
+
+from typing import Callable, List, Optional
+from unittest.mock import MagicMock
+
+import pytest
+
+from gretel_client.config import DefaultClientConfig
+from gretel_client.helpers import (
+    MAX_POLL_ERRORS,
+    _ProgressLine,
+    _QuietPrinter,
+    poll_many,
+)
+from gretel_client.polling import FixedPollPolicy
+from gretel_client.projects.jobs import LogStatus
+from gretel_client.projects.models import Model
+
+
+@pytest.fixture
+def get_model_resp(get_fixture: Callable) -> dict:
+    return json.loads(get_fixture("api/completed_model_details.json").read_text())
+
+
+def _log(msg: str, stage: str = "train", **ctx) -> dict:
+    return {"ts": "2021-05-12T03:15:36Z", "msg": msg, "ctx": ctx, "stage": stage}
+
+
+def _model(
+    model_id: str, get_model_resp: dict, polls: List[tuple[str, Optional[list]]]
+) -> Model:
+    responses = []
+    for status, logs in [("created", None)] + polls:
+        resp = copy.deepcopy(get_model_resp)
+        resp["data"]["model"]["status"] = status
+        resp["data"]["logs"] = logs
+        responses.append(resp)
+
+    project = MagicMock()
+    project.session = DefaultClientConfig(
+        api_key="grtu...", poll_policy=FixedPollPolicy(0)
+    )
+    project.projects_api.get_model.side_effect = responses
+    return Model(project=project, model_id=model_id)
+
+
+def test_poll_many_yields_jobs_as_they_complete(get_model_resp: dict):
+    slow = _model(
+        "m_slow",
+        get_model_resp,
+        [("pending", None), ("active", None), ("completed", None)],
+    )
+    fast = _model("m_fast", get_model_resp, [("active", None), ("completed", None)])
+    callback = MagicMock()
+
+    finished = list(poll_many([slow, fast], verbose=False, callback=callback))
+
+    assert [job.id for job in finished] == ["m_fast", "m_slow"]
+    assert callback.call_count == 3
+
+
+def test_poll_many_prefixes_output_with_job_id(get_model_resp: dict, capsys):
+    first = _model(
+        "m_1",
+        get_model_resp,
+        [("active", [_log("training m_1")]), ("completed", None)],
+    )
+    failed_resp = copy.deepcopy(get_model_resp)
+    failed_resp["data"]["model"]["error_msg"] = "boom"
+    second = _model(
+        "m_2",
+        failed_resp,
+        [("active", [_log("training m_2")]), ("error", None)],
+    )
+
+    list(poll_many([first, second], max_concurrency=2))
+
+    err = capsys.readouterr().err
+    assert "INFO: Starting poller for 2 jobs" in err
+    assert "[m_1] 2021-05-12T03:15:36Z  training m_1" in err
+    assert "[m_2] 2021-05-12T03:15:36Z  training m_2" in err
+    assert "[m_2] ERROR: \tboom" in err
+
+
+def test_poll_many_wait_exceeded(get_model_resp: dict, capsys):
+    job = _model("m_1", get_model_resp, [("active", None)])
+
+    assert list(poll_many([job], wait=0, verbose=False)) == []
+    assert "not waiting for the job completion" in capsys.readouterr().err
+
+
+def test_poll_many_keeps_polling_after_errors(get_model_resp: dict, capsys):
+    flaky = _model("m_flaky", get_model_resp, [("active", None), ("completed", None)])
+    api = flaky.project.projects_api
+    responses = list(api.get_model.side_effect)
+    # one refresh of the job fails, the next one succeeds
+    api.get_model.side_effect = [responses[0], ConnectionError("reset")] + responses[1:]
+    other = _model("m_other", get_model_resp, [("active", None), ("completed", None)])
+
+    finished = list(poll_many([flaky, other], verbose=False))
+
+    assert [job.id for job in finished] == ["m_other", "m_flaky"]
+    assert "[m_flaky] WARN: Could not refresh the job (1/" in capsys.readouterr().err
+
+
+def test_poll_many_gives_up_on_failing_jobs(get_model_resp: dict):
+    broken = _model("m_broken", get_model_resp, [])
+    api = broken.project.projects_api
+    api.get_model.side_effect = [ConnectionError("reset")] * MAX_POLL_ERRORS
+    other = _model(
+        "m_other",
+        get_model_resp,
+        [("active", None)] * (MAX_POLL_ERRORS + 1) + [("completed", None)],
+    )
+
+    finished = []
+    with pytest.raises(ExceptionGroup, match="m_broken") as excinfo:
+        for job in poll_many([broken, other], verbose=False):
+            finished.append(job)
+
+    assert [job.id for job in finished] == ["m_other"]
+    assert excinfo.group_contains(ConnectionError)
+
+
+def test_progress_bars_of_jobs_stack(capsys):
+    progress = _ProgressLine()
+    first = _QuietPrinter(num_epochs=10, prefix="[m_1] ", progress=progress)
+    second = _QuietPrinter(num_epochs=10, prefix="[m_2] ", progress=progress)
+
+    def epoch(printer: _QuietPrinter, n: int):
+        printer.print_update(LogStatus(status="active", logs=[_log("epoch", epoch=n)]))
+
+    epoch(first, 1)
+    epoch(first, 2)
+    epoch(second, 1)
+
+    out = capsys.readouterr().out
+    bars = out.split("\n")
+    # updates of the same job redraw the line, another job starts a new line
+    assert len(bars) == 2
+    assert "[m_1] Training: " in bars[0] and "2/10" in bars[0]
+    assert "[m_2] Training: " in bars[1] and "1/10" in bars[1]
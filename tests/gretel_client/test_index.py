@@ -0,0 +1,119 @@
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from gretel_client.projects.index import MetadataIndex, configure_metadata_index
+from gretel_client.projects.models import Model
+from gretel_client.projects.projects import Project, get_project
+
+
+def _project(i: int) -> dict:
+    return {"_id": f"p_{i}", "guid": f"proj_{i}", "name": f"project-{i}"}
+
+
+def _model(i: int) -> dict:
+    return {
+        "uid": f"m_{i}",
+        "name": f"model-{i}",
+        "status": "completed" if i % 2 else "active",
+        "last_modified": f"2024-01-{i + 1:02d}T00:00:00",
+    }
+
+
+@pytest.fixture
+def session() -> MagicMock:
+    session = MagicMock(endpoint="https://api.gretel.cloud", api_key="grtu...")
+    api = session.get_api.return_value
+    api.projects = [_project(0)]
+    api.models = [_model(i) for i in range(3)]
+
+    def get_models(project_id, skip, limit, sort_by=None, **_):
+        models = sorted(api.models, key=lambda m: m["last_modified"])
+        if sort_by == "desc":
+            models.reverse()
+        return {"data": {"models": models[skip : skip + limit]}}
+
+    api.search_projects.side_effect = lambda skip, limit, **_: {
+        "data": {"projects": api.projects[skip : skip + limit]}
+    }
+    api.get_project.side_effect = lambda project_id: {
+        "data": {"project": next(p for p in api.projects if p["name"] == project_id)}
+    }
+    api.get_models.side_effect = get_models
+    return session
+
+
+@pytest.fixture
+def index(tmp_path: Path):
+    yield configure_metadata_index(path=tmp_path / "metadata.db")
+    configure_metadata_index(enabled=False)
+
+
+def test_get_project_uses_index(index: MetadataIndex, session: MagicMock):
+    api = session.get_api.return_value
+
+    first = get_project(name="project-0", session=session)
+    second = get_project(name="project-0", session=session)
+
+    assert first.project_id == second.project_id == "p_0"
+    api.get_project.assert_called_once()
+
+
+def test_index_hits_do_not_extend_ttl(tmp_path: Path, session: MagicMock):
+    api = session.get_api.return_value
+    configure_metadata_index(path=tmp_path / "metadata.db", ttl=10)
+    try:
+        with patch("gretel_client.projects.index.time.time") as now:
+            for now.return_value in [0, 4, 8, 12]:
+                get_project(name="project-0", session=session)
+    finally:
+        configure_metadata_index(enabled=False)
+
+    # fetched at 0 and again at 12, once the first entry expired
+    assert api.get_project.call_count == 2
+
+
+def test_index_entries_expire(tmp_path: Path, session: MagicMock):
+    index = MetadataIndex(tmp_path / "metadata.db", ttl=0)
+    index.record_projects(session, [_project(0)])
+
+    assert index.get_project(session, "project-0") is None
+
+
+def test_index_is_scoped_to_credentials(index: MetadataIndex, session: MagicMock):
+    index.record_projects(session, [_project(0)])
+    other = MagicMock(endpoint="https://api.gretel.cloud", api_key="grtu-other")
+
+    assert index.get_project(session, "proj_0") == _project(0)
+    assert index.get_project(other, "proj_0") is None
+
+
+def test_sync_is_incremental(index: MetadataIndex, session: MagicMock):
+    api = session.get_api.return_value
+
+    result = index.sync(session)
+    assert (result.projects, result.models) == (1, 3)
+
+    api.models.append(_model(3))
+    result = index.sync(session)
+    assert result.models == 1
+
+    result = index.sync(session, full=True)
+    assert result.models == 4
+
+
+def test_search_models_from_synced_index(index: MetadataIndex, session: MagicMock):
+    api = session.get_api.return_value
+    index.sync(session)
+    api.get_models.reset_mock()
+    project = Project(name="project-0", project_id="p_0", session=session)
+
+    models = list(project.search_models(factory=Model, sort_by="desc"))
+    completed = list(
+        project.search_models(factory=dict, status="completed", model_name="del-1")
+    )
+
+    assert [m.model_id for m in models] == ["m_2", "m_1", "m_0"]
+    assert [m["uid"] for m in completed] == ["m_1"]
+    api.get_models.assert_not_called()
@@ -1,5 +1,6 @@
 import json
 import tempfile
+import threading
 
 from pathlib import Path
 from typing import Callable, List
@@ -163,6 +164,32 @@ def test_model_create(m: Model, create_model_resp: dict, runner_mode):
     assert m.worker_key == create_model_resp["worker_key"]
 
 
+def test_submit_remote_updates_config_after_uploads(
+    m: Model, transform_local_data_source: Path
+):
+    m.data_source = str(transform_local_data_source)
+    m.ref_data = RefData({"seed": str(transform_local_data_source)})
+    config = m.model_config["models"][0][m.model_type]
+    # both uploads have to be in flight at the same time to pass the barrier
+    barrier = threading.Barrier(2, timeout=5)
+    seen_configs = []
+
+    def upload_artifacts(artifact_paths, **_):
+        artifact_paths = list(artifact_paths)
+        barrier.wait()
+        seen_configs.append((config["data_source"], dict(config["ref_data"])))
+        return [f"gretel_{len(artifact_paths)}_{len(seen_configs)}"]
+
+    m.project.upload_artifacts.side_effect = upload_artifacts
+    m.submit_cloud()
+
+    # the uploads never see each other's changes to the config
+    source = str(transform_local_data_source)
+    assert seen_configs == [(source, {"seed": source})] * 2
+    assert config["data_source"].startswith("gretel_")
+    assert config["ref_data"]["seed"].startswith("gretel_")
+
+
 def test_model_submit_bad_runner_modes(m: Model):
     with pytest.raises(ValueError) as err:
         m.submit(runner_mode="foo")
@@ -229,6 +256,56 @@ def test_does_poll_status_and_logs(
     assert len(updates) == 8
 
 
+class _LogCursorProjectsApi:
+    """Stub of the model details endpoint that honors the log cursor."""
+
+    def __init__(self, responses: List[tuple[str, List[dict]]]):
+        self._responses = iter(responses)
+        self.sent_logs: List[List[dict]] = []
+
+    def get_model(self, project_id, model_id, expand, logs_offset=0):
+        status, logs = next(self._responses)
+        new_logs = logs[logs_offset:]
+        self.sent_logs.append(new_logs)
+        return {
+            "data": {
+                "model": {"status": status},
+                "logs": new_logs,
+                "logs_offset": logs_offset,
+            }
+        }
+
+
+@patch("time.sleep")
+def test_poll_logs_status_only_fetches_new_logs(
+    sleep_patch: MagicMock, m: Model, model_logs: List[dict]
+):
+    m.submit(runner_mode=RunnerMode.LOCAL)
+    stub = _LogCursorProjectsApi(
+        [
+            ("active", model_logs[0:2]),
+            ("active", model_logs[0:2]),
+            ("active", model_logs[0:5]),
+            ("active", model_logs),
+            ("completed", model_logs),
+        ]
+    )
+    m._projects_api = stub
+
+    updates = list(m.poll_logs_status())
+
+    assert [log for update in updates for log in update.logs] == model_logs
+    assert m.logs == model_logs
+    # every log line is transferred exactly once
+    assert stub.sent_logs == [
+        model_logs[0:2],
+        [],
+        model_logs[2:5],
+        model_logs[5:],
+        [],
+    ]
+
+
 def test_provenance(m: Model, transform_model_path):
     # When job provenance data is present, the body of the API request nests
     # the model config under "config" and the provenance data under "provenance"
@@ -306,6 +383,53 @@ def test_does_populate_record_details(
     )
 
 
+def test_submit_record_handlers(
+    m: Model, create_record_handler_resp: dict, tmp_path: Path
+):
+    m._poll_job_endpoint()
+    seed = tmp_path / "seed.csv"
+    seed.write_text("name\nalice\n")
+    m.project.upload_artifacts.side_effect = lambda sources, **_: [
+        f"gretel_{i}" for i, _ in enumerate(sources)
+    ]
+
+    def create_record_handler(body, **_):
+        if body["params"]["num_records"] == 13:
+            raise MaxConcurrentJobsException()
+        return create_record_handler_resp
+
+    m._projects_api.create_record_handler.side_effect = create_record_handler
+
+    batch = m.submit_record_handlers(
+        [
+            m.create_record_handler_obj(
+                data_source=str(seed),
+                params={"num_records": n},
+                ref_data={"seed": str(seed)},
+            )
+            for n in (10, 11, 12, 13)
+        ],
+        runner_mode=RunnerMode.CLOUD,
+    )
+
+    # every input is uploaded in a single call
+    m.project.upload_artifacts.assert_called_once()
+    assert len(m.project.upload_artifacts.call_args.args[0]) == 8
+    assert len(batch) == 3
+    assert [h.params["num_records"] for h in batch.errors] == [13]
+    assert m._projects_api.create_record_handler.call_count == 4
+    bodies = sorted(
+        (
+            c.kwargs["body"]
+            for c in m._projects_api.create_record_handler.call_args_list
+        ),
+        key=lambda body: body["params"]["num_records"],
+    )
+    assert bodies[0]["data_source"] == "gretel_0"
+    assert bodies[0]["ref_data"] == {"seed": "gretel_1"}
+    assert bodies[3]["data_source"] == "gretel_6"
+
+
 @pytest.mark.parametrize("num_records", [0, 1, 5, 9, 10, 11, 15, 19, 20, 21, 25, 50])
 def test_goes_through_records(
     m: Model,
@@ -0,0 +1,104 @@
+import threading
+
+from unittest.mock import MagicMock
+
+import pytest
+
+from gretel_client.pagination import paginate
+from gretel_client.projects.projects import search_projects
+
+
+class FakeEndpoint:
+    def __init__(self, num_items: int, ignore_skip: bool = False):
+        self.items = [{"uid": f"i_{i}"} for i in range(num_items)]
+        self.ignore_skip = ignore_skip
+        self.calls = []
+
+    def __call__(self, skip: int, limit: int) -> list:
+        self.calls.append((skip, limit))
+        if self.ignore_skip:
+            skip = 0
+        return self.items[skip : skip + limit]
+
+
+@pytest.mark.parametrize("prefetch", [True, False])
+@pytest.mark.parametrize("num_items", [0, 1, 9, 10, 11, 25])
+def test_paginate_returns_every_item(num_items: int, prefetch: bool):
+    endpoint = FakeEndpoint(num_items)
+
+    items = list(paginate(endpoint, page_size=10, prefetch=prefetch))
+
+    assert items == endpoint.items
+    # iteration ends with the first page that isn't full
+    assert len(endpoint.calls) == num_items // 10 + 1
+
+
+def test_paginate_limit_and_skip():
+    endpoint = FakeEndpoint(100)
+
+    items = list(paginate(endpoint, page_size=10, limit=25, skip=5))
+
+    assert items == endpoint.items[5:30]
+    # the last page only requests what is left of the limit
+    assert endpoint.calls == [(5, 10), (15, 10), (25, 5)]
+
+
+def test_paginate_prefetches_next_page():
+    first_page_consumed = threading.Event()
+    prefetched = threading.Event()
+
+    def fetch_page(skip: int, limit: int) -> list:
+        if skip == 0:
+            return list(range(limit))
+        if skip == limit:
+            # the second page is requested before the first one is consumed
+            assert not first_page_consumed.is_set()
+            prefetched.set()
+        return []
+
+    pages = paginate(fetch_page, page_size=3)
+    assert [next(pages) for _ in range(3)] == [0, 1, 2]
+    assert prefetched.wait(timeout=5)
+    first_page_consumed.set()
+    assert list(pages) == []
+
+
+def test_paginate_stops_on_repeated_page():
+    endpoint = FakeEndpoint(20, ignore_skip=True)
+
+    items = list(paginate(endpoint, page_size=10, key=lambda i: i["uid"]))
+
+    assert items == endpoint.items[:10]
+    assert len(endpoint.calls) == 2
+
+
+def test_paginate_validates_page_size():
+    with pytest.raises(ValueError):
+        list(paginate(FakeEndpoint(1), page_size=0))
+
+
+def test_search_projects_pages_past_first_page():
+    session = MagicMock()
+    projects = [{"name": f"proj-{i}", "guid": f"proj_{i}"} for i in range(250)]
+    api = session.get_api.return_value
+    api.search_projects.side_effect = lambda skip, limit, **_: {
+        "data": {"projects": projects[skip : skip + limit]}
+    }
+
+    result = search_projects(limit=None, page_size=100, session=session)
+
+    assert [p.name for p in result] == [p["name"] for p in projects]
+    assert api.search_projects.call_count == 3
+
+
+def test_search_projects_without_skip_support():
+    session = MagicMock()
+    projects = [{"name": f"proj-{i}", "guid": f"proj_{i}"} for i in range(250)]
+    api = session.get_api.return_value
+    api.search_projects.side_effect = lambda skip, limit, **_: {
+        "data": {"projects": projects[:limit]}
+    }
+
+    # by default all projects up to the limit are requested at once
+    assert len(search_projects(session=session)) == 200
+    assert api.search_projects.call_count == 1
@@ -0,0 +1,139 @@
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from gretel_client.config import DefaultClientConfig
+from gretel_client.polling import (
+    AdaptivePollPolicy,
+    DeadlinePollPolicy,
+    ExponentialPollPolicy,
+    FixedPollPolicy,
+    resolve_poll_policy,
+)
+from gretel_client.projects.models import Model
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+        self.sleeps = []
+
+    def monotonic(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+@pytest.fixture
+def clock() -> FakeClock:
+    return FakeClock()
+
+
+def test_fixed_policy(clock: FakeClock):
+    poller = FixedPollPolicy(3).poller(clock=clock)
+    for _ in range(3):
+        poller.sleep()
+
+    assert clock.sleeps == [3, 3, 3]
+    assert not poller.expired
+
+
+def test_exponential_policy_caps_at_maximum(clock: FakeClock):
+    poller = ExponentialPollPolicy(initial=1, maximum=10, jitter=0).poller(clock=clock)
+    for _ in range(6):
+        poller.record_activity()
+        poller.sleep()
+
+    # activity doesn't reset a plain exponential backoff
+    assert clock.sleeps == [1, 2, 4, 8, 10, 10]
+
+
+def test_exponential_policy_jitter_is_bounded():
+    policy = ExponentialPollPolicy(initial=4, maximum=100, jitter=0.25, seed=42)
+    intervals = [policy.interval(0, 0) for _ in range(100)]
+
+    assert all(3 <= i <= 5 for i in intervals)
+    assert len(set(intervals)) > 1
+
+
+def test_adaptive_policy_resets_on_activity(clock: FakeClock):
+    poller = AdaptivePollPolicy(initial=1, maximum=30, jitter=0).poller(clock=clock)
+    for _ in range(4):
+        poller.sleep()
+    poller.record_activity()
+    poller.sleep()
+    poller.sleep()
+
+    assert clock.sleeps == [1, 2, 4, 8, 1, 2]
+
+
+def test_poller_deadline(clock: FakeClock):
+    poller = FixedPollPolicy(4).poller(timeout=10, clock=clock)
+    while not poller.expired:
+        poller.sleep()
+
+    # the last sleep is cut short so the final poll happens at the deadline
+    assert clock.sleeps == [4, 4, 2]
+    assert poller.elapsed == 10
+
+
+def test_poller_without_deadline_never_expires(clock: FakeClock):
+    poller = FixedPollPolicy(100).poller(timeout=-1, clock=clock)
+    poller.sleep()
+
+    assert poller.remaining is None
+    assert not poller.expired
+
+
+def test_deadline_policy(clock: FakeClock):
+    policy = DeadlinePollPolicy(FixedPollPolicy(5), timeout=12)
+
+    poller = policy.poller(clock=clock)
+    while not poller.expired:
+        poller.sleep()
+    assert clock.sleeps == [5, 5, 2]
+
+    # a shorter timeout from the caller takes precedence
+    assert policy.poller(timeout=3, clock=clock).remaining == 3
+
+
+def test_exponential_policy_validation():
+    with pytest.raises(ValueError):
+        ExponentialPollPolicy(initial=0)
+    with pytest.raises(ValueError):
+        ExponentialPollPolicy(initial=10, maximum=5)
+    with pytest.raises(ValueError):
+        ExponentialPollPolicy(jitter=1)
+
+
+def test_resolve_poll_policy_from_client_config():
+    default = FixedPollPolicy(1)
+    policy = FixedPollPolicy(2)
+    config = DefaultClientConfig(api_key="grtu...", poll_policy=policy)
+
+    assert resolve_poll_policy(config, default) is policy
+    assert resolve_poll_policy(DefaultClientConfig(api_key="grtu..."), default) is (
+        default
+    )
+    assert resolve_poll_policy(MagicMock(), default) is default
+    assert "poll_policy" not in config.as_dict
+
+
+@patch("time.sleep")
+def test_job_uses_session_poll_policy(sleep: MagicMock):
+    project = MagicMock()
+    project.session = DefaultClientConfig(
+        api_key="grtu...", poll_policy=FixedPollPolicy(7)
+    )
+    project.projects_api.get_model.side_effect = [
+        {"data": {"model": {"status": "active"}}},
+        {"data": {"model": {"status": "active"}}},
+        {"data": {"model": {"status": "completed"}}},
+    ]
+    model = Model(project=project, model_id="m_1")
+
+    list(model.poll_logs_status())
+
+    sleep.assert_called_once_with(7)
@@ -14,7 +14,11 @@ from gretel_client.projects.artifact_handlers import (
     HybridArtifactsHandler,
 )
 from gretel_client.projects.models import Model
-from gretel_client.projects.projects import GretelProjectError, Project
+from gretel_client.projects.projects import (
+    GretelProjectError,
+    Project,
+    _artifact_content_key,
+)
 from gretel_client.rest.apis import ProjectsApi
 from gretel_client.rest.exceptions import (
     ApiException,
@@ -128,6 +132,137 @@ def test_get_artifact_handle_gs(
         )
 
 
+def test_search_models_builds_models_from_search_result():
+    session = MagicMock()
+    project = Project(name="proj", project_id="123", session=session)
+    projects_api = project.projects_api
+    search_results = [
+        {"uid": f"m_{i}", "status": "completed", "runner_mode": "cloud"}
+        for i in range(3)
+    ]
+    projects_api.get_models.side_effect = lambda skip, limit, **_: {
+        "data": {"models": search_results[skip : skip + limit]}
+    }
+    projects_api.get_model.return_value = {
+        "data": {
+            "model": {
+                "uid": "m_0",
+                "status": "completed",
+                "runner_mode": "cloud",
+                "config": {"models": [{"synthetics": {}}]},
+            },
+            "logs": [],
+        }
+    }
+
+    models = list(project.search_models(factory=Model))
+
+    assert [m.model_id for m in models] == ["m_0", "m_1", "m_2"]
+    assert [m.status.value for m in models] == ["completed"] * 3
+    assert all(m.is_cloud_model for m in models)
+    projects_api.get_model.assert_not_called()
+
+    # fields missing from the search result are fetched on first access
+    assert models[0].model_type == "synthetics"
+    assert models[0].model_type == "synthetics"
+    projects_api.get_model.assert_called_once()
+    assert projects_api.get_model.call_args.kwargs["model_id"] == "m_0"
+
+
+def test_upload_artifacts_deduplicates_content(tmp_path):
+    pd = pytest.importorskip("pandas")
+    first = tmp_path / "first.csv"
+    second = tmp_path / "second.csv"
+    first.write_text("a,b\n1,2\n")
+    second.write_text("a,b\n1,2\n")
+    df = pd.DataFrame({"a": [1], "b": [3]})
+
+    project = Project(name="proj", project_id="123", session=MagicMock())
+    uploads = []
+
+    def upload_artifact(artifact_path, **_):
+        uploads.append(artifact_path)
+        return f"gretel_{len(uploads)}"
+
+    progress = MagicMock()
+    with patch.object(
+        project, "upload_artifact", side_effect=upload_artifact
+    ), patch.object(project, "_artifact_exists", return_value=True), patch(
+        "gretel_client.projects.projects._uploaded_artifacts", {}
+    ):
+        keys = project.upload_artifacts(
+            [first, str(second), df, df.copy(), "s3://bucket/data.csv"],
+            progress=progress,
+        )
+        assert len(uploads) == 3
+        assert keys[0] == keys[1]
+        assert keys[2] == keys[3]
+        assert len(set(keys)) == 3
+        assert progress.call_count == 3
+
+        # local files and DataFrames uploaded earlier in the session are reused
+        again = project.upload_artifacts([second, df, "s3://bucket/data.csv"])
+        assert again == [keys[1], keys[2], "gretel_4"]
+        assert len(uploads) == 4
+
+
+def test_upload_artifacts_reuse_is_scoped_and_checked(tmp_path):
+    source = tmp_path / "data.csv"
+    source.write_text("a,b\n1,2\n")
+    uploads = []
+
+    def upload_artifact(artifact_path, **_):
+        uploads.append(artifact_path)
+        return f"gretel_{len(uploads)}"
+
+    def project(endpoint: str) -> Project:
+        session = MagicMock(endpoint=endpoint)
+        project = Project(name="proj", project_id="123", session=session)
+        project.upload_artifact = MagicMock(side_effect=upload_artifact)
+        return project
+
+    handler = MagicMock()
+    with patch("gretel_client.projects.projects._uploaded_artifacts", {}):
+        first = project("https://api.gretel.cloud")
+        assert first.upload_artifacts([source], _artifacts_handler=handler) == [
+            "gretel_1"
+        ]
+        # the same project id on another endpoint is another project
+        other = project("https://api.example.com")
+        assert other.upload_artifacts([source], _artifacts_handler=handler) == [
+            "gretel_2"
+        ]
+
+        assert first.upload_artifacts([source], _artifacts_handler=handler) == [
+            "gretel_1"
+        ]
+        handler.get_project_artifact_link.assert_called_once_with("gretel_1")
+
+        # artifacts that expired or were deleted elsewhere are uploaded again
+        handler.get_project_artifact_link.side_effect = NotFoundException()
+        assert first.upload_artifacts([source], _artifacts_handler=handler) == [
+            "gretel_3"
+        ]
+        assert len(uploads) == 3
+
+
+def test_artifact_content_key():
+    pd = pytest.importorskip("pandas")
+    df = pd.DataFrame({"a": [1, 2], "b": ["x", "y"]})
+
+    with patch.object(pd.DataFrame, "to_csv") as to_csv:
+        key = _artifact_content_key(df)
+    to_csv.assert_not_called()
+    assert key == _artifact_content_key(df.copy())
+    assert key != _artifact_content_key(df.rename(columns={"b": "c"}))
+    assert key != _artifact_content_key(df.astype({"a": float}))
+
+    # values that can't be hashed only dedupe the same object
+    lists = pd.DataFrame({"a": [[1], [2]]})
+    assert _artifact_content_key(lists) == _artifact_content_key(lists)
+    assert _artifact_content_key(lists) != _artifact_content_key(lists.copy())
+
+
 @dataclass
 class MockResponse:
     status: int
@@ -0,0 +1,123 @@
+import gzip
+import io
+
+from contextlib import contextmanager
+from unittest.mock import MagicMock
+
+import pandas as pd
+import pyarrow as pa
+import pytest
+
+from gretel_client.projects.common import ModelRunArtifact
+from gretel_client.projects.records import RecordHandler
+from gretel_client.projects.streaming import iter_csv_batches
+
+CSV = b"id,score,name\n1,0.5,a\n2,1.5,b\n3,,c\n4,2.0,d\n5,4,\n"
+
+
+@pytest.mark.parametrize("compress", [True, False])
+def test_iter_csv_batches(compress: bool):
+    data = gzip.compress(CSV) if compress else CSV
+
+    batches = list(iter_csv_batches(io.BytesIO(data), batch_size=2))
+
+    assert [len(batch) for batch in batches] == [2, 2, 1]
+    pd.testing.assert_frame_equal(
+        pd.concat(batches, ignore_index=True), pd.read_csv(io.BytesIO(CSV))
+    )
+
+
+def test_iter_csv_batches_keeps_schema_of_first_batch():
+    batches = list(iter_csv_batches(io.BytesIO(gzip.compress(CSV)), batch_size=2))
+
+    # on its own, the score of the last batch would be inferred as an
+    # integer and its name column, which only holds a missing value, as float
+    for batch in batches:
+        assert batch["score"].dtype == "float64"
+        assert batch["name"].dtype == batches[0]["name"].dtype
+
+
+def test_iter_csv_batches_uses_nullable_types_for_missing_values():
+    csv = b"id,flag\n1,true\n2,false\n3,\n,true\n"
+
+    batches = list(iter_csv_batches(io.BytesIO(csv), batch_size=2))
+    df = pd.concat(batches, ignore_index=True)
+
+    assert batches[0]["id"].dtype == "int64"
+    assert batches[1]["id"].dtype == "Int64"
+    assert batches[1]["flag"].dtype == "boolean"
+    assert df["id"].dtype == "Int64"
+    assert df["id"].isna().tolist() == [False, False, False, True]
+    assert df["flag"].isna().tolist() == [False, False, True, False]
+
+
+@pytest.mark.parametrize(
+    "value,dtype", [(b"1.5", "float64"), (b"abc", "object")], ids=["float", "str"]
+)
+def test_iter_csv_batches_widens_incompatible_columns(value: bytes, dtype: str):
+    csv = b"id\n1\n2\n" + value + b"\n4\n"
+
+    batches = list(iter_csv_batches(io.BytesIO(csv), batch_size=2))
+
+    assert batches[0]["id"].dtype == "int64"
+    assert batches[1]["id"].dtype == dtype
+    assert batches[1]["id"].tolist() == pd.read_csv(io.BytesIO(csv))["id"][2:].tolist()
+    # an explicit type is applied to every batch
+    batches = iter_csv_batches(io.BytesIO(csv), batch_size=2, dtype={"id": str})
+    assert [v for batch in batches for v in batch["id"]][2] == value.decode()
+
+
+@pytest.mark.parametrize("as_arrow", [False, True])
+def test_iter_csv_batches_with_empty_column_in_first_batch(as_arrow: bool):
+    csv = b"id,note\n1,\n2,\n3,hello\n4,\n5,world\n"
+
+    batches = list(iter_csv_batches(io.BytesIO(csv), batch_size=2, as_arrow=as_arrow))
+
+    if as_arrow:
+        table = pa.Table.from_batches(batches[1:])
+        assert table.column("note").to_pylist() == ["hello", None, "world"]
+    else:
+        assert batches[0]["note"].dtype == "float64"
+        assert all(batch["note"].dtype == "object" for batch in batches[1:])
+        df = pd.concat(batches, ignore_index=True)
+        assert df["note"].dropna().tolist() == ["hello", "world"]
+        assert df["note"].isna().sum() == 3
+
+
+def test_iter_csv_batches_as_arrow():
+    batches = list(
+        iter_csv_batches(io.BytesIO(gzip.compress(CSV)), batch_size=2, as_arrow=True)
+    )
+
+    assert all(isinstance(batch, pa.RecordBatch) for batch in batches)
+    assert all(batch.schema == batches[0].schema for batch in batches)
+    assert pa.Table.from_batches(batches).num_rows == 5
+
+
+def test_iter_csv_batches_bad_batch_size():
+    with pytest.raises(ValueError):
+        next(iter_csv_batches(io.BytesIO(CSV), batch_size=0))
+
+
+def test_record_handler_iter_data():
+    handles = []
+
+    @contextmanager
+    def get_artifact_handle(artifact_key: str):
+        assert artifact_key == ModelRunArtifact.DATA.value
+        handle = io.BytesIO(gzip.compress(CSV))
+        handles.append(handle)
+        yield handle
+        handle.close()
+
+    record_handler = RecordHandler(model=MagicMock(), record_id=None)
+    record_handler.get_artifact_handle = get_artifact_handle
+
+    batches = record_handler.iter_data(batch_size=4)
+    assert not handles
+    assert len(next(batches)) == 4
+    assert not handles[0].closed
+    assert len(next(batches)) == 1
+    with pytest.raises(StopIteration):
+        next(batches)
+    assert handles[0].closed
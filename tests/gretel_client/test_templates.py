@@ -0,0 +1,138 @@
+import io
+import os
+
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+import requests
+
+from gretel_client.projects.exceptions import ModelConfigError
+from gretel_client.projects.models import read_model_config
+from gretel_client.projects.templates import (
+    TemplateCache,
+    configure_template_cache,
+    load_template,
+)
+
+URL = "https://blueprints.example/synthetics/default.yml"
+
+
+class FakeFetch:
+    def __init__(self):
+        self.calls = 0
+        self.offline = False
+
+    def __call__(self, url: str) -> str:
+        self.calls += 1
+        if self.offline:
+            raise requests.exceptions.ConnectionError("offline")
+        return "models:\n  - synthetics:\n      params:\n        epochs: 10\n"
+
+
+@pytest.fixture
+def fetch() -> FakeFetch:
+    return FakeFetch()
+
+
+def test_template_cache_fetches_once(tmp_path: Path, fetch: FakeFetch):
+    cache = TemplateCache(tmp_path, fetch=fetch)
+
+    config = cache.get(URL)
+    config["models"][0]["synthetics"]["params"]["epochs"] = 100
+
+    # callers get a copy, so modifying it doesn't affect the cache
+    assert cache.get(URL)["models"][0]["synthetics"]["params"]["epochs"] == 10
+    # a new process reads the template from disk
+    assert TemplateCache(tmp_path, fetch=fetch).get(URL) == cache.get(URL)
+    assert fetch.calls == 1
+
+
+def test_template_cache_expires(tmp_path: Path, fetch: FakeFetch):
+    cache = TemplateCache(tmp_path, ttl=60, fetch=fetch)
+    cache.get(URL)
+    for path in tmp_path.glob("*/*"):
+        os.utime(path, (0, 0))
+
+    TemplateCache(tmp_path, ttl=60, fetch=fetch).get(URL)
+
+    assert fetch.calls == 2
+
+
+def test_template_cache_uses_expired_copy_offline(tmp_path: Path, fetch: FakeFetch):
+    TemplateCache(tmp_path, fetch=fetch).get(URL)
+    fetch.offline = True
+
+    assert TemplateCache(tmp_path, ttl=0, fetch=fetch).get(URL)
+    with pytest.raises(requests.exceptions.ConnectionError):
+        TemplateCache(tmp_path / "empty", ttl=0, fetch=fetch).get(URL)
+
+
+def test_read_model_config_from_local_dir(tmp_path: Path, monkeypatch):
+    (tmp_path / "synthetics").mkdir()
+    (tmp_path / "synthetics" / "default.yml").write_text("models:\n  - actgan: {}\n")
+    configure_template_cache(enabled=False)
+
+    try:
+        assert read_model_config("synthetics/default", base_url=str(tmp_path)) == {
+            "models": [{"actgan": {}}]
+        }
+        monkeypatch.setenv("GRETEL_MODEL_CONFIG_DIR", str(tmp_path))
+        assert read_model_config("synthetics/default")
+        with pytest.raises(ModelConfigError):
+            read_model_config("synthetics/missing")
+    finally:
+        configure_template_cache()
+
+
+@pytest.mark.parametrize("cache_enabled", [True, False])
+@pytest.mark.parametrize(
+    "fetch_result,error",
+    [
+        (requests.exceptions.HTTPError("404 Client Error"), ModelConfigError),
+        ("models: [unterminated", ModelConfigError),
+        (
+            requests.exceptions.ConnectionError("offline"),
+            requests.exceptions.ConnectionError,
+        ),
+    ],
+    ids=["not_found", "invalid", "offline"],
+)
+def test_load_template_errors(
+    tmp_path: Path, cache_enabled: bool, fetch_result, error: type
+):
+    try:
+        with patch("gretel_client.projects.templates._fetch") as fetch:
+            if isinstance(fetch_result, Exception):
+                fetch.side_effect = fetch_result
+            else:
+                fetch.return_value = fetch_result
+            configure_template_cache(enabled=cache_enabled, cache_dir=tmp_path)
+            with pytest.raises(error):
+                load_template(URL)
+            # transport errors aren't reported as a missing config
+            with pytest.raises(error) as excinfo:
+                read_model_config("synthetics/default")
+    finally:
+        configure_template_cache()
+
+    if error is ModelConfigError:
+        assert "Could not find model config" in str(excinfo.value)
+        assert isinstance(excinfo.value.__cause__, ModelConfigError)
+    # templates that can't be parsed aren't cached
+    assert not list(tmp_path.glob("*/*"))
+
+
+def test_read_model_config_does_not_cache_urls(tmp_path: Path):
+    configure_template_cache(cache_dir=tmp_path)
+
+    try:
+        with patch("gretel_client.projects.models.open") as smart_open:
+            smart_open.side_effect = lambda *_: io.BytesIO(b"models: []\n")
+            read_model_config("https://bucket.example/config.yml?signature=abc")
+            read_model_config("https://bucket.example/config.yml?signature=abc")
+    finally:
+        configure_template_cache()
+
+    assert smart_open.call_count == 2
+    assert not list(tmp_path.glob("*/*"))
@@ -7,6 +7,7 @@ import pytest
 
 from dateutil.tz import tzutc
 
+from gretel_client.polling import FixedPollPolicy
 from gretel_client.rest_v1.models import (
     GetLogResponse,
     LogEnvelope,
@@ -97,7 +98,7 @@ def test_task_manager(
     task_manager = TaskManager.for_workflow_run(
         "wr_1", workflows_api, logs_api, log_printer
     )
-    task_manager._poll_frequency_seconds = 0
+    task_manager._poll_policy = FixedPollPolicy(0)
 
     task_worker = MagicMock()
     task_worker.running.return_value = False
@@ -113,7 +114,7 @@ def test_task_manager(
         ]
     )
     for_workflow_task.assert_called_once_with(
-        wt_1, workflows_api, logs_api, log_printer
+        wt_1, workflows_api, logs_api, log_printer, None
     )
     task_worker.start.assert_called_once()
 
@@ -127,7 +128,7 @@ def test_task_manager_wait(
     task_manager = TaskManager.for_workflow_run(
         "wr_1", workflows_api, logs_api, MagicMock()
     )
-    task_manager._poll_frequency_seconds = 1
+    task_manager._poll_policy = FixedPollPolicy(1)
 
     with pytest.raises(WaitTimeExceeded):
         task_manager.start(wait=5)
@@ -190,7 +191,7 @@ def test_log_worker(workflows_api: MagicMock, logs_api: MagicMock):
     ]
 
     worker = LogWorker.for_workflow_task(wt_1, workflows_api, logs_api, logger)
-    worker._poll_frequency_seconds = 0
+    worker._poll_policy = FixedPollPolicy(0)
 
     worker.start()
     worker.wait(timeout=30)
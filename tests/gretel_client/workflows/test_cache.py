@@ -0,0 +1,207 @@
+import io
+import os
+
+from pathlib import Path
+from unittest.mock import MagicMock, Mock
+
+import pandas as pd
+import pytest
+
+from gretel_client.rest_v1.api.workflows_api import WorkflowsApi
+from gretel_client.rest_v1.models import WorkflowRun as WorkflowRunApiResponse
+from gretel_client.test_utils import TestGretelApiFactory, TestGretelResourceProvider
+from gretel_client.workflows.cache import (
+    OutputCache,
+    configure_output_cache,
+    get_output_cache,
+)
+from gretel_client.workflows.status import Status
+from gretel_client.workflows.workflow import WorkflowRun
+
+
+def _write(cache: OutputCache, key: tuple[str, str, str], body: bytes) -> Path:
+    with cache.writer(key) as f:
+        f.write(body)
+    return cache.path_for(key)
+
+
+def test_cache_roundtrip(tmp_path: Path):
+    cache = OutputCache(tmp_path)
+    key = ("wr_1", "step", "")
+
+    assert cache.get(key) is None
+    _write(cache, key, b"hello")
+    assert cache.get(key).read_bytes() == b"hello"
+
+
+def test_cache_failed_write_is_not_visible(tmp_path: Path):
+    cache = OutputCache(tmp_path)
+    key = ("wr_1", "step", "")
+
+    with pytest.raises(RuntimeError):
+        with cache.writer(key) as f:
+            f.write(b"partial")
+            raise RuntimeError()
+
+    assert cache.get(key) is None
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_cache_evicts_least_recently_used(tmp_path: Path):
+    cache = OutputCache(tmp_path, max_bytes=10)
+    first = _write(cache, ("wr_1", "a", ""), b"12345")
+    second = _write(cache, ("wr_1", "b", ""), b"12345")
+    os.utime(first, (1, 1))
+    os.utime(second, (2, 2))
+
+    # reading the first entry makes it the most recently used
+    assert cache.get(("wr_1", "a", ""))
+    _write(cache, ("wr_1", "c", ""), b"12345")
+
+    assert cache.get(("wr_1", "a", "")) is not None
+    assert cache.get(("wr_1", "b", "")) is None
+    assert cache.get(("wr_1", "c", "")) is not None
+
+
+def test_cache_keeps_new_entry_larger_than_limit(tmp_path: Path):
+    cache = OutputCache(tmp_path, max_bytes=2)
+    _write(cache, ("wr_1", "a", ""), b"12345")
+
+    assert cache.get(("wr_1", "a", "")) is not None
+
+
+def test_cache_opt_out(monkeypatch, tmp_path: Path):
+    assert configure_output_cache(enabled=False) is None
+    assert get_output_cache() is None
+
+    cache = configure_output_cache(cache_dir=tmp_path)
+    assert get_output_cache() is cache
+    assert cache.cache_dir == tmp_path
+
+
+@pytest.fixture
+def completed_run(
+    api_provider_mock: TestGretelApiFactory,
+    resource_provider_mock: TestGretelResourceProvider,
+) -> WorkflowRun:
+    response = Mock(spec=WorkflowRunApiResponse)
+    response.id = "wr_123"
+    response.workflow_id = "wf_456"
+    response.status = Status.RUN_STATUS_COMPLETED.value
+    response.config = {
+        "name": "test-workflow",
+        "steps": [{"name": "generate_data", "task": "id_generator", "config": {}}],
+    }
+    return WorkflowRun(response, api_provider_mock, resource_provider_mock)
+
+
+def _mock_response(api_provider_mock: TestGretelApiFactory, body: bytes):
+    response = MagicMock()
+    response.__enter__.return_value = response
+    response.content = body
+    response.iter_content.side_effect = lambda chunk_size: iter([body])
+    api_provider_mock.requests().get.return_value = response
+
+
+def test_completed_run_outputs_are_cached(
+    api_provider_mock: TestGretelApiFactory,
+    completed_run: WorkflowRun,
+    tmp_path: Path,
+):
+    configure_output_cache(cache_dir=tmp_path)
+    buffer = io.BytesIO()
+    pd.DataFrame({"id": [1, 2, 3]}).to_parquet(buffer, index=False)
+    _mock_response(api_provider_mock, buffer.getvalue())
+
+    first = completed_run.dataset
+    second = completed_run.dataset
+
+    assert first.path != second.path
+    assert first.path.parent != tmp_path
+    assert second.to_arrow().num_rows == 3
+    assert api_provider_mock.requests().get.call_count == 1
+
+
+def test_cached_datasets_outlive_eviction(
+    api_provider_mock: TestGretelApiFactory,
+    completed_run: WorkflowRun,
+    tmp_path: Path,
+):
+    cache = configure_output_cache(cache_dir=tmp_path)
+    buffer = io.BytesIO()
+    pd.DataFrame({"id": [1, 2, 3]}).to_parquet(buffer, index=False)
+    _mock_response(api_provider_mock, buffer.getvalue())
+
+    dataset = completed_run.dataset
+    cache.clear()
+
+    assert dataset.df["id"].tolist() == [1, 2, 3]
+    path = dataset.path
+    del dataset
+    assert not path.exists()
+
+
+def test_report_formats_are_cached_separately(
+    api_provider_mock: TestGretelApiFactory,
+    completed_run: WorkflowRun,
+    tmp_path: Path,
+):
+    configure_output_cache(cache_dir=tmp_path)
+    _mock_response(api_provider_mock, b'{"score": 1}')
+    assert completed_run.report.dict == {"score": 1}
+
+    _mock_response(api_provider_mock, b"<html></html>")
+    assert completed_run._download_report("html").read() == b"<html></html>"
+    assert completed_run.report.dict == {"score": 1}
+    assert completed_run._download_report("html").read() == b"<html></html>"
+
+    assert api_provider_mock.requests().get.call_count == 2
+
+
+def test_incomplete_run_outputs_are_not_cached(
+    api_provider_mock: TestGretelApiFactory,
+    completed_run: WorkflowRun,
+    tmp_path: Path,
+):
+    configure_output_cache(cache_dir=tmp_path)
+    completed_run._api_response.status = Status.RUN_STATUS_ACTIVE.value
+    api_provider_mock.get_api(WorkflowsApi).get_workflow_run.return_value = (
+        completed_run._api_response
+    )
+    _mock_response(api_provider_mock, b'{"score": 1}')
+
+    completed_run.report
+    completed_run.report
+
+    assert api_provider_mock.requests().get.call_count == 2
+    assert list(tmp_path.iterdir()) == []
+    # the last known status is used instead of fetching it for every output
+    api_provider_mock.get_api(WorkflowsApi).get_workflow_run.assert_not_called()
+
+
+def test_outputs_are_cached_after_waiting_for_the_run(
+    api_provider_mock: TestGretelApiFactory,
+    completed_run: WorkflowRun,
+    tmp_path: Path,
+):
+    configure_output_cache(cache_dir=tmp_path)
+    completed_response = completed_run._api_response
+    completed_run._api_response = Mock(
+        spec=WorkflowRunApiResponse,
+        id="wr_123",
+        status=Status.RUN_STATUS_ACTIVE.value,
+    )
+    workflows_api = api_provider_mock.get_api(WorkflowsApi)
+    workflows_api.get_workflow_run.return_value = completed_response
+    workflows_api.search_workflow_tasks.return_value = Mock(tasks=[])
+    buffer = io.BytesIO()
+    pd.DataFrame({"id": [1, 2, 3]}).to_parquet(buffer, index=False)
+    _mock_response(api_provider_mock, buffer.getvalue())
+
+    completed_run.wait_until_done(verbose=False)
+    completed_run.dataset
+    second = completed_run.dataset
+
+    assert second.to_arrow().num_rows == 3
+    assert api_provider_mock.requests().get.call_count == 1
+    workflows_api.get_workflow_run.assert_called_once_with(workflow_run_id="wr_123")
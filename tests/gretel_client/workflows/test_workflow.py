@@ -1,12 +1,18 @@
-from unittest.mock import Mock
+import gc
+import io
 
+from pathlib import Path
+from unittest.mock import MagicMock, Mock
+
+import pandas as pd
 import pytest
 
 from gretel_client.rest_v1.api.workflows_api import WorkflowsApi
 from gretel_client.rest_v1.models import WorkflowRun as WorkflowRunApiResponse
 from gretel_client.test_utils import TestGretelApiFactory, TestGretelResourceProvider
+from gretel_client.workflows.io import Dataset, Report
 from gretel_client.workflows.status import Status
-from gretel_client.workflows.workflow import WorkflowRun
+from gretel_client.workflows.workflow import DOWNLOAD_CHUNK_SIZE, WorkflowRun
 
 
 @pytest.fixture
@@ -108,3 +114,147 @@ def _prepare_status_mock(
         WorkflowsApi
     ).get_workflow_run.return_value = workflow_run_response
     return workflow_run
+
+
+@pytest.fixture
+def parquet_bytes() -> bytes:
+    buffer = io.BytesIO()
+    pd.DataFrame({"id": range(25), "name": [f"row-{i}" for i in range(25)]}).to_parquet(
+        buffer, index=False
+    )
+    return buffer.getvalue()
+
+
+def _mock_streaming_response(
+    api_provider_mock: TestGretelApiFactory, body: bytes
+) -> MagicMock:
+    response = MagicMock()
+    response.__enter__.return_value = response
+    response.content = body
+    response.iter_content.side_effect = lambda chunk_size: (
+        body[i : i + chunk_size] for i in range(0, len(body), chunk_size)
+    )
+    api_provider_mock.requests().get.return_value = response
+    return response
+
+
+def _registry_with_dataset_output(resource_provider_mock: TestGretelResourceProvider):
+    resource_provider_mock.workflows.registry.return_value = {
+        "tasks": [
+            {"name": "id_generator", "output": "dataset"},
+            {"name": "evaluate", "output": "evaluate_dataset"},
+        ]
+    }
+
+
+def test_download_step_output_streams_to_disk(
+    api_provider_mock: TestGretelApiFactory,
+    resource_provider_mock: TestGretelResourceProvider,
+    workflow_run_response: WorkflowRunApiResponse,
+    parquet_bytes: bytes,
+    tmp_path: Path,
+):
+    response = _mock_streaming_response(api_provider_mock, parquet_bytes)
+    workflow_run = WorkflowRun(
+        workflow_run_response, api_provider_mock, resource_provider_mock
+    )
+
+    out = workflow_run.download_step_output(
+        "generate_data", tmp_path / "nested" / "out.parquet"
+    )
+
+    assert out.read_bytes() == parquet_bytes
+    response.iter_content.assert_called_once_with(chunk_size=DOWNLOAD_CHUNK_SIZE)
+    api_provider_mock.requests().get.assert_called_once_with(
+        "/v2/workflows/runs/wr_123/generate_data/outputs", params={}, stream=True
+    )
+
+
+def test_iter_step_output_batches(
+    api_provider_mock: TestGretelApiFactory,
+    resource_provider_mock: TestGretelResourceProvider,
+    workflow_run_response: WorkflowRunApiResponse,
+    parquet_bytes: bytes,
+):
+    _mock_streaming_response(api_provider_mock, parquet_bytes)
+    _registry_with_dataset_output(resource_provider_mock)
+    workflow_run = WorkflowRun(
+        workflow_run_response, api_provider_mock, resource_provider_mock
+    )
+
+    batches = list(workflow_run.iter_step_output_batches("generate_data", 10))
+
+    assert [len(batch) for batch in batches] == [10, 10, 5]
+    assert list(pd.concat(batches)["id"]) == list(range(25))
+
+    with pytest.raises(Exception, match="does not produce a dataset"):
+        next(workflow_run.iter_step_output_batches("evaluate_data", 10))
+
+
+def test_dataset_is_file_backed(
+    api_provider_mock: TestGretelApiFactory,
+    resource_provider_mock: TestGretelResourceProvider,
+    workflow_run_response: WorkflowRunApiResponse,
+    parquet_bytes: bytes,
+):
+    _mock_streaming_response(api_provider_mock, parquet_bytes)
+    workflow_run = WorkflowRun(
+        workflow_run_response, api_provider_mock, resource_provider_mock
+    )
+
+    dataset = workflow_run.dataset
+    path = dataset.path
+
+    assert path.exists()
+    assert dataset.to_arrow().num_rows == 25
+    assert list(dataset.df.columns) == ["id", "name"]
+
+    del dataset
+    gc.collect()
+    assert not path.exists()
+
+
+def test_fetch_outputs(
+    api_provider_mock: TestGretelApiFactory,
+    resource_provider_mock: TestGretelResourceProvider,
+    workflow_run_response: WorkflowRunApiResponse,
+    parquet_bytes: bytes,
+    tmp_path: Path,
+):
+    bodies = {
+        "/v2/workflows/runs/wr_123/generate_data/outputs": parquet_bytes,
+        "/v2/workflows/runs/wr_123/evaluate_data/outputs": b'{"score": 90}',
+        "/v2/workflows/runs/wr_123/outputs?type=report_html": b"<html></html>",
+    }
+
+    def get(url, **kwargs):
+        return _mock_streaming_response(api_provider_mock, bodies[url])
+
+    api_provider_mock.requests().get.side_effect = get
+    _registry_with_dataset_output(resource_provider_mock)
+    workflow_run = WorkflowRun(
+        workflow_run_response, api_provider_mock, resource_provider_mock
+    )
+
+    outputs = workflow_run.fetch_outputs(max_workers=2, dest=tmp_path)
+
+    assert list(outputs) == ["generate_data", "evaluate_data"]
+    dataset = outputs["generate_data"].output
+    assert isinstance(dataset, Dataset)
+    assert dataset.path == tmp_path / "generate_data.parquet"
+    assert len(dataset.df) == 25
+
+    report = outputs["evaluate_data"]
+    assert isinstance(report.output, Report)
+    assert report.output.dict == {"score": 90}
+    assert report.path.read_bytes() == b'{"score": 90}'
+    assert report.elapsed >= 0
+    assert (tmp_path / "report.html").read_bytes() == b"<html></html>"
+
+    # the registry is only consulted once for all steps
+    resource_provider_mock.workflows.registry.assert_called_once()
+
+    # the prefetched html is reused rather than downloaded again
+    report.output.download(tmp_path / "copy.html")
+    assert (tmp_path / "copy.html").read_bytes() == b"<html></html>"
+    assert api_provider_mock.requests().get.call_count == 3
@@ -1,5 +1,6 @@
 import datetime
 import json
+import time
 
 from unittest.mock import ANY, MagicMock, Mock, create_autospec, patch
 
@@ -16,6 +17,7 @@ from gretel_client.files.interface import File
 from gretel_client.test_utils import TestGretelApiFactory, TestGretelResourceProvider
 from gretel_client.workflows.builder import (
     WorkflowBuilder,
+    WorkflowInterruption,
     WorkflowSessionManager,
     WorkflowValidationError,
 )
@@ -103,10 +105,8 @@ def test_workflow_task_validation_error(
     mock_response.status = 422
     mock_response.body = '{"message": "Validation error", "details": [{"field_violations": [{"field": "num_records", "error_message": "Field is required"}]}]}'
 
-    api_provider_mock.get_mock(
-        WorkflowsApi
-    ).validate_workflow_task.side_effect = ApiException(
-        status=422, reason="Unprocessable Entity", body=mock_response.body
+    api_provider_mock.get_mock(WorkflowsApi).validate_workflow_task.side_effect = (
+        ApiException(status=422, reason="Unprocessable Entity", body=mock_response.body)
     )
 
     with pytest.raises(WorkflowValidationError) as excinfo:
@@ -185,9 +185,9 @@ def test_does_submit_batch_job(
     mock_response.workflow_id = "w_1"
 
     # Configure the mock API
-    api_provider_mock.get_mock(
-        WorkflowsApi
-    ).exec_workflow_batch.return_value = mock_response
+    api_provider_mock.get_mock(WorkflowsApi).exec_workflow_batch.return_value = (
+        mock_response
+    )
 
     # Add a step to the workflow
     builder.add_step(
@@ -475,3 +475,191 @@ def test_adds_step_with_data_source(
     assert builder.to_workflow().steps[0] == Step(
         name="read-data-source", task="data_source", config={"data_source": "file_1"}
     )
+
+
+def test_add_steps_validates_concurrently(
+    builder: WorkflowBuilder, tasks: Registry, api_provider_mock: TestGretelApiFactory
+):
+    validate = api_provider_mock.get_mock(WorkflowsApi).validate_workflow_task
+    validate.return_value = Mock(valid=True, message="")
+
+    builder.add_steps(
+        [tasks.IdGenerator(num_records=1), tasks.IdGenerator(num_records=2)]
+    )
+
+    assert validate.call_count == 2
+    assert builder.step_names == ["id-generator", "id-generator-1"]
+
+
+def test_add_steps_attributes_violations_to_step(
+    builder: WorkflowBuilder, tasks: Registry, api_provider_mock: TestGretelApiFactory
+):
+    def validate(envelope: TaskEnvelopeForValidation):
+        if envelope.config.get("num_records") == 2:
+            raise ApiException(
+                status=422,
+                body='{"message": "Validation error", "details": [{"field_violations": [{"field": "num_records", "error_message": "Too small"}]}]}',
+            )
+        return Mock(valid=True, message="")
+
+    api_provider_mock.get_mock(WorkflowsApi).validate_workflow_task.side_effect = (
+        validate
+    )
+
+    builder.add_step(tasks.Combiner())
+    with pytest.raises(WorkflowValidationError) as excinfo:
+        builder.add_steps(
+            [
+                tasks.IdGenerator(num_records=1),
+                tasks.IdGenerator(num_records=2),
+                tasks.IdGenerator(num_records=3),
+            ]
+        )
+
+    assert excinfo.value.step_name == "id-generator-1"
+    assert excinfo.value.field_violations[0].field == "num_records"
+    # steps from the invalid one onwards are not added to the workflow
+    assert builder.step_names == ["combiner", "id-generator"]
+
+
+def test_validation_results_are_cached(
+    builder: WorkflowBuilder, tasks: Registry, api_provider_mock: TestGretelApiFactory
+):
+    validate = api_provider_mock.get_mock(WorkflowsApi).validate_workflow_task
+    validate.return_value = Mock(valid=True, message="ok")
+
+    builder.add_step(tasks.IdGenerator(num_records=5))
+    builder.add_step(tasks.IdGenerator(num_records=5))
+    assert validate.call_count == 1
+
+    builder.add_step(tasks.IdGenerator(num_records=6))
+    assert validate.call_count == 2
+
+    assert builder.validate_steps() == ["ok", "ok", "ok"]
+    assert validate.call_count == 2
+
+
+def test_add_steps_rolls_back_on_api_errors(
+    builder: WorkflowBuilder, tasks: Registry, api_provider_mock: TestGretelApiFactory
+):
+    validate = api_provider_mock.get_mock(WorkflowsApi).validate_workflow_task
+    validate.side_effect = ApiException(status=503, reason="Service Unavailable")
+
+    builder.add_step(tasks.Combiner(), validate=False)
+    with pytest.raises(ApiException):
+        builder.add_steps(
+            [tasks.IdGenerator(num_records=1), tasks.IdGenerator(num_records=2)]
+        )
+
+    assert builder.step_names == ["combiner"]
+
+
+def test_validation_cache_is_scoped_to_project(
+    builder: WorkflowBuilder,
+    tasks: Registry,
+    api_provider_mock: TestGretelApiFactory,
+    resource_provider_mock: TestGretelResourceProvider,
+    stub_globals: Globals,
+):
+    validate = api_provider_mock.get_mock(WorkflowsApi).validate_workflow_task
+    validate.return_value = Mock(valid=True, message="ok")
+    other_builder = WorkflowBuilder(
+        "proj_2", stub_globals, api_provider_mock, resource_provider_mock
+    )
+
+    builder.add_step(tasks.IdGenerator(num_records=5))
+    other_builder.add_step(tasks.IdGenerator(num_records=5))
+
+    assert validate.call_count == 2
+
+
+def _mock_preview_stream(api_provider_mock: TestGretelApiFactory, lines) -> Mock:
+    mock_response = Mock()
+    mock_response.status_code = 200
+    mock_response.iter_lines.return_value = lines
+    mock_post_return = MagicMock()
+    mock_post_return.__enter__.return_value = mock_response
+    api_provider_mock.requests().post.return_value = mock_post_return
+    return mock_response
+
+
+def _preview_message(step: str, payload: dict, type: str = "output") -> bytes:
+    return json.dumps(
+        {
+            "step": step,
+            "stream": "step_outputs",
+            "payload": payload,
+            "type": type,
+            "ts": datetime.datetime.now().isoformat(),
+        }
+    ).encode()
+
+
+def test_iter_preview_decodes_in_background(
+    builder: WorkflowBuilder, api_provider_mock: TestGretelApiFactory
+):
+    lines = [
+        _preview_message("step", {"dataset": [{"id": i}]}) for i in range(1000)
+    ] + [b"not json"]
+    _mock_preview_stream(api_provider_mock, iter(lines))
+
+    messages = list(builder.iter_preview())
+
+    assert len(messages) == 1000
+    assert messages[-1].dataset.to_dict("records") == [{"id": 999}]
+    # the dataframe is built once and reused
+    assert messages[-1].dataset is messages[-1].dataset
+
+
+def test_iter_preview_task_error_interrupts(
+    builder: WorkflowBuilder, api_provider_mock: TestGretelApiFactory
+):
+    lines = [
+        _preview_message(
+            "step", {"state": "error", "msg": "boom"}, "step_state_change"
+        ),
+        _preview_message("step", {"dataset": []}),
+    ]
+    _mock_preview_stream(api_provider_mock, iter(lines))
+
+    messages = list(builder.iter_preview())
+
+    assert len(messages) == 1
+    assert isinstance(messages[0], WorkflowInterruption)
+    assert "boom" in messages[0].message
+
+
+def test_iter_preview_reraises_reader_errors(
+    builder: WorkflowBuilder, api_provider_mock: TestGretelApiFactory
+):
+    def lines():
+        yield _preview_message("step", {})
+        raise RuntimeError("reader failed")
+
+    _mock_preview_stream(api_provider_mock, lines())
+
+    preview = builder.iter_preview()
+    assert next(preview).step == "step"
+    with pytest.raises(RuntimeError, match="reader failed"):
+        next(preview)
+
+
+def test_iter_preview_stops_reader_when_closed(
+    builder: WorkflowBuilder, api_provider_mock: TestGretelApiFactory
+):
+    consumed = []
+
+    def lines():
+        for i in range(100_000):
+            consumed.append(i)
+            yield _preview_message("step", {"i": i})
+
+    _mock_preview_stream(api_provider_mock, lines())
+
+    preview = builder.iter_preview()
+    next(preview)
+    preview.close()
+
+    # the reader only ever runs a bounded distance ahead of the consumer
+    time.sleep(0.3)
+    assert len(consumed) < 1000